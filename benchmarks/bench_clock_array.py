@@ -0,0 +1,49 @@
+"""Benchmark clock correction of many MET values, comparing `SwiftClock`
+(one `swiftdatetime` per time) with the columnar `SwiftClockArray`. Requests
+are answered by a local stand-in for the API, so this measures the client.
+
+Usage: python benchmarks/bench_clock_array.py [number of times]
+"""
+
+import sys
+import time
+
+import httpx
+import numpy as np
+
+import swifttools.swift_too.base.common as common
+from swifttools.swift_too.swift.clock import SwiftClock
+from swifttools.swift_too.swift.clockarray import DEFAULT_CHUNK_SIZE, SwiftClockArray
+
+
+def clock_api(request: httpx.Request) -> httpx.Response:
+    """Stand-in for the /swift/clock endpoint, with a constant UTCF."""
+    met = request.url.params.get_list("met")
+    entries = [{"met": float(value), "utcf": -20.5, "isutc": False} for value in met]
+    return httpx.Response(200, json={"entries": entries, "status": {"status": "Accepted"}})
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    met = np.linspace(6e8, 7e8, n)
+    common.session.configure(transport=httpx.MockTransport(clock_api))
+
+    start = time.perf_counter()
+    for i in range(0, n, DEFAULT_CHUNK_SIZE):
+        clock = SwiftClock(met=met[i : i + DEFAULT_CHUNK_SIZE].tolist())
+        clock.to_utctime()
+    objects = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clock_array = SwiftClockArray(met=met)
+    columns = time.perf_counter() - start
+    assert clock_array.status.status == "Accepted"
+
+    print(f"Times:              {n}")
+    print(f"SwiftClock:         {objects * 1000:9.1f} ms")
+    print(f"SwiftClockArray:    {columns * 1000:9.1f} ms")
+    print(f"Speedup:            {objects / columns:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
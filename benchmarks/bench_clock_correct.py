@@ -0,0 +1,90 @@
+"""Benchmark finding and replacing the datetimes in a large AFST result, as
+done by `clock_correct()`, against the previous recursive search of every
+field. The clock correction itself is not included.
+
+Usage: python benchmarks/bench_clock_correct.py [number of entries]
+"""
+
+import sys
+import time
+from datetime import datetime
+from typing import Any
+
+import httpx
+from bench_response_parsing import afst_payload
+
+from swifttools.swift_too.base.schemas import BaseSchema
+from swifttools.swift_too.swift.datetimeplan import DatetimeRefs
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+
+
+def recursive_refs(obj: Any) -> list[tuple[list[Any], datetime]]:
+    """Previous implementation: the path to every datetime, found by
+    recursively searching every field."""
+    refs = []
+
+    def collect(obj: Any, path: list[Any]):
+        if isinstance(obj, datetime):
+            refs.append((path.copy(), obj))
+        elif isinstance(obj, BaseSchema):
+            for name, value in obj.__dict__.items():
+                collect(value, path + [("model", name)])
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                collect(item, path + [("list", i)])
+        elif isinstance(obj, dict):
+            for k, v in obj.items():
+                collect(v, path + [("dict", k)])
+
+    collect(obj, [])
+    return refs
+
+
+def recursive_replace(obj: Any, refs: list[tuple[list[Any], datetime]], values: list[Any]) -> None:
+    """Previous implementation: replay each path to replace its value."""
+    for (path, _), value in zip(refs, values):
+        current = obj
+        for kind, key in path[:-1]:
+            current = getattr(current, key) if kind == "model" else current[key]
+        kind, key = path[-1]
+        if kind == "model":
+            object.__setattr__(current, key, value)
+        else:
+            current[key] = value
+
+
+def best_time(fn, repeat: int = 5) -> float:
+    """Best time taken to call `fn` (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    response = httpx.Response(200, json=afst_payload(n), request=httpx.Request("GET", "https://example.com"))
+    afst = SwiftAFST(begin=datetime(2024, 1, 1), length=30, autosubmit=False)
+    assert afst._handle_response(response)
+
+    def recursive():
+        refs = recursive_refs(afst)
+        recursive_replace(afst, refs, [dt for _, dt in refs])
+
+    def planned():
+        refs = DatetimeRefs(afst)
+        refs.assign(refs.values)
+
+    assert len(recursive_refs(afst)) == len(DatetimeRefs(afst))
+    old = best_time(recursive)
+    new = best_time(planned)
+    print(f"AFST entries:        {n}")
+    print(f"Datetimes:           {len(DatetimeRefs(afst))}")
+    print(f"Recursive search:    {old * 1000:9.1f} ms")
+    print(f"Field plan:          {new * 1000:9.1f} ms ({old / new:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
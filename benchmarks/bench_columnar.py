@@ -0,0 +1,60 @@
+"""Benchmark fetching a year-long AFST as entry models and exporting it to
+pandas, against fetching it as columns only.
+
+Usage: python benchmarks/bench_columnar.py [number of entries]
+"""
+
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import httpx
+from bench_response_parsing import afst_payload
+
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+
+
+def measure(fn) -> tuple[float, float]:
+    """Time taken (seconds) and memory retained (bytes) by the result of
+    `fn`."""
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = fn()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 17520
+    response = httpx.Response(200, json=afst_payload(n), request=httpx.Request("GET", "https://example.com"))
+    response.json()
+
+    def models():
+        afst = SwiftAFST(begin=datetime(2024, 1, 1), length=365, autosubmit=False)
+        assert afst._handle_response(response)
+        return afst, afst.to_pandas()
+
+    def columnar():
+        afst = SwiftAFST(begin=datetime(2024, 1, 1), length=365, autosubmit=False)
+        object.__setattr__(afst, "_columnar_only", True)
+        assert afst._handle_response(response)
+        return afst, afst.to_pandas()
+
+    model_time, model_memory = measure(models)
+    column_time, column_memory = measure(columnar)
+    print(f"AFST entries:        {n}")
+    print(f"Entry models:        {model_time * 1000:9.1f} ms {model_memory / 1e6:9.1f} MB")
+    print(
+        f"Columns only:        {column_time * 1000:9.1f} ms {column_memory / 1e6:9.1f} MB "
+        f"({model_time / column_time:.0f}x faster, {model_memory / column_memory:.0f}x less memory)"
+    )
+
+
+if __name__ == "__main__":
+    main()
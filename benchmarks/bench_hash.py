@@ -0,0 +1,48 @@
+"""Benchmark hashing of an AFST query holding a large response, as happens
+when query objects are used as set members or dict keys.
+
+Usage: python benchmarks/bench_hash.py [number of entries]
+"""
+
+import sys
+import time
+from datetime import datetime
+
+import httpx
+from bench_response_parsing import afst_payload
+
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+
+
+def best_time(fn, repeat: int = 5) -> float:
+    """Best time taken to call `fn` (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    response = httpx.Response(200, json=afst_payload(n), request=httpx.Request("GET", "https://example.com"))
+    afst = SwiftAFST(begin=datetime(2024, 1, 1), length=30, autosubmit=False)
+    assert afst._handle_response(response)
+
+    def first_hash():
+        afst._invalidate_fingerprint()
+        hash(afst)
+
+    hash(afst)
+    first = best_time(first_hash)
+    cached = best_time(lambda: hash(afst))
+    request_only = best_time(lambda: afst.fingerprint(request_only=True))
+    print(f"AFST entries:        {n}")
+    print(f"First hash:          {first * 1000:9.3f} ms")
+    print(f"Cached hash:         {cached * 1000:9.3f} ms")
+    print(f"Request-only hash:   {request_only * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark the time taken to import `swift_too`, and to import a single
+class from it, in a fresh interpreter.
+
+Usage: python benchmarks/bench_import_time.py [budget in seconds]
+
+Exits with a non-zero status if importing `swift_too` takes longer than the
+budget (default 0.2 seconds).
+"""
+
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import swifttools.swift_too",
+    "from swifttools.swift_too import Clock",
+    "from swifttools.swift_too import Data",
+    "from swifttools.swift_too import ObsQuery",
+]
+
+
+def import_time(statement: str, repeat: int = 5) -> float:
+    """Best time (seconds) to run `statement` in a fresh interpreter."""
+    code = f"import time; t = time.perf_counter(); {statement}; print(time.perf_counter() - t)"
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        times.append(float(result.stdout))
+    return min(times)
+
+
+def main() -> int:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else 0.2
+    results = {statement: import_time(statement) for statement in STATEMENTS}
+    for statement, seconds in results.items():
+        print(f"{statement:45s} {seconds * 1000:8.1f} ms")
+    if results[STATEMENTS[0]] > budget:
+        print(f"Import time exceeds budget of {budget * 1000:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Benchmark subtracting SAA passages from visibility windows and summing the
+usable exposure, using `IntervalSet` against a Python loop over windows.
+
+Usage: python benchmarks/bench_intervals.py [windows] [passages]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from swifttools.swift_too.base.intervals import IntervalSet
+
+
+def random_windows(rng: np.random.Generator, n: int, mean_gap: float, mean_length: float) -> list[tuple]:
+    """Sorted, disjoint windows with exponentially distributed gaps and
+    lengths (seconds)."""
+    gaps = rng.exponential(mean_gap, n)
+    lengths = rng.exponential(mean_length, n)
+    begins = np.cumsum(gaps + np.concatenate([[0], lengths[:-1]]))
+    start = datetime(2024, 1, 1)
+    return [(start + timedelta(seconds=b), start + timedelta(seconds=b + e)) for b, e in zip(begins, lengths)]
+
+
+def loop_exposure(windows: list[tuple], passages: list[tuple]) -> timedelta:
+    """Usable exposure with a loop over windows and passages, stepping
+    through both lists in time order."""
+    total = timedelta(0)
+    j = 0
+    for begin, end in windows:
+        while j < len(passages) and passages[j][1] <= begin:
+            j += 1
+        cursor = begin
+        k = j
+        while k < len(passages) and passages[k][0] < end:
+            if passages[k][0] > cursor:
+                total += passages[k][0] - cursor
+            cursor = max(cursor, passages[k][1])
+            k += 1
+        if end > cursor:
+            total += end - cursor
+    return total
+
+
+def main() -> None:
+    n_windows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    n_passages = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    rng = np.random.default_rng(42)
+    windows = random_windows(rng, n_windows, 1800, 2400)
+    span = (windows[-1][1] - windows[0][0]).total_seconds()
+    passages = random_windows(rng, n_passages, span / n_passages, 900)
+
+    start = time.perf_counter()
+    expected = loop_exposure(windows, passages)
+    loop_time = time.perf_counter() - start
+
+    vis = IntervalSet.from_windows(windows)
+    saa = IntervalSet.from_windows(passages)
+    start = time.perf_counter()
+    exposure = (vis - saa).duration
+    set_time = time.perf_counter() - start
+    assert abs((exposure - expected).total_seconds()) < 1e-3
+
+    print(f"Windows:             {n_windows}")
+    print(f"SAA passages:        {n_passages}")
+    print(f"Usable exposure:     {exposure}")
+    print(f"IntervalSet:         {set_time * 1000:9.1f} ms")
+    print(f"Python loop:         {loop_time * 1000:9.1f} ms ({loop_time / set_time:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
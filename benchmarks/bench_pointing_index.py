@@ -0,0 +1,57 @@
+"""Benchmark cone searches of many catalogue positions against a year of
+AFST pointings, using `PointingIndex` against comparing every position with
+every pointing.
+
+Usage: python benchmarks/bench_pointing_index.py [positions] [pointings]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from swifttools.swift_too.swift.pointingindex import DEFAULT_RADIUS, PointingIndex, _unit_vectors
+
+
+def random_sky(rng: np.random.Generator, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Positions distributed uniformly on the sky."""
+    return rng.uniform(0, 360, n), np.degrees(np.arcsin(rng.uniform(-1, 1, n)))
+
+
+def main() -> None:
+    positions = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    pointings = int(sys.argv[2]) if len(sys.argv) > 2 else 17520
+    rng = np.random.default_rng(42)
+    ra, dec = random_sky(rng, pointings)
+    query_ra, query_dec = random_sky(rng, positions)
+
+    start = time.perf_counter()
+    index = PointingIndex({"ra": ra, "dec": dec})
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = index.query(query_ra, query_dec)
+    index_time = time.perf_counter() - start
+
+    # Compare every position with every pointing, a chunk of positions at a
+    # time
+    start = time.perf_counter()
+    vectors = _unit_vectors(ra, dec)
+    query_vectors = _unit_vectors(query_ra, query_dec)
+    brute = []
+    for i in range(0, positions, 1000):
+        close = query_vectors[i : i + 1000] @ vectors.T >= np.cos(np.radians(DEFAULT_RADIUS))
+        brute.extend(np.flatnonzero(row) for row in close)
+    brute_time = time.perf_counter() - start
+    assert all(np.array_equal(a, b) for a, b in zip(matches, brute))
+
+    print(f"Positions:           {positions}")
+    print(f"Pointings:           {pointings}")
+    print(f"Matches:             {sum(len(m) for m in matches)}")
+    print(f"Build index:         {build_time * 1000:9.1f} ms")
+    print(f"Indexed search:      {index_time * 1000:9.1f} ms")
+    print(f"All pairs:           {brute_time * 1000:9.1f} ms ({brute_time / index_time:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark parsing of a large AFST response, with and without trusting the
+API server's response.
+
+Usage: python benchmarks/bench_response_parsing.py [number of entries]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+import swifttools.swift_too.base.common as common
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+
+
+def afst_payload(n: int) -> dict:
+    """Synthetic AFST response with `n` entries, similar to a month of data."""
+    start = datetime(2024, 1, 1)
+    entries = []
+    for i in range(n):
+        begin = start + timedelta(minutes=30 * i)
+        entries.append(
+            {
+                "begin": begin.isoformat(),
+                "settle": (begin + timedelta(minutes=2)).isoformat(),
+                "end": (begin + timedelta(minutes=25)).isoformat(),
+                "obstype": "AT",
+                "target_name": f"Target {i % 50}",
+                "roll": 123.4,
+                "target_id": 10000 + i % 50,
+                "segment": 1,
+                "obs_id": f"{10000 + i % 50:08d}001",
+                "bat_mode": 1,
+                "xrt_mode": 7,
+                "uvot_mode": 12345,
+                "fom": 50,
+                "ra": float(i % 360),
+                "dec": float(i % 180) - 90,
+                "ra_object": float(i % 360),
+                "dec_object": float(i % 180) - 90,
+            }
+        )
+    return {
+        "begin": start.isoformat(),
+        "end": (start + timedelta(minutes=30 * n)).isoformat(),
+        "afstmax": "2025-01-01T00:00:00",
+        "entries": entries,
+        "status": {"status": "Accepted"},
+    }
+
+
+def parse(response: httpx.Response, trusted: bool, repeat: int = 3) -> float:
+    """Best time taken to parse `response` into a SwiftAFST (seconds)."""
+    common.trust_responses = trusted
+    best = float("inf")
+    for _ in range(repeat):
+        afst = SwiftAFST(begin=datetime(2024, 1, 1), length=30, autosubmit=False)
+        start = time.perf_counter()
+        assert afst._handle_response(response)
+        best = min(best, time.perf_counter() - start)
+    common.trust_responses = True
+    return best
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    response = httpx.Response(200, json=afst_payload(n), request=httpx.Request("GET", "https://example.com"))
+    untrusted = parse(response, trusted=False)
+    trusted = parse(response, trusted=True)
+    print(f"AFST entries:      {n}")
+    print(f"Full validation:   {untrusted * 1000:9.1f} ms")
+    print(f"Trusted response:  {trusted * 1000:9.1f} ms")
+    print(f"Speedup:           {untrusted / trusted:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark the memory used by clock corrected times, as held by results
+such as a month of AFST entries.
+
+Usage: python benchmarks/bench_time_memory.py [number of times]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from swifttools.swift_too.swift.datetime import swiftdatetime
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    met = [6.0e8 + 60.0 * i for i in range(n)]
+
+    start = time.perf_counter()
+    values = [swiftdatetime.frommet(m, utcf=-20.5, isutc=True) for m in met]
+    created = time.perf_counter() - start
+    start = time.perf_counter()
+    for value in values:
+        value.swifttime
+        value.utctime
+    accessed = time.perf_counter() - start
+    del values
+
+    tracemalloc.start()
+    values = [swiftdatetime.frommet(m, utcf=-20.5, isutc=True) for m in met]
+    # Accessing both time bases used to store two more datetimes per value
+    for value in values:
+        value.swifttime
+        value.utctime
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Times:               {n}")
+    print(f"Memory:              {current / 1e6:9.1f} MB ({current / n:.0f} bytes per time)")
+    print(f"Create:              {created * 1000:9.1f} ms")
+    print(f"Access both bases:   {accessed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
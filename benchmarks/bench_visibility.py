@@ -0,0 +1,52 @@
+"""Benchmark low resolution visibility windows of many targets over a year
+with `VisibilityEngine`, calculated for all targets at once, against
+calculating them one target at a time.
+
+Usage: python benchmarks/bench_visibility.py [targets] [days]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from swifttools.swift_too.swift.visengine import VisibilityEngine
+
+
+def main() -> None:
+    targets = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    days = float(sys.argv[2]) if len(sys.argv) > 2 else 365.0
+    rng = np.random.default_rng(42)
+    ra = rng.uniform(0, 360, targets)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, targets)))
+    begin = datetime(2024, 1, 1)
+    end = begin + timedelta(days=days)
+    engine = VisibilityEngine()
+
+    # Calculate the Sun and Moon positions once, so that they are not timed
+    start = time.perf_counter()
+    engine.intervals(ra[:1], dec[:1], begin, end)
+    ephemeris_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    target, _, _ = engine.intervals(ra, dec, begin, end)
+    batch_time = time.perf_counter() - start
+
+    # A target at a time, as with a query per target
+    single = min(targets, 200)
+    start = time.perf_counter()
+    for i in range(single):
+        engine.intervals(ra[i], dec[i], begin, end)
+    single_time = (time.perf_counter() - start) * targets / single
+
+    print(f"Targets:             {targets}")
+    print(f"Days:                {days:g}")
+    print(f"Windows:             {len(target)}")
+    print(f"Sun/Moon ephemeris:  {ephemeris_time * 1000:9.1f} ms")
+    print(f"All targets at once: {batch_time * 1000:9.1f} ms")
+    print(f"A target at a time:  {single_time * 1000:9.1f} ms ({single_time / batch_time:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
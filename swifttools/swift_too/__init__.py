@@ -51,14 +51,11 @@ typically.
 
 5. QueryJob
 
-In addition results of jobs can be fetched using the QueryJob module. This can
-be used to fetch results of already processed jobs, or query the current status
-of a job. Typically a job will have 4 status values, `Queued`, `Processing`,
-`Accepted` or `Rejected`. `Accepted` in this case means that processing has
-completed. `Queued` means that the job has been accepted, but not yet processed.
-`Processing` means that the server is working on the results, but has not yet
-completed. `Rejected` means that the server rejected the job for any number of
-reasons, that are reported by in `Swift_TOOStatus` class.
+Calling `queue()` on any query object submits it in the background, using a
+shared pool of worker threads, and returns a `QueryJob` handle. The handle can
+be used to wait for the result (`result(timeout)`), check if the request has
+finished (`done()`), cancel it, or register callbacks to run on completion. The
+query object itself is updated with the results, exactly as for `submit()`.
 
 6. SwiftUVOTMode
 
@@ -118,7 +115,8 @@ other classes when you pass the `name` parameter instead of giving an `ra`,
 For a given `utctime`, `mettime` or `swifttime` return a `swiftdatetime` object
 or objects, with clock correction applied. Primarily used internally as part of
 the `clock_correct` method, which applies clock correction to all times in a
-given class.
+given class. `clock_correct_many` clock corrects many such objects together,
+with one request for all of their times.
 
 13. Swift_SAA
 
@@ -144,33 +142,110 @@ served basis. Typically processing requests takes a 10-20 seconds. Status of
 requests can be queried, and errors are reported back.
 """
 
-from .query_job import QueryJob
-from .swift.calendar import Calendar, Swift_Calendar
-from .swift.clock import Clock, Swift_Clock, SwiftClock
-from .swift.data import Data, Swift_Data, SwiftData
-from .swift.guano import GUANO, Swift_GUANO, SwiftGUANO
-from .swift.obsquery import ObsQuery, Swift_ObsQuery, SwiftAFST
-from .swift.planquery import PlanQuery, Swift_PlanQuery, Swift_PPST
-from .swift.requests import Swift_TOO_Requests, Swift_TOORequests, TOORequests
-from .swift.resolve import Resolve, Swift_Resolve, SwiftResolve
-from .swift.saa import SAA, Swift_SAA
-from .swift.toorequest import TOO, Swift_TOO, Swift_TOO_Request, SwiftTOO, TOORequest
-from .swift.uvot import Swift_UVOTMode, SwiftUVOTMode, UVOTMode
-from .swift.visquery import Swift_VisQuery, VisQuery
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .version import version as __version__
 
-# Legacy alias retained for import compatibility.
-UVOT_Mode = UVOTMode
+# Submodules are imported on first use of one of their classes, so that
+# importing `swift_too` is fast, and using e.g. `Clock` does not import the
+# dependencies of every other class (such as boto3 for `Data`).
+_LAZY_IMPORTS = {
+    "BatchResult": ".base.batch",
+    "RequestBatch": ".base.batch",
+    "gather": ".base.batch",
+    "IntervalSet": ".base.intervals",
+    "QueryJob": ".base.jobs",
+    "Calendar": ".swift.calendar",
+    "Swift_Calendar": ".swift.calendar",
+    "Clock": ".swift.clock",
+    "Swift_Clock": ".swift.clock",
+    "SwiftClock": ".swift.clock",
+    "clock_correct_many": ".swift.clock",
+    "ClockArray": ".swift.clockarray",
+    "SwiftClockArray": ".swift.clockarray",
+    "Data": ".swift.data",
+    "Swift_Data": ".swift.data",
+    "SwiftData": ".swift.data",
+    "GUANO": ".swift.guano",
+    "Swift_GUANO": ".swift.guano",
+    "SwiftGUANO": ".swift.guano",
+    "ObsQuery": ".swift.obsquery",
+    "Swift_ObsQuery": ".swift.obsquery",
+    "SwiftAFST": ".swift.obsquery",
+    "PlanQuery": ".swift.planquery",
+    "Swift_PlanQuery": ".swift.planquery",
+    "Swift_PPST": ".swift.planquery",
+    "Swift_TOO_Requests": ".swift.requests",
+    "Swift_TOORequests": ".swift.requests",
+    "TOORequests": ".swift.requests",
+    "Resolve": ".swift.resolve",
+    "Swift_Resolve": ".swift.resolve",
+    "SwiftResolve": ".swift.resolve",
+    "SAA": ".swift.saa",
+    "Swift_SAA": ".swift.saa",
+    "TOO": ".swift.toorequest",
+    "Swift_TOO": ".swift.toorequest",
+    "Swift_TOO_Request": ".swift.toorequest",
+    "SwiftTOO": ".swift.toorequest",
+    "TOORequest": ".swift.toorequest",
+    "Swift_UVOTMode": ".swift.uvot",
+    "SwiftUVOTMode": ".swift.uvot",
+    "UVOTMode": ".swift.uvot",
+    "Swift_VisQuery": ".swift.visquery",
+    "VisQuery": ".swift.visquery",
+}
+
+# Legacy aliases retained for import compatibility.
+_ALIASES = {"UVOT_Mode": "UVOTMode"}
+
+if TYPE_CHECKING:
+    from .base.batch import BatchResult, RequestBatch, gather
+    from .base.intervals import IntervalSet
+    from .base.jobs import QueryJob
+    from .swift.calendar import Calendar, Swift_Calendar
+    from .swift.clock import Clock, Swift_Clock, SwiftClock, clock_correct_many
+    from .swift.clockarray import ClockArray, SwiftClockArray
+    from .swift.data import Data, Swift_Data, SwiftData
+    from .swift.guano import GUANO, Swift_GUANO, SwiftGUANO
+    from .swift.obsquery import ObsQuery, Swift_ObsQuery, SwiftAFST
+    from .swift.planquery import PlanQuery, Swift_PlanQuery, Swift_PPST
+    from .swift.requests import Swift_TOO_Requests, Swift_TOORequests, TOORequests
+    from .swift.resolve import Resolve, Swift_Resolve, SwiftResolve
+    from .swift.saa import SAA, Swift_SAA
+    from .swift.toorequest import TOO, Swift_TOO, Swift_TOO_Request, SwiftTOO, TOORequest
+    from .swift.uvot import Swift_UVOTMode, SwiftUVOTMode, UVOTMode
+    from .swift.visquery import Swift_VisQuery, VisQuery
+
+    UVOT_Mode = UVOTMode
+
+
+def __getattr__(name: str) -> Any:
+    target = _ALIASES.get(name, name)
+    if target in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[target], __name__), target)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "__version__",
+    "BatchResult",
     "Calendar",
     "Clock",
+    "ClockArray",
     "Data",
     "GUANO",
+    "IntervalSet",
     "ObsQuery",
     "PlanQuery",
     "QueryJob",
+    "RequestBatch",
     "Resolve",
     "SAA",
     "Swift_Calendar",
@@ -190,6 +265,7 @@ __all__ = [
     "Swift_VisQuery",
     "SwiftAFST",
     "SwiftClock",
+    "SwiftClockArray",
     "SwiftData",
     "SwiftGUANO",
     "SwiftResolve",
@@ -201,4 +277,6 @@ __all__ = [
     "UVOT_Mode",
     "UVOTMode",
     "VisQuery",
+    "clock_correct_many",
+    "gather",
 ]
@@ -0,0 +1,219 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+from .common import session
+from .constants import STATUS_PENDING
+from .repr import TOOAPIReprMixin
+from .schemas import BaseSchema
+
+# Default number of requests in flight at once
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class BatchResult(BaseSchema, TOOAPIReprMixin):
+    """Outcome of a single request submitted as part of a batch.
+
+    Attributes
+    ----------
+    request : TOOAPIBaseclass
+        The API object that was submitted. It is updated in place with the
+        results of the request.
+    success : bool
+        Was the submission successful?
+    elapsed : float
+        Wall clock time taken by the request (seconds).
+    error : str
+        Error message if the request raised an exception, or the first
+        status error reported for the request.
+    """
+
+    request: Any
+    success: bool = False
+    elapsed: float = 0.0
+    error: str | None = None
+
+    def __bool__(self) -> bool:
+        return self.success
+
+    @property
+    def _table(self) -> tuple[list[str], list[list[Any]]]:
+        header = ["Request", "Success", "Elapsed (s)", "Error"]
+        return header, [[type(self.request).__name__, self.success, f"{self.elapsed:.3f}", self.error]]
+
+
+async def _submit(request: Any) -> bool:
+    """Asynchronous equivalent of `TOOAPIBaseclass.submit`, routing the
+    request to `get()` or `post()` depending on which schema it defines."""
+    if request.status.status != STATUS_PENDING:
+        return False
+    if hasattr(request, "_get_schema"):
+        if request.validate_get():
+            return await request.get()
+        return False
+    elif hasattr(request, "_post_schema"):
+        if request.validate_post():
+            return await request.post()
+        return False
+    return False
+
+
+async def _run_one(request: Any) -> BatchResult:
+    """Submit a single request, isolating any exception it raises."""
+    start = time.perf_counter()
+    try:
+        success = await _submit(request)
+        error = None
+        if not success:
+            status = getattr(request, "status", None)
+            errors = getattr(status, "errors", None)
+            error = errors[0] if errors else None
+    except Exception as e:
+        success = False
+        error = f"{type(e).__name__}: {e}"
+    return BatchResult(request=request, success=bool(success), elapsed=time.perf_counter() - start, error=error)
+
+
+async def gather(requests: list[Any], max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> list[BatchResult]:
+    """Submit many API objects concurrently, with at most `max_concurrency`
+    requests in flight at once.
+
+    Requests are handed to a fixed number of workers, so that only
+    `max_concurrency` coroutines are ever active regardless of how many
+    requests are given. A failure in one request does not affect the others.
+
+    Parameters
+    ----------
+    requests : list
+        Un-submitted API objects, e.g. `VisQuery(..., autosubmit=False)`.
+    max_concurrency : int
+        Maximum number of requests in flight at once.
+
+    Returns
+    -------
+    list[BatchResult]
+        One result per request, in the same order as `requests`.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    results: list[BatchResult | None] = [None] * len(requests)
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(requests):
+        queue.put_nowait(item)
+
+    async def worker() -> None:
+        while True:
+            try:
+                index, request = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results[index] = await _run_one(request)
+
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(requests)))))
+    return results  # type: ignore[return-value]
+
+
+class RequestBatch(TOOAPIReprMixin):
+    """Container for submitting a list of API objects concurrently. Can be
+    used either from synchronous code, with `submit()`, or from asynchronous
+    code with `await batch.run()`.
+
+    Attributes
+    ----------
+    requests : list
+        API objects to submit.
+    max_concurrency : int
+        Maximum number of requests in flight at once.
+    results : list
+        List of `BatchResult`, one per request, once submitted.
+    """
+
+    def __init__(self, requests: list[Any], max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.requests = list(requests)
+        self.max_concurrency = max_concurrency
+        self.results: list[BatchResult] = []
+
+    async def run(self) -> bool:
+        """Asynchronously submit all requests.
+
+        Returns
+        -------
+        bool
+            Were all submissions successful?
+        """
+        self.results = await gather(self.requests, max_concurrency=self.max_concurrency)
+        return all(self.results)
+
+    async def _run_in_new_loop(self) -> bool:
+        """Run the batch, then close the pooled client for this short-lived
+        event loop."""
+        try:
+            return await self.run()
+        finally:
+            await session.aclose()
+
+    def submit(self) -> bool:
+        """Submit all requests, blocking until they have all completed. If
+        called from within a running event loop (e.g. a Jupyter notebook),
+        the batch is run in a separate thread.
+
+        Returns
+        -------
+        bool
+            Were all submissions successful?
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._run_in_new_loop())
+
+        outcome: dict[str, Any] = {}
+
+        def runner() -> None:
+            try:
+                outcome["value"] = asyncio.run(self._run_in_new_loop())
+            except BaseException as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=runner, daemon=True)
+        thread.start()
+        thread.join()
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["value"]
+
+    @property
+    def successful(self) -> list[Any]:
+        """Requests that were submitted successfully."""
+        return [result.request for result in self.results if result.success]
+
+    @property
+    def failed(self) -> list[Any]:
+        """Requests that failed."""
+        return [result.request for result in self.results if not result.success]
+
+    @property
+    def elapsed(self) -> float:
+        """Total time spent in requests (seconds), summed over the batch."""
+        return sum(result.elapsed for result in self.results)
+
+    def __getitem__(self, index: int) -> BatchResult:
+        return self.results[index]
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    @property
+    def _table(self) -> tuple[list[str], list[list[Any]]]:
+        if len(self.results) == 0:
+            return [], []
+        header = self.results[0]._table[0]
+        return ["#"] + header, [[i] + result._table[1][0] for i, result in enumerate(self.results)]
+
+    def __repr__(self) -> str:
+        return f"RequestBatch(requests={len(self.requests)}, max_concurrency={self.max_concurrency})"
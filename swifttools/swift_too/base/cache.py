@@ -0,0 +1,162 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from .constants import RESPONSE_CACHE_PATH
+
+# Default maximum size of the cache on disk (bytes)
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class ResponseCache:
+    """Persistent, size-bounded cache of API GET responses, stored in SQLite.
+
+    Responses are keyed on the request URL plus the normalized GET arguments,
+    so identical queries made in later runs are answered from disk without a
+    network request. The cache is disabled by default, and is enabled with
+    `enable()`.
+
+    How long a response may be cached is decided per endpoint. By default,
+    each API class decides (see `TOOAPIBaseclass._cache_ttl`), so only
+    endpoints whose results do not change are cached. This can be overridden
+    for any endpoint using `ttl`, e.g. `cache.ttl["/swift/saa"] = 3600`. A
+    TTL of None means never expire, and 0 means never cache.
+
+    When the cache exceeds `max_size` bytes, the least recently used
+    responses are evicted.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the SQLite database.
+    max_size : int
+        Maximum total size of cached responses (bytes).
+    ttl : dict, optional
+        Per-endpoint TTL overrides (seconds), keyed by endpoint, e.g.
+        "/resolve".
+    enabled : bool
+        Is the cache enabled?
+    """
+
+    def __init__(
+        self,
+        path: str | Path = RESPONSE_CACHE_PATH,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: dict[str, float | None] | None = None,
+        enabled: bool = False,
+    ):
+        self.path = Path(path)
+        self.max_size = max_size
+        self.ttl: dict[str, float | None] = dict(ttl) if ttl is not None else {}
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def enable(self, path: str | Path | None = None, max_size: int | None = None) -> None:
+        """Enable the cache, optionally changing its location or size."""
+        if path is not None:
+            self.path = Path(path)
+            self._initialized = False
+        if max_size is not None:
+            self.max_size = max_size
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the cache. Cached responses are kept on disk."""
+        self.enabled = False
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any], username: str = "anonymous") -> str:
+        """Build a cache key from the request URL and GET arguments."""
+        normalized = json.dumps(
+            {"url": url, "params": params, "username": username}, sort_keys=True, default=str, separators=(",", ":")
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT, body BLOB, size INTEGER, "
+                "created REAL, expires REAL, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached response body for `key`, or None if it is not
+        cached or has expired."""
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT body, expires FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                if row is not None:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._hits += 1
+            return row[0]
+
+    def set(self, key: str, endpoint: str, body: bytes, ttl: float | None = None) -> None:
+        """Store a response body, valid for `ttl` seconds (forever if None)."""
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), now, expires, now),
+            )
+            self._stores += 1
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Remove least recently used responses until under `max_size`."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+        evict = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            evict.append((key,))
+            total -= size
+            if total <= self.max_size:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+        self._evictions += len(evict)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Remove cached responses for `endpoint`, or all responses if None."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            if endpoint is None:
+                conn.execute("DELETE FROM responses")
+            else:
+                conn.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,))
+
+    clear = invalidate
+
+    def __len__(self) -> int:
+        with self._lock, closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache hit, miss, store and eviction counts for this process."""
+        return {"hits": self._hits, "misses": self._misses, "stores": self._stores, "evictions": self._evictions}
+
+    def reset_stats(self) -> None:
+        """Reset cache statistics."""
+        self._hits = self._misses = self._stores = self._evictions = 0
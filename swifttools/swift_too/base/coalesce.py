@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class _Call:
+    """A request in flight in a synchronous thread."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Single-flight layer that merges identical requests made at the same
+    time.
+
+    When several threads (or tasks in the same event loop) make the same
+    request concurrently, only the first one sends it. The others wait for
+    that request to complete and are given the same response. Requests are
+    only merged while in flight, nothing is stored once they complete.
+
+    Parameters
+    ----------
+    enabled : bool
+        Merge identical concurrent requests?
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._futures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._requests = 0
+        self._shared = 0
+
+    def do(self, key: str | None, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """Call `fn()`, unless a call with the same `key` is already in
+        flight, in which case wait for that call and share its result.
+
+        Parameters
+        ----------
+        key : str
+            Identifies identical requests. If None, `fn` is always called.
+        fn : callable
+            Function that performs the request.
+
+        Returns
+        -------
+        tuple
+            The result of the call, and whether it was shared from another
+            caller.
+        """
+        if not self.enabled or key is None:
+            return fn(), False
+
+        with self._lock:
+            in_flight = self._calls.get(key)
+            shared = in_flight is not None
+            if in_flight is not None:
+                call = in_flight
+                self._shared += 1
+            else:
+                call = self._calls[key] = _Call()
+                self._requests += 1
+
+        if shared:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
+
+    async def do_async(self, key: str | None, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Asynchronous equivalent of `do`, merging identical requests made
+        by tasks running in the same event loop."""
+        if not self.enabled or key is None:
+            return await fn(), False
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            futures = self._futures.setdefault(loop, {})
+            future = futures.get(key)
+            shared = future is not None
+            if shared:
+                self._shared += 1
+            else:
+                future = futures[key] = loop.create_future()
+                self._requests += 1
+
+        if shared:
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                # The request we were waiting on was cancelled, not us
+                if future.cancelled():
+                    return await self.do_async(key, fn)
+                raise
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, in case nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                futures.pop(key, None)
+        return result, False
+
+    def __len__(self) -> int:
+        """Number of distinct requests currently in flight."""
+        with self._lock:
+            return len(self._calls) + sum(len(futures) for futures in self._futures.values())
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Number of requests sent, and number of requests that shared the
+        response of another request."""
+        with self._lock:
+            return {"requests": self._requests, "shared": self._shared}
+
+    def reset_stats(self) -> None:
+        """Reset request statistics."""
+        with self._lock:
+            self._requests = 0
+            self._shared = 0
@@ -0,0 +1,224 @@
+import types
+import warnings
+from datetime import datetime, timezone
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+# Kinds of column, derived from the type annotations of the entry schema
+_DATETIME = "datetime"
+_FLOAT = "float"
+_INT = "int"
+_BOOL = "bool"
+_OBJECT = "object"
+
+# Request settings inherited by some entry schemas, which are not columns
+_REQUEST_FIELDS = ("username", "shared_secret", "autosubmit")
+
+# Cache of column specifications by entry schema
+_specs: dict[type, list[tuple[str, str, str, TypeAdapter | None]]] = {}
+
+
+def _column_kind(annotation: Any) -> tuple[str | None, bool]:
+    """Kind of column for a field annotation, and whether values need
+    validating (e.g. an `Annotated` string with a converter). Returns None for
+    fields that are not simple values, such as a `SkyCoord`."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        kind, _ = _column_kind(get_args(annotation)[0])
+        return kind, kind == _OBJECT
+    if origin is Union or origin is types.UnionType:
+        kinds = {_column_kind(arg) for arg in get_args(annotation) if arg is not type(None)}
+        kinds.discard((None, False))
+        if kinds <= {(_INT, False), (_FLOAT, False)} and kinds:
+            return (_FLOAT, False) if (_FLOAT, False) in kinds else (_INT, False)
+        return kinds.pop() if len(kinds) == 1 else (None, False)
+    if not isinstance(annotation, type):
+        return None, False
+    if issubclass(annotation, datetime):
+        return _DATETIME, False
+    if issubclass(annotation, bool):
+        return _BOOL, False
+    if issubclass(annotation, int):
+        return _INT, False
+    if issubclass(annotation, float):
+        return _FLOAT, False
+    if issubclass(annotation, str):
+        return _OBJECT, False
+    return None, False
+
+
+def _column_spec(schema: type) -> list[tuple[str, str, str, TypeAdapter | None]]:
+    """Name, key in the API response, kind and (optional) validator of each
+    column for an entry schema. Computed once per schema."""
+    spec = _specs.get(schema)
+    if spec is None:
+        spec = []
+        for name, field in schema.model_fields.items():  # type: ignore[attr-defined]
+            if name in _REQUEST_FIELDS:
+                continue
+            kind, validate = _column_kind(field.annotation)
+            if kind is not None:
+                adapter = TypeAdapter(field.annotation) if validate else None
+                spec.append((name, field.alias or name, kind, adapter))
+        _specs[schema] = spec
+    return spec
+
+
+def _parse_datetime(value: Any) -> Any:
+    """Naive UTC datetime for an ISO format string or datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _datetime_column(values: list[Any]) -> Any:
+    import numpy as np
+
+    values = ["NaT" if value is None else value for value in values]
+    try:
+        with warnings.catch_warnings():
+            # Raise on times with a timezone, which are parsed below
+            warnings.simplefilter("error")
+            return np.array(values, dtype="datetime64[us]")
+    except (ValueError, TypeError, DeprecationWarning, UserWarning):
+        return np.array(["NaT" if v == "NaT" else _parse_datetime(v) for v in values], dtype="datetime64[us]")
+
+
+def build_columns(schema: type, rows: list[dict[str, Any]], from_models: bool = False) -> dict[str, Any]:
+    """Build NumPy columns from entries of an API response.
+
+    Parameters
+    ----------
+    schema : type
+        Pydantic schema of each entry, from whose field types the columns and
+        their dtypes are derived.
+    rows : list
+        Raw JSON entries, or the `__dict__` of validated entries.
+    from_models : bool
+        Are the rows from validated entries? These are keyed by field name,
+        and their values are not validated again.
+
+    Returns
+    -------
+    dict
+        NumPy array for each column. Times are `datetime64[us]` (NaT if
+        missing), floats are NaN if missing, and integer columns with missing
+        values are returned as floats.
+    """
+    import numpy as np
+
+    columns = {}
+    for name, key, kind, adapter in _column_spec(schema):
+        values = [row.get(name if from_models else key) for row in rows]
+        if kind == _DATETIME:
+            columns[name] = _datetime_column(values)
+        elif kind == _OBJECT:
+            if adapter is not None and not from_models:
+                # Values such as observation IDs repeat, so validate each once
+                validated: dict[Any, Any] = {None: None}
+                for value in values:
+                    if value not in validated:
+                        validated[value] = adapter.validate_python(value)
+                values = [validated[value] for value in values]
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            columns[name] = column
+        elif kind == _FLOAT or any(value is None for value in values):
+            columns[name] = np.array([np.nan if value is None else value for value in values], dtype=float)
+        elif kind == _INT:
+            columns[name] = np.array(values, dtype=np.int64)
+        else:
+            columns[name] = np.array(values, dtype=bool)
+    return columns
+
+
+class TOOAPIColumnar:
+    """Mixin for results with a list of `entries`, adding export of the
+    entries as columns (`to_numpy_structured`, `to_pandas` and `to_arrow`).
+
+    `submit_columnar()` (or `get_columnar()`) fetches results as columns
+    only, built directly from the API response without creating a model for
+    each entry, which is much faster and uses much less memory for large
+    results. `entries` is then left empty."""
+
+    @classmethod
+    def _entry_schema(cls) -> type:
+        """Schema of each entry, from the annotation of `entries`."""
+        return get_args(cls.model_fields["entries"].annotation)[0]  # type: ignore[attr-defined]
+
+    def _normalize_response_payload(self, payload: Any) -> Any:  # type: ignore[override]
+        payload = super()._normalize_response_payload(payload)  # type: ignore[misc]
+        if not isinstance(payload, dict) or not isinstance(payload.get("entries"), list):
+            return payload
+        if getattr(self, "_columnar_only", False):
+            object.__setattr__(self, "_column_data", build_columns(self._entry_schema(), payload["entries"]))
+            return {**payload, "entries": []}
+        object.__setattr__(self, "_column_data", None)
+        return payload
+
+    def submit_columnar(self, refresh: bool = False) -> bool:
+        """Perform an API GET request, keeping the results as columns only.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
+        object.__setattr__(self, "_columnar_only", True)
+        try:
+            return self.submit_get(refresh)  # type: ignore[attr-defined]
+        finally:
+            object.__setattr__(self, "_columnar_only", False)
+
+    async def get_columnar(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request, keeping the results as
+        columns only.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
+        object.__setattr__(self, "_columnar_only", True)
+        try:
+            return await self.get(refresh)  # type: ignore[attr-defined]
+        finally:
+            object.__setattr__(self, "_columnar_only", False)
+
+    @property
+    def columns(self) -> dict[str, Any]:
+        """Entries as a dict of NumPy arrays, one per field."""
+        column_data = getattr(self, "_column_data", None)
+        if column_data is not None:
+            return column_data
+        entries = self.entries  # type: ignore[attr-defined]
+        return build_columns(self._entry_schema(), [entry.__dict__ for entry in entries], from_models=True)
+
+    def to_numpy_structured(self) -> Any:
+        """Entries as a NumPy structured array, with a field per column."""
+        import numpy as np
+
+        columns = self.columns
+        dtype = [(name, column.dtype) for name, column in columns.items()]
+        length = len(next(iter(columns.values()))) if columns else 0
+        array = np.empty(length, dtype=dtype)
+        for name, column in columns.items():
+            array[name] = column
+        return array
+
+    def to_pandas(self) -> Any:
+        """Entries as a pandas `DataFrame`."""
+        import pandas as pd  # type: ignore[import-untyped]
+
+        return pd.DataFrame(self.columns)
+
+    def to_arrow(self) -> Any:
+        """Entries as a pyarrow `Table`. Requires pyarrow."""
+        try:
+            import pyarrow as pa  # type: ignore[import-not-found]
+        except ImportError:
+            raise ImportError("Arrow export requires the `pyarrow` package: pip install pyarrow")
+        return pa.table({name: pa.array(column, from_pandas=True) for name, column in self.columns.items()})
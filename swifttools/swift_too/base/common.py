@@ -1,6 +1,9 @@
+import asyncio
+import atexit
+import hashlib
 import http.cookiejar
 import json
-import threading
+import sqlite3
 import time
 import warnings
 from http import HTTPStatus
@@ -15,7 +18,13 @@ from ..base.constants import (
     SESSION_COOKIE_NAME,
     STATUS_PENDING,
 )
+from .cache import ResponseCache
+from .coalesce import RequestCoalescer
+from .jobs import QueryJob, scheduler
 from .repr import TOOAPIReprMixin
+from .retry import UNAVAILABLE_STATUSES, CircuitBreaker, RetryPolicy
+from .schemas import trusted_response
+from .session import TOOAPISession
 
 # Always show deprecation warnings
 warnings.simplefilter("always", DeprecationWarning)
@@ -124,6 +133,41 @@ try:
 except FileNotFoundError:
     pass
 
+# Process-wide pool of keep-alive connections shared by all API requests
+session = TOOAPISession(cookies=cookie_jar)
+atexit.register(session.close)
+
+# Opt-in persistent cache of GET responses, enabled with `response_cache.enable()`
+response_cache = ResponseCache()
+
+# Identical GET requests made concurrently share a single round trip
+inflight = RequestCoalescer()
+
+# Retries of failed requests, and fail-fast while the API is down
+retry_policy = RetryPolicy()
+circuit_breaker = CircuitBreaker()
+
+# Responses from the API server are trusted to be well formed, so expensive
+# derived values (e.g. a SkyCoord for every entry) are created on first use
+trust_responses = True
+
+# Hash API objects on their request-defining (GET/POST schema) fields only,
+# rather than their full state including results. Can be overridden per class
+# with `_hash_request_only`.
+hash_request_only = False
+
+
+def _invalidating_setattr(setattr_):
+    """Wrap a `__setattr__` so that assigning an attribute discards the cached
+    fingerprint of the object."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr_(self, name, value)
+        self._invalidate_fingerprint()
+
+    __setattr__._invalidates_fingerprint = True  # type: ignore[attr-defined]
+    return __setattr__
+
 
 class TOOAPIBaseclass(TOOAPIReprMixin):
     """Mixin for TOO API Classes. Most of these are to do with reading and
@@ -136,6 +180,12 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
     _timeout: int = 120  # 2 mins
     # API base URL
     _api_base: str = API_URL
+    # How long (seconds) GET responses may be kept in the response cache.
+    # None means they never expire, unset or 0 means they are never cached.
+    _cache_ttl: float | None
+    # Hash only the request-defining fields, rather than the full state. If
+    # unset, the module level `hash_request_only` setting is used.
+    _hash_request_only: bool
     # By default all API dates are in Swift Time
     _isutc: bool
     autosubmit: bool = True
@@ -156,20 +206,56 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
     }
 
     def __init_subclass__(cls, **kwargs):
-        """Ensure API subclasses are hashable even with different MRO order."""
+        """Ensure API subclasses are hashable even with different MRO order,
+        and that attribute assignment invalidates the cached hash."""
         super().__init_subclass__(**kwargs)
         if getattr(cls, "__hash__", None) is None:
             cls.__hash__ = TOOAPIBaseclass.__hash__
+        if not getattr(cls.__setattr__, "_invalidates_fingerprint", False):
+            cls.__setattr__ = _invalidating_setattr(cls.__setattr__)  # type: ignore[method-assign]
 
     def __hash__(self) -> int:
         """Compute a deterministic hash from class type + serialized state.
 
         API classes are mutable, so this is intentionally an "unsafe" hash:
         callers should avoid mutating objects while they are used as set/dict
-        keys.
+        keys. The hash is computed from a cached fingerprint, see
+        `fingerprint`.
         """
+        request_only = getattr(self, "_hash_request_only", hash_request_only)
+        return hash((self.__class__, self.fingerprint(request_only)))
+
+    def fingerprint(self, request_only: bool = False) -> str:
+        """Digest of the state of this object.
+
+        The fingerprint is computed once and cached until an attribute is
+        assigned or a response is received, so repeated hashing of objects
+        with large results is cheap. Changes made in place to mutable values
+        (e.g. appending to a list of entries) are not detected.
+
+        Parameters
+        ----------
+        request_only : bool
+            Only include the fields that define the request (those in the
+            GET or POST schema), not results returned by the API.
+
+        Returns
+        -------
+        str
+            Hex digest of the serialized state.
+        """
+        # The cache is tagged with the id of its owner, so that a copy of this
+        # object does not reuse it
+        cached = self.__dict__.get("_fingerprints", (None, {}))
+        fingerprints = cached[1] if cached[0] == id(self) else {}
+        if request_only in fingerprints:
+            return fingerprints[request_only]
+
         payload: Any
-        if hasattr(self, "model_dump"):
+        schema = self._get_schema_for_init() if request_only else None
+        if schema is not None and hasattr(schema, "model_fields"):
+            payload = self._schema_payload(schema)
+        elif hasattr(self, "model_dump"):
             try:
                 payload = self.model_dump(mode="json", by_alias=True, exclude_none=False)  # type: ignore[attr-defined]
             except Exception:
@@ -183,8 +269,17 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
             serialized = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
         except Exception:
             serialized = repr(payload)
+        digest = hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+        # Only Pydantic models are cached, as changes to dict based classes
+        # are made through item assignment
+        if hasattr(self, "model_dump"):
+            object.__setattr__(self, "_fingerprints", (id(self), {**fingerprints, request_only: digest}))
+        return digest
 
-        return hash((self.__class__, serialized))
+    def _invalidate_fingerprint(self) -> None:
+        """Discard the cached fingerprint after the object has changed."""
+        self.__dict__.pop("_fingerprints", None)
 
     def __init__(self, *args, **kwargs):
         # Handle backward compatibility and positional arguments
@@ -249,6 +344,7 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
         return schema_attr
 
     def __set_error(self, newerror):
+        self._invalidate_fingerprint()
         if hasattr(self, "status"):
             if isinstance(self.status, str):
                 self.error(newerror)
@@ -348,19 +444,21 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
                 return False
         return False
 
-    def queue(self):
+    def queue(self) -> QueryJob | bool:
         """
         Queue the API request to the server asynchronously. This method returns
-        immediately after starting the request in a background thread. Once the
-        response arrives, the object is updated with the results and the `complete`
-        property is set to True.
+        immediately after handing the request to a shared pool of worker
+        threads. Once the response arrives, the object is updated with the
+        results and the `complete` property is set to True.
 
         Returns
         -------
-        bool
-            True if the request was queued successfully, False otherwise.
+        QueryJob | bool
+            A `QueryJob` handle for the queued request, which can be used to
+            wait for the result, cancel the request or add completion
+            callbacks, or False if the request could not be queued.
         """
-        if self.status.status == STATUS_PENDING:
+        if self.status.status == STATUS_PENDING:  # type: ignore[attr-defined]
             if hasattr(self, "_get_schema"):
                 if self.validate_get():
                     return self._start_async_submission(self._submit_get_async)
@@ -371,20 +469,19 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
                 return False
         return False
 
-    def _start_async_submission(self, target: Any) -> bool:
-        """Start async submit task plus timeout watchdog."""
-        threading.Thread(target=target, daemon=True).start()
-        threading.Thread(target=self._queue_watchdog, daemon=True).start()
-        return True
+    def _start_async_submission(self, target: Any) -> QueryJob:
+        """Hand the submission to the shared scheduler, with a timeout."""
+        object.__setattr__(self, "complete", False)
+        wait_seconds = max(int(self._timeout) + 5, 30)
+        return scheduler.submit(self, target, timeout=wait_seconds, on_timeout=self._queue_timeout)
 
-    def _queue_watchdog(self) -> None:
+    def _queue_timeout(self, wait_seconds: float) -> None:
         """Ensure queued async requests cannot block forever.
 
-        If a background request does not set `complete` within a bounded
-        interval, mark it complete and store a timeout error.
+        Called by the scheduler if a background request does not complete
+        within a bounded interval. Marks it complete and stores a timeout
+        error.
         """
-        wait_seconds = max(int(self._timeout) + 5, 30)
-        time.sleep(wait_seconds)
         if not getattr(self, "complete", False):
             self.__set_error(f"Asynchronous request timed out after {wait_seconds} seconds")
             object.__setattr__(self, "complete", True)
@@ -413,7 +510,11 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
 
         # Perform login
         try:
-            resp = client.post(f"{API_URL}/login", json={"username": self.username, "password": self.shared_secret})
+            resp = client.post(
+                f"{API_URL}/login",
+                json={"username": self.username, "password": self.shared_secret},
+                extensions=session.extensions,
+            )
             if resp.status_code == HTTPStatus.OK:
                 cookie_jar.save(ignore_discard=True)
                 return True
@@ -449,7 +550,9 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
         # Perform login
         try:
             resp = await client.post(
-                f"{API_URL}/login", json={"username": self.username, "password": self.shared_secret}
+                f"{API_URL}/login",
+                json={"username": self.username, "password": self.shared_secret},
+                extensions=session.async_extensions,
             )
             if resp.status_code == HTTPStatus.OK:
                 cookie_jar.save(ignore_discard=True)
@@ -489,29 +592,51 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
     ) -> httpx.Response | None:
-        """Execute a GET/POST request with shared auth and error handling."""
-        with httpx.Client(cookies=cookie_jar) as client:
-            if not self._ensure_authenticated(client):
-                return None
+        """Execute a GET/POST request with shared auth and error handling.
+
+        Requests are made through the process-wide connection pool
+        (`session`), so connections are kept alive between calls. Failed
+        requests are retried according to `retry_policy`, and refused while
+        `circuit_breaker` reports the API as unavailable.
+        """
+        client = session.client
+        if not self._ensure_authenticated(client):
+            return None
 
+        host = httpx.URL(self.submit_url).host
+        self._reset_retries()
+        attempt = 0
+        while True:
+            if not self._circuit_allows(host):
+                return None
             try:
                 if method == "GET":
-                    return client.get(
+                    response = client.get(
                         self.submit_url,
                         params=params,
                         timeout=self._timeout,
                         follow_redirects=True,
+                        extensions=session.extensions,
+                    )
+                else:
+                    response = client.post(
+                        self.submit_url,
+                        data=data,
+                        timeout=self._timeout,
+                        follow_redirects=True,
+                        extensions=session.extensions,
                     )
-
-                return client.post(
-                    self.submit_url,
-                    data=data,
-                    timeout=self._timeout,
-                    follow_redirects=True,
-                )
             except Exception as e:
-                self.__set_error(f"Request failed: {e}")
-                return None
+                delay = self._retry_delay(method, host, attempt, error=e)
+                if delay is None:
+                    self.__set_error(f"Request failed: {e}")
+                    return None
+            else:
+                delay = self._retry_delay(method, host, attempt, response=response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            attempt += 1
 
     async def _perform_request_async(
         self,
@@ -520,45 +645,226 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
     ) -> httpx.Response | None:
-        """Execute an async GET/POST request with shared auth and error handling."""
-        async with httpx.AsyncClient(cookies=cookie_jar) as client:
-            if not await self._ensure_authenticated_async(client):
-                return None
+        """Execute an async GET/POST request with shared auth and error handling.
+
+        Requests are made through the asynchronous client of the process-wide
+        connection pool (`session`) for the running event loop, and are
+        retried in the same way as `_perform_request`.
+        """
+        client = session.async_client
+        if not await self._ensure_authenticated_async(client):
+            return None
 
+        host = httpx.URL(self.submit_url).host
+        self._reset_retries()
+        attempt = 0
+        while True:
+            if not self._circuit_allows(host):
+                return None
             try:
                 if method == "GET":
-                    return await client.get(
+                    response = await client.get(
                         self.submit_url,
                         params=params,
                         timeout=self._timeout,
                         follow_redirects=True,
+                        extensions=session.async_extensions,
+                    )
+                else:
+                    response = await client.post(
+                        self.submit_url,
+                        data=data,
+                        timeout=self._timeout,
+                        follow_redirects=True,
+                        extensions=session.async_extensions,
                     )
-
-                return await client.post(
-                    self.submit_url,
-                    data=data,
-                    timeout=self._timeout,
-                    follow_redirects=True,
-                )
             except Exception as e:
-                self.__set_error(f"Request failed: {e}")
-                return None
+                delay = self._retry_delay(method, host, attempt, error=e)
+                if delay is None:
+                    self.__set_error(f"Request failed: {e}")
+                    return None
+            else:
+                delay = self._retry_delay(method, host, attempt, response=response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @property
+    def retries(self) -> int:
+        """Number of times the last request was retried."""
+        return getattr(self, "_retries", 0)
+
+    @property
+    def backoff_time(self) -> float:
+        """Total time spent waiting between retries of the last request
+        (seconds)."""
+        return getattr(self, "_backoff_time", 0.0)
+
+    def _reset_retries(self) -> None:
+        object.__setattr__(self, "_retries", 0)
+        object.__setattr__(self, "_backoff_time", 0.0)
+
+    def _retry_safe(self, method: str) -> bool:
+        """Can this request be retried without side effects? GET requests
+        always can. POST requests only if they are `validate_only`, or the
+        class is marked with `_idempotent_post = True`."""
+        if method == "GET":
+            return True
+        return bool(getattr(self, "validate_only", False) or getattr(self, "_idempotent_post", False))
+
+    def _circuit_allows(self, host: str) -> bool:
+        """Fail fast if the circuit breaker for `host` is open."""
+        if circuit_breaker.allow(host):
+            return True
+        self.__set_error(
+            f"Request failed: {host} is unavailable after repeated failures, "
+            f"retrying in {circuit_breaker.reset_timeout:.0f} seconds."
+        )
+        return False
+
+    def _retry_delay(
+        self,
+        method: str,
+        host: str,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Record the outcome of a request attempt, and return how long to
+        wait before retrying it, or None if it should not be retried."""
+        if error is not None or response is None or response.status_code in UNAVAILABLE_STATUSES:
+            circuit_breaker.record_failure(host)
+        else:
+            circuit_breaker.record_success(host)
+
+        if not self._retry_safe(method):
+            return None
+        delay = retry_policy.delay(attempt, response=response, error=error)
+        if delay is not None:
+            object.__setattr__(self, "_retries", self.retries + 1)
+            object.__setattr__(self, "_backoff_time", self.backoff_time + delay)
+        return delay
+
+    def _request_key(self, args: dict[str, Any]) -> str:
+        """Key identifying identical GET requests."""
+        return ResponseCache.key(self.submit_url, args, self.username)
+
+    def _shared_errors(self, response: httpx.Response | None, errors: list[str], shared: bool) -> None:
+        """Copy the errors of a failed request whose response was shared."""
+        if shared and response is None:
+            for error in errors:
+                self.__set_error(error)
+
+    def _coalesced_get(self, args: dict[str, Any]) -> httpx.Response | None:
+        """Perform a GET request, sharing the response with any identical
+        requests in flight at the same time."""
+
+        def fetch() -> tuple[httpx.Response | None, list[str]]:
+            response = self._perform_request("GET", params=args)
+            return response, list(self.status.errors) if response is None else []  # type: ignore[attr-defined]
+
+        (response, errors), shared = inflight.do(self._request_key(args), fetch)
+        self._shared_errors(response, errors, shared)
+        return response
+
+    async def _coalesced_get_async(self, args: dict[str, Any]) -> httpx.Response | None:
+        """Asynchronous equivalent of `_coalesced_get`."""
+
+        async def fetch() -> tuple[httpx.Response | None, list[str]]:
+            response = await self._perform_request_async("GET", params=args)
+            return response, list(self.status.errors) if response is None else []  # type: ignore[attr-defined]
+
+        (response, errors), shared = await inflight.do_async(self._request_key(args), fetch)
+        self._shared_errors(response, errors, shared)
+        return response
+
+    def _response_cache_ttl(self) -> float | None:
+        """How long the response just received may be cached (seconds).
+        Subclasses can override this to decide based on the response."""
+        return getattr(self, "_cache_ttl", 0)
+
+    def _cache_key(self, args: dict[str, Any]) -> str | None:
+        """Response cache key for a GET request, or None if the response for
+        this request should not be cached."""
+        if not response_cache.enabled:
+            return None
+        if response_cache.ttl.get(self._endpoint, getattr(self, "_cache_ttl", 0)) == 0:
+            return None
+        return self._request_key(args)
+
+    def _cached_response(self, key: str | None, refresh: bool = False) -> httpx.Response | None:
+        """Fetch a response from the response cache, if present."""
+        if key is None or refresh:
+            return None
+        try:
+            body = response_cache.get(key)
+        except sqlite3.Error:
+            return None
+        if body is None:
+            return None
+        return httpx.Response(HTTPStatus.OK, content=body, request=httpx.Request("GET", self.submit_url))
+
+    def _cache_response(self, key: str | None, response: httpx.Response) -> None:
+        """Store a successful response in the response cache."""
+        if key is None or response.status_code != HTTPStatus.OK:
+            return
+        if self._endpoint in response_cache.ttl:
+            ttl = response_cache.ttl[self._endpoint]
+        else:
+            ttl = self._response_cache_ttl()
+        if ttl == 0:
+            return
+        try:
+            response_cache.set(key, self._endpoint, response.content, ttl)
+        except sqlite3.Error:
+            pass
 
-    def submit_get(self) -> bool:
-        """Perform an API GET request to the server."""
+    def submit_get(self, refresh: bool = False) -> bool:
+        """Perform an API GET request to the server.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
         args = self._build_get_args()
-        response = self._perform_request("GET", params=args)
+        key = self._cache_key(args)
+        response = self._cached_response(key, refresh)
+        if response is not None:
+            return self._handle_response(response)
+
+        response = self._coalesced_get(args)
         if response is None:
             return False
-        return self._handle_response(response)
+        result = self._handle_response(response)
+        if result:
+            self._cache_response(key, response)
+        return result
+
+    async def get(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request to the server.
 
-    async def get(self) -> bool:
-        """Perform an asynchronous API GET request to the server."""
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
         args = self._build_get_args()
-        response = await self._perform_request_async("GET", params=args)
+        key = self._cache_key(args)
+        # The response cache is SQLite, so read and write it in a worker
+        # thread rather than blocking the event loop
+        response = await asyncio.to_thread(self._cached_response, key, refresh) if key is not None else None
+        if response is not None:
+            return self._handle_response(response)
+
+        response = await self._coalesced_get_async(args)
         if response is None:
             return False
-        return self._handle_response(response)
+        result = self._handle_response(response)
+        if result and key is not None:
+            await asyncio.to_thread(self._cache_response, key, response)
+        return result
 
     def submit_post(self) -> bool:
         """Perform an API POST request to the server."""
@@ -584,39 +890,53 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
 
         return self._handle_response(response)
 
-    def _submit_get_async(self) -> None:
-        """Perform an asynchronous API GET request to the server."""
+    def _submit_get_async(self) -> bool:
+        """Perform an API GET request to the server, for a queued request."""
         args = self._build_get_args()
-        response = self._perform_request("GET", params=args)
+        key = self._cache_key(args)
+        response = self._cached_response(key)
+        if response is not None:
+            return self._handle_response_async(response)
+
+        response = self._coalesced_get(args)
         if response is None:
             object.__setattr__(self, "complete", True)
-            return
-        self._handle_response_async(response)
+            return False
+        result = self._handle_response_async(response)
+        if result:
+            self._cache_response(key, response)
+        return result
 
-    def _submit_post_async(self) -> None:
-        """Perform an asynchronous API POST request to the server."""
+    def _submit_post_async(self) -> bool:
+        """Perform an API POST request to the server, for a queued request."""
         args = self._build_post_args()
         if args is None:
             object.__setattr__(self, "complete", True)
-            return
+            return False
 
         response = self._perform_request("POST", data=args)
         if response is None:
             object.__setattr__(self, "complete", True)
-            return
+            return False
 
-        self._handle_response_async(response)
+        return self._handle_response_async(response)
 
-    def _handle_response_async(self, response: httpx.Response):
-        """Handle API response asynchronously and update object state.
+    def _handle_response_async(self, response: httpx.Response) -> bool:
+        """Handle API response for a queued request and mark it complete.
 
         Parameters
         ----------
         response : httpx.Response
             The HTTP response to process.
+
+        Returns
+        -------
+        bool
+            True if response was handled successfully, False otherwise.
         """
-        self._handle_response(response)
+        result = self._handle_response(response)
         object.__setattr__(self, "complete", True)
+        return result
 
     @staticmethod
     def _normalize_response_payload(payload: Any) -> Any:
@@ -700,7 +1020,11 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
         ):
             try:
                 payload = self._normalize_response_payload(response.json())
-                data = self.model_validate(payload)  # type: ignore[attr-defined]
+                if trust_responses:
+                    with trusted_response():
+                        data = self.model_validate(payload)  # type: ignore[attr-defined]
+                else:
+                    data = self.model_validate(payload)  # type: ignore[attr-defined]
                 # Merge only fields explicitly returned by the API response.
                 # This prevents partial responses (e.g., validate-only status
                 # payloads) from wiping request fields back to defaults.
@@ -712,6 +1036,7 @@ class TOOAPIBaseclass(TOOAPIReprMixin):
                     for field_name in data.model_fields_set:  # type: ignore[attr-defined]
                         object.__setattr__(self, field_name, getattr(data, field_name))
                 self._post_process()
+                self._invalidate_fingerprint()
                 return True
             except Exception as e:
                 self.__set_error(f"Error validating response: {e}")
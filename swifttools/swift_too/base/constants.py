@@ -1,4 +1,5 @@
 import os
+from datetime import datetime
 from pathlib import Path
 
 from swifttools.swift_too.version import version_tuple
@@ -48,3 +49,31 @@ SESSION_COOKIE_NAME = "session"
 
 # Create and optionally load cookies
 COOKIE_JAR_PATH = Path.home() / ".cache/swift_too" / "cookies.txt"
+
+# Default location of the persistent API response cache
+RESPONSE_CACHE_PATH = Path.home() / ".cache/swift_too" / "responses.sqlite"
+
+# Default location of the local table of Swift clock corrections (UTCF)
+UTCF_TABLE_PATH = Path.home() / ".cache/swift_too" / "utcf.npz"
+
+# Default location of the local mirror of the As-Flown Science Timeline
+AFST_STORE_PATH = Path.home() / ".cache/swift_too" / "afst.sqlite"
+
+# Default location of the local store of SAA passages
+SAA_STORE_PATH = Path.home() / ".cache/swift_too" / "saa.sqlite"
+
+# Default location of the persistent cache of name resolutions
+RESOLVE_CACHE_PATH = Path.home() / ".cache/swift_too" / "resolve.sqlite"
+
+# Swift launch date, from which the UTCF table starts
+SWIFT_LAUNCH = datetime(2004, 11, 20)
+
+# UTC times at which leap seconds took effect since the Swift MET epoch
+# (2001-01-01)
+LEAP_SECONDS = (
+    datetime(2006, 1, 1),
+    datetime(2009, 1, 1),
+    datetime(2012, 7, 1),
+    datetime(2015, 7, 1),
+    datetime(2017, 1, 1),
+)
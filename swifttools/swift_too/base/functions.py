@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 import re
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 
-from astropy import units as u  # type: ignore[import-untyped]
-from astropy.time import TimeDelta  # type: ignore[import-untyped]
 from pydantic_core import PydanticUndefinedType
 
 from .constants import MODESXRT, XRTMODES
 
+# astropy is slow to import, so it is only imported by functions that use it
+if TYPE_CHECKING:
+    from astropy import units as u  # type: ignore[import-untyped]
+    from astropy.time import TimeDelta  # type: ignore[import-untyped]
+
 
 def utcnow():
     """Return the current UTC time as a datetime object."""
@@ -21,14 +27,17 @@ def convert_from_timedelta(
         return value
     if value is None:
         return None
-    if isinstance(value, u.Quantity) or isinstance(value, TimeDelta):
-        return value.to(u.day).value
-    elif isinstance(value, (int, float)):
+    if isinstance(value, (int, float)):
         return float(value)
     elif isinstance(value, timedelta):
         return value.total_seconds() / 86400.0
-    else:
-        raise TypeError(f"Unsupported type for timedelta conversion: {type(value)}")
+
+    from astropy import units as u  # type: ignore[import-untyped]
+    from astropy.time import TimeDelta  # type: ignore[import-untyped]
+
+    if isinstance(value, u.Quantity) or isinstance(value, TimeDelta):
+        return value.to(u.day).value
+    raise TypeError(f"Unsupported type for timedelta conversion: {type(value)}")
 
 
 def convert_obs_id_sdc(obs_id: str | int) -> str:
@@ -112,6 +121,9 @@ def validate_monitoring_cadence(value: str | u.Quantity | timedelta | TimeDelta
             )
         return value.strip()
 
+    from astropy import units as u  # type: ignore[import-untyped]
+    from astropy.time import TimeDelta  # type: ignore[import-untyped]
+
     if type(value) is timedelta:
         value = u.Quantity(value.total_seconds(), u.second)
 
@@ -0,0 +1,176 @@
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+
+_US = np.timedelta64(1, "us")
+
+
+def _times(values: Any) -> np.ndarray:
+    """Times as a 1D `datetime64[us]` array."""
+    return np.atleast_1d(np.asarray(values, dtype="datetime64[us]"))
+
+
+class IntervalSet:
+    """Set of time intervals, stored as sorted NumPy arrays of the begin and
+    end of disjoint intervals, supporting set algebra (union, intersection,
+    difference and complement), total duration and membership tests, each in
+    O(n log n) time without a Python loop over intervals.
+
+    Intervals are half-open: each includes its `begin` but not its `end`.
+    Overlapping or touching intervals are merged, and empty intervals are
+    dropped.
+
+    The operators `|`, `&` and `-` are the union, intersection and difference
+    of two sets.
+
+    Parameters
+    ----------
+    begin, end : array
+        Begin and end of each interval (`datetime64` or a list of
+        `datetime`), in any order.
+
+    Attributes
+    ----------
+    begin, end : np.ndarray
+        Begin and end of each disjoint interval, in time order, as
+        `datetime64[us]`.
+    """
+
+    def __init__(self, begin: Any = (), end: Any = ()):
+        begin, end = _times(begin), _times(end)
+        if begin.shape != end.shape:
+            raise ValueError("begin and end must have the same length")
+        keep = end > begin
+        begin, end = begin[keep], end[keep]
+        order = np.argsort(begin, kind="stable")
+        begin, end = begin[order], end[order]
+        if len(begin) > 1:
+            # An interval starts a new merged interval if it begins after every
+            # earlier interval has ended
+            latest_end = np.maximum.accumulate(end)
+            starts = np.flatnonzero(np.concatenate([[True], begin[1:] > latest_end[:-1]]))
+            begin = begin[starts]
+            end = np.maximum.reduceat(end, starts)
+        self.begin = begin
+        self.end = end
+
+    @classmethod
+    def from_windows(cls, windows: Any) -> "IntervalSet":
+        """Set of a sequence of windows, each with a `begin` and `end` (e.g.
+        `SwiftVisWindow` or `SwiftSAAEntry`) or a (begin, end) pair."""
+        begin, end = [], []
+        for window in windows:
+            if hasattr(window, "begin"):
+                window = (window.begin, window.end)
+            if window[0] is not None and window[1] is not None:
+                begin.append(window[0])
+                end.append(window[1])
+        return cls(begin, end)
+
+    @classmethod
+    def from_result(cls, result: Any) -> "IntervalSet":
+        """Set of the windows of a `VisQuery` result, or the entries of an
+        `SAA`, `ObsQuery` (AFST) or `PlanQuery` (PPST) result."""
+        windows = getattr(result, "windows", None)
+        if windows is None:
+            windows = result.entries
+        if not windows and getattr(result, "_column_data", None) is not None:
+            # Results fetched as columns only
+            columns = result.columns
+            valid = ~(np.isnat(columns["begin"]) | np.isnat(columns["end"]))
+            return cls(columns["begin"][valid], columns["end"][valid])
+        return cls.from_windows(windows)
+
+    def _combine(self, other: "IntervalSet", keep: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> "IntervalSet":
+        """Combine two sets, keeping the times for which `keep(in self, in
+        other)` is True."""
+        # The bounds of each set alternate between begin and end, in
+        # increasing order, so a time is in the set if an odd number of bounds
+        # are at or before it
+        a = np.stack([self.begin, self.end], axis=1).ravel()
+        b = np.stack([other.begin, other.end], axis=1).ravel()
+        # Merging two sorted runs, which a stable sort does in linear time
+        bounds = np.sort(np.concatenate([a, b]), kind="stable")
+        if len(bounds) < 2:
+            return IntervalSet()
+        # Each set is constant between consecutive bounds, so test the start
+        # of each of these segments
+        start = bounds[:-1]
+        in_a = np.searchsorted(a, start, side="right") % 2 == 1
+        in_b = np.searchsorted(b, start, side="right") % 2 == 1
+        kept = keep(in_a, in_b)
+        return IntervalSet(start[kept], bounds[1:][kept])
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        """Times in either set."""
+        return IntervalSet(np.concatenate([self.begin, other.begin]), np.concatenate([self.end, other.end]))
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """Times in both sets."""
+        return self._combine(other, np.logical_and)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """Times in this set, but not in `other`."""
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def complement(self, begin: Any = None, end: Any = None) -> "IntervalSet":
+        """Times between `begin` and `end` that are not in this set. These
+        default to the start and end of this set."""
+        begin = _times(begin)[0] if begin is not None else (self.begin[0] if len(self) else None)
+        end = _times(end)[0] if end is not None else (self.end[-1] if len(self) else None)
+        if begin is None or end is None:
+            return IntervalSet()
+        return IntervalSet([begin], [end]).difference(self)
+
+    def clip(self, begin: Any, end: Any) -> "IntervalSet":
+        """Times in this set between `begin` and `end`."""
+        return self.intersection(IntervalSet([begin], [end]))
+
+    def contains(self, times: Any) -> np.ndarray:
+        """Is each time in the set?"""
+        times = _times(times)
+        index = np.searchsorted(self.begin, times, side="right") - 1
+        inside = index >= 0
+        inside[inside] = times[inside] < self.end[index[inside]]
+        return inside
+
+    @property
+    def durations(self) -> np.ndarray:
+        """Length of each interval, as `timedelta64[us]`."""
+        return self.end - self.begin
+
+    @property
+    def duration(self) -> timedelta:
+        """Total length of the intervals."""
+        return timedelta(microseconds=int(self.durations.sum() / _US))
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.union(other)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        return self.difference(other)
+
+    def __contains__(self, time: Any) -> bool:
+        return bool(self.contains(time)[0])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return np.array_equal(self.begin, other.begin) and np.array_equal(self.end, other.end)
+
+    def __len__(self) -> int:
+        return len(self.begin)
+
+    def __iter__(self) -> Iterator[tuple[datetime, datetime]]:
+        return zip(self.begin.tolist(), self.end.tolist())
+
+    def __getitem__(self, index: int) -> tuple[datetime, datetime]:
+        return self.begin[index].tolist(), self.end[index].tolist()
+
+    def __repr__(self) -> str:
+        return f"IntervalSet(intervals={len(self)}, duration={self.duration})"
@@ -0,0 +1,268 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+# Default number of worker threads used to process queued requests
+DEFAULT_MAX_WORKERS = 8
+
+
+class TimeoutTimer:
+    """Single background thread that fires timeout callbacks.
+
+    All pending timeouts are held in one heap ordered by deadline, so any
+    number of queued requests share a single sleeping thread, rather than
+    each request needing its own watchdog thread.
+    """
+
+    def __init__(self):
+        self._heap: list[list[Any]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> list[Any]:
+        """Call `callback` after `delay` seconds. Returns an entry that can be
+        passed to `cancel`."""
+        entry = [time.monotonic() + delay, next(self._counter), callback]
+        with self._condition:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="swift_too-timeout", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return entry
+
+    def cancel(self, entry: list[Any]) -> None:
+        """Cancel a scheduled callback. The entry is discarded lazily when
+        its deadline is reached."""
+        with self._condition:
+            entry[2] = None
+
+    def __len__(self) -> int:
+        with self._condition:
+            return sum(1 for entry in self._heap if entry[2] is not None)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                deadline, _, callback = self._heap[0]
+                now = time.monotonic()
+                if callback is not None and deadline > now:
+                    self._condition.wait(deadline - now)
+                    continue
+                heapq.heappop(self._heap)
+            if callback is not None:
+                try:
+                    callback()
+                except Exception:
+                    pass
+
+
+class QueryJob:
+    """Handle for an API request submitted in the background with `queue()`.
+
+    The request object itself is updated in place when the request completes,
+    as with `submit()`. This handle can be used to wait for the result,
+    check progress, cancel the request, or register completion callbacks. It
+    can also be awaited from asynchronous code.
+
+    Attributes
+    ----------
+    request : TOOAPIBaseclass
+        The API object that was queued.
+    """
+
+    def __init__(self, request: Any):
+        self.request = request
+        self._future: Future = Future()
+        self._lock = threading.RLock()
+        self._timeout_entry: list[Any] | None = None
+
+    def result(self, timeout: float | None = None) -> bool:
+        """Wait for the request to complete, and return whether it was
+        successful.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. Wait forever if None.
+
+        Raises
+        ------
+        TimeoutError
+            If the request did not complete within `timeout`, or the request
+            itself timed out.
+        CancelledError
+            If the request was cancelled.
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """Wait for the request to complete, and return the exception raised
+        by it, if any."""
+        return self._future.exception(timeout)
+
+    def done(self) -> bool:
+        """Has the request completed, failed, timed out or been cancelled?"""
+        return self._future.done()
+
+    def running(self) -> bool:
+        """Is the request currently being processed?"""
+        return self._future.running()
+
+    def cancelled(self) -> bool:
+        """Was the request cancelled?"""
+        return self._future.cancelled()
+
+    def cancel(self) -> bool:
+        """Cancel the request. Only requests that are still waiting for a
+        worker can be cancelled.
+
+        Returns
+        -------
+        bool
+            Was the request cancelled?
+        """
+        with self._lock:
+            cancelled = self._future.cancel()
+        if cancelled:
+            object.__setattr__(self.request, "complete", True)
+        return cancelled
+
+    def add_done_callback(self, fn: Callable[["QueryJob"], Any]) -> None:
+        """Call `fn(job)` when the request completes. If the request has
+        already completed, `fn` is called immediately."""
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        if self.cancelled():
+            state = "cancelled"
+        elif self.done():
+            state = "finished"
+        elif self.running():
+            state = "running"
+        else:
+            state = "pending"
+        return f"QueryJob(request={type(self.request).__name__}, state={state})"
+
+    def _run(self, target: Callable[[], Any]) -> None:
+        """Run the request in a worker thread, recording the outcome."""
+        with self._lock:
+            if self._future.done() or not self._future.set_running_or_notify_cancel():
+                return
+        try:
+            result = target()
+        except BaseException as e:
+            self._finish(exception=e)
+        else:
+            self._finish(result=result)
+
+    def _expire(self, wait_seconds: float, on_timeout: Callable[[float], Any] | None) -> None:
+        """Mark the request as timed out, if it has not already completed."""
+        with self._lock:
+            if self._future.done():
+                return
+            if on_timeout is not None:
+                on_timeout(wait_seconds)
+            self._future.set_exception(TimeoutError(f"Asynchronous request timed out after {wait_seconds} seconds"))
+
+    def _finish(self, result: Any = None, exception: BaseException | None = None) -> None:
+        with self._lock:
+            if self._future.done():
+                return
+            if exception is not None:
+                self._future.set_exception(exception)
+            else:
+                self._future.set_result(result)
+
+
+class QueueScheduler:
+    """Shared scheduler for requests submitted with `queue()`.
+
+    Requests are processed by a bounded pool of worker threads, and timeouts
+    are enforced by a single `TimeoutTimer`, so queuing many requests does not
+    create any additional threads.
+
+    Parameters
+    ----------
+    max_workers : int
+        Maximum number of requests processed at once.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self.timer = TimeoutTimer()
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool, created on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="swift_too")
+            return self._executor
+
+    def configure(self, max_workers: int) -> None:
+        """Change the number of worker threads. Requests already queued are
+        completed by the existing workers."""
+        self.shutdown(wait=False)
+        self.max_workers = max_workers
+
+    def submit(
+        self,
+        request: Any,
+        target: Callable[[], Any],
+        timeout: float | None = None,
+        on_timeout: Callable[[float], Any] | None = None,
+    ) -> QueryJob:
+        """Queue `target` to run in a worker thread on behalf of `request`.
+
+        Parameters
+        ----------
+        request : TOOAPIBaseclass
+            The API object the job is for.
+        target : callable
+            Function that performs the request, returning success.
+        timeout : float, optional
+            Seconds after which the job is marked as timed out.
+        on_timeout : callable, optional
+            Called with the timeout in seconds if the job times out.
+
+        Returns
+        -------
+        QueryJob
+            Handle for the queued request.
+        """
+        job = QueryJob(request)
+        if timeout is not None:
+            entry = self.timer.schedule(timeout, lambda: job._expire(timeout, on_timeout))
+            job._timeout_entry = entry
+            job._future.add_done_callback(lambda _: self.timer.cancel(entry))
+        self.executor.submit(job._run, target)
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool. A new pool is started if more requests are
+        queued."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Shared scheduler used by `TOOAPIBaseclass.queue()`
+scheduler = QueueScheduler()
@@ -0,0 +1,387 @@
+import asyncio
+import base64
+import json
+import random
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+# Request fields that are never written to a cassette or used for matching
+SECRET_FIELDS = ("shared_secret", "password")
+
+# Response headers that no longer apply once the body has been decoded
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "set-cookie")
+
+
+def _scrub(fields: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Remove secrets, and sort fields so that their order does not matter."""
+    return sorted((key, value) for key, value in fields if key not in SECRET_FIELDS)
+
+
+def _request_body(content: bytes, content_type: str) -> Any:
+    """Normalized, secret free, request body used for matching."""
+    if not content:
+        return None
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        return _scrub(parse_qsl(content.decode(), keep_blank_values=True))
+    if content_type.startswith("application/json"):
+        try:
+            body = json.loads(content)
+        except ValueError:
+            return content.decode(errors="replace")
+        if isinstance(body, dict):
+            return {key: value for key, value in sorted(body.items()) if key not in SECRET_FIELDS}
+        return body
+    return content.decode(errors="replace")
+
+
+def request_key(method: str, path: str, query: str | bytes, body: Any = None) -> str:
+    """Key that identifies equivalent requests, regardless of host, argument
+    order or credentials."""
+    if isinstance(query, bytes):
+        query = query.decode()
+    params = _scrub(parse_qsl(query, keep_blank_values=True))
+    return json.dumps([method.upper(), path, params, body], separators=(",", ":"))
+
+
+def _httpx_request_key(request: httpx.Request) -> str:
+    body = _request_body(request.content, request.headers.get("content-type", ""))
+    return request_key(request.method, request.url.path, request.url.query, body)
+
+
+class Cassette:
+    """Recorded API responses, stored as a JSON file.
+
+    Requests are matched on their method, path, arguments and body, ignoring
+    the host and any credentials, which are never stored. When the same
+    request was recorded several times, its responses are replayed in order,
+    repeating the last one.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Location of the cassette file. If it exists it is loaded.
+    """
+
+    version = 1
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        self._interactions: list[dict[str, Any]] = []
+        self._responses: dict[str, list[dict[str, Any]]] = {}
+        self._played: dict[str, int] = {}
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def load(self, path: str | Path | None = None) -> None:
+        """Load recorded responses from disk."""
+        path = Path(path) if path is not None else self.path
+        assert path is not None, "No cassette path given."
+        data = json.loads(path.read_text())
+        with self._lock:
+            self._interactions = []
+            self._responses = {}
+            self._played = {}
+        for interaction in data.get("interactions", []):
+            self._add(interaction)
+
+    def save(self, path: str | Path | None = None) -> None:
+        """Write recorded responses to disk."""
+        path = Path(path) if path is not None else self.path
+        assert path is not None, "No cassette path given."
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"version": self.version, "interactions": list(self._interactions)}
+        path.write_text(json.dumps(data, indent=1))
+
+    def _add(self, interaction: dict[str, Any]) -> None:
+        request = interaction["request"]
+        key = request_key(request["method"], request["path"], request.get("query", ""), request.get("body"))
+        with self._lock:
+            self._interactions.append(interaction)
+            self._responses.setdefault(key, []).append(interaction["response"])
+
+    def record(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Add a request and its (already read) response to the cassette."""
+        content = response.content
+        try:
+            body, encoding = content.decode(), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode(), "base64"
+        headers = [(key, value) for key, value in response.headers.items() if key.lower() not in _DROPPED_HEADERS]
+        self._add(
+            {
+                "request": {
+                    "method": request.method,
+                    "path": request.url.path,
+                    "query": urlencode(_scrub(list(request.url.params.multi_items()))),
+                    "body": _request_body(request.content, request.headers.get("content-type", "")),
+                },
+                "response": {"status": response.status_code, "headers": headers, "body": body, "encoding": encoding},
+            }
+        )
+
+    def play(self, key: str) -> dict[str, Any] | None:
+        """Next recorded response for the request `key`, or None if the
+        request was not recorded."""
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                return None
+            index = self._played.get(key, 0)
+            self._played[key] = index + 1
+            return responses[min(index, len(responses) - 1)]
+
+    def rewind(self) -> None:
+        """Replay responses from the start again."""
+        with self._lock:
+            self._played = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._interactions)
+
+    @staticmethod
+    def content(recorded: dict[str, Any]) -> bytes:
+        """Body of a recorded response."""
+        if recorded.get("encoding") == "base64":
+            return base64.b64decode(recorded["body"])
+        return recorded["body"].encode()
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport that makes real requests, and records the responses in a
+    `Cassette`.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        Where responses are recorded.
+    transport : httpx.BaseTransport, optional
+        Transport used for synchronous requests, by default a standard
+        `httpx.HTTPTransport`.
+    async_transport : httpx.AsyncBaseTransport, optional
+        Transport used for asynchronous requests, by default a standard
+        `httpx.AsyncHTTPTransport`.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.cassette = cassette
+        self.transport = transport if transport is not None else httpx.HTTPTransport()
+        self.async_transport = async_transport if async_transport is not None else httpx.AsyncHTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.transport.handle_request(request)
+        response.read()
+        response.close()
+        self.cassette.record(request, response)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.async_transport.handle_async_request(request)
+        await response.aread()
+        await response.aclose()
+        self.cassette.record(request, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    async def aclose(self) -> None:
+        await self.async_transport.aclose()
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport that answers requests from a `Cassette`, without network
+    access.
+
+    Latency and failures can be injected, to run throughput experiments or
+    test error handling deterministically. Requests that were not recorded
+    are answered with a 404 response.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        Recorded responses.
+    latency : float or tuple
+        Delay added to every response (seconds), or a (min, max) range from
+        which a delay is drawn at random.
+    error_rate : float
+        Fraction of requests (0-1) that fail.
+    error : int or Exception
+        How injected failures fail: an HTTP status code to respond with, or
+        an exception to raise (e.g. `httpx.ConnectError("refused")`).
+    seed : int, optional
+        Seed for the random latency and failures, for repeatable runs.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float | tuple[float, float] = 0.0,
+        error_rate: float = 0.0,
+        error: int | Exception = 503,
+        seed: int | None = None,
+    ):
+        self.cassette = cassette
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error = error
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._misses = 0
+
+    def _delay(self) -> float:
+        if isinstance(self.latency, tuple):
+            with self._lock:
+                return self._random.uniform(*self.latency)
+        return self.latency
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self._requests += 1
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+            if fail:
+                self._errors += 1
+        if fail:
+            if isinstance(self.error, Exception):
+                raise self.error
+            return httpx.Response(self.error, json={"detail": "Injected error"}, request=request)
+
+        recorded = self.cassette.play(_httpx_request_key(request))
+        if recorded is None:
+            with self._lock:
+                self._misses += 1
+            detail = f"No recorded response for {request.method} {request.url.path}"
+            return httpx.Response(404, json={"detail": detail}, request=request)
+        return httpx.Response(
+            recorded["status"],
+            headers=recorded["headers"],
+            content=Cassette.content(recorded),
+            request=request,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._delay()
+        if delay > 0:
+            time.sleep(delay)
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self._delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._respond(request)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Number of requests answered, failures injected, and requests with
+        no recorded response."""
+        with self._lock:
+            return {"requests": self._requests, "errors": self._errors, "misses": self._misses}
+
+
+class ReplayApp:
+    """Minimal ASGI application that serves the responses in a `Cassette`,
+    standing in for the API server (e.g. the `/swift/*` endpoints).
+
+    It can be used in process with `httpx.ASGITransport(app=ReplayApp(...))`,
+    or served over HTTP with an ASGI server such as uvicorn, with the API
+    URL then pointed at it, e.g. `SwiftClock._api_base`.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        Recorded responses.
+    """
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        content = b""
+        while True:
+            message = await receive()
+            content += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        headers = {key.decode().lower(): value.decode() for key, value in scope.get("headers", [])}
+        body = _request_body(content, headers.get("content-type", ""))
+        recorded = self.cassette.play(request_key(scope["method"], scope["path"], scope.get("query_string", b""), body))
+
+        if recorded is None:
+            status = 404
+            response_headers = [("content-type", "application/json")]
+            response_body = json.dumps({"detail": f"No recorded response for {scope['method']} {scope['path']}"})
+            payload = response_body.encode()
+        else:
+            status = recorded["status"]
+            response_headers = [(key, value) for key, value in recorded["headers"]]
+            payload = Cassette.content(recorded)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(key.encode(), value.encode()) for key, value in response_headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+@contextmanager
+def use_cassette(path: str | Path, record: bool = False, **kwargs) -> Iterator[httpx.BaseTransport]:
+    """Route all API requests through a cassette for the duration of a
+    `with` block.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the cassette file.
+    record : bool
+        Make real requests and record their responses, saving the cassette
+        on exit. Otherwise responses are replayed from the cassette.
+    **kwargs
+        Options passed to `ReplayTransport`, e.g. `latency` or `error_rate`.
+
+    Yields
+    ------
+    RecordingTransport or ReplayTransport
+        The transport in use.
+    """
+    from . import common
+
+    cassette = Cassette(path)
+    transport: Any = RecordingTransport(cassette) if record else ReplayTransport(cassette, **kwargs)
+    previous = common.session.transport
+    common.session.configure(transport=transport)
+    try:
+        yield transport
+    finally:
+        common.session.configure(transport=previous)
+        if record:
+            cassette.save()
@@ -0,0 +1,214 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+import httpx
+
+# Default retry settings
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_RETRY_STATUSES = (
+    HTTPStatus.TOO_MANY_REQUESTS,
+    HTTPStatus.BAD_GATEWAY,
+    HTTPStatus.SERVICE_UNAVAILABLE,
+    HTTPStatus.GATEWAY_TIMEOUT,
+)
+
+# Default circuit breaker settings
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+# HTTP status codes that indicate the API host is unavailable
+UNAVAILABLE_STATUSES = (HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT)
+
+
+class RetryPolicy:
+    """When, and how long to wait before, retrying a failed API request.
+
+    Requests are retried after connection errors, timeouts, and responses
+    with one of the `statuses` codes. The delay before each retry grows
+    exponentially with "full jitter", i.e. a random delay between 0 and
+    `backoff_factor * 2 ** attempt`, capped at `max_backoff`. For 429 and 503
+    responses, a `Retry-After` header given by the server is used instead.
+
+    Parameters
+    ----------
+    max_retries : int
+        Maximum number of retries per request. 0 disables retries.
+    backoff_factor : float
+        Base delay between retries (seconds).
+    max_backoff : float
+        Maximum delay between retries (seconds), also applied to
+        `Retry-After`.
+    statuses : tuple
+        HTTP status codes that should be retried.
+    jitter : bool
+        Randomize delays, so that many clients do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        statuses: tuple[int, ...] = DEFAULT_RETRY_STATUSES,
+        jitter: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = tuple(statuses)
+        self.jitter = jitter
+
+    def configure(self, **kwargs) -> None:
+        """Update retry settings.
+
+        Parameters
+        ----------
+        **kwargs
+            Any of `max_retries`, `backoff_factor`, `max_backoff`, `statuses`
+            or `jitter`.
+        """
+        allowed = {"max_retries", "backoff_factor", "max_backoff", "statuses", "jitter"}
+        unknown = set(kwargs) - allowed
+        if unknown:
+            raise TypeError(f"Unknown retry option(s): {', '.join(sorted(unknown))}")
+        for key, value in kwargs.items():
+            setattr(self, key, tuple(value) if key == "statuses" else value)
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (counting from 0)."""
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> float | None:
+        """Delay requested by the server in a `Retry-After` header, if any."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+    def delay(
+        self,
+        attempt: int,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """How long to wait before retrying a request, or None if it should
+        not be retried.
+
+        Parameters
+        ----------
+        attempt : int
+            Number of retries already made.
+        response : httpx.Response, optional
+            Response received, if any.
+        error : Exception, optional
+            Exception raised by the request, if any.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is not None:
+            if response.status_code not in self.statuses:
+                return None
+            if response.status_code in (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE):
+                retry_after = self.retry_after(response)
+                if retry_after is not None:
+                    return min(retry_after, self.max_backoff)
+        elif not isinstance(error, httpx.TransportError):
+            return None
+        return self.backoff(attempt)
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker, which fails requests fast while the API is
+    unavailable.
+
+    After `failure_threshold` consecutive failures (connection errors,
+    timeouts or 502/503/504 responses), the circuit for that host opens and
+    requests are refused without contacting the server. After
+    `reset_timeout` seconds a single trial request is allowed through. If it
+    succeeds the circuit closes, otherwise it stays open for another
+    `reset_timeout` seconds.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        Consecutive failures before the circuit opens. 0 disables the
+        circuit breaker.
+    reset_timeout : float
+        Seconds to wait before allowing a trial request.
+    """
+
+    def __init__(
+        self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}
+        self._opened: dict[str, float] = {}
+        self._trial: set[str] = set()
+
+    def state(self, host: str) -> str:
+        """Circuit state for `host`: "closed", "open" or "half-open"."""
+        with self._lock:
+            if host not in self._opened:
+                return "closed"
+            if host in self._trial or time.monotonic() - self._opened[host] >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def allow(self, host: str) -> bool:
+        """Can a request be sent to `host`?"""
+        with self._lock:
+            if self.failure_threshold <= 0 or host not in self._opened:
+                return True
+            if host in self._trial or time.monotonic() - self._opened[host] < self.reset_timeout:
+                return False
+            self._trial.add(host)
+            return True
+
+    def record_success(self, host: str) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened.pop(host, None)
+            self._trial.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        """Record a failed request, opening the circuit if the threshold is
+        reached or a trial request failed."""
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if host in self._trial or (0 < self.failure_threshold <= self._failures[host]):
+                self._opened[host] = time.monotonic()
+            self._trial.discard(host)
+
+    def reset(self, host: str | None = None) -> None:
+        """Close the circuit for `host`, or for all hosts if None."""
+        with self._lock:
+            if host is None:
+                self._failures.clear()
+                self._opened.clear()
+                self._trial.clear()
+            else:
+                self._failures.pop(host, None)
+                self._opened.pop(host, None)
+                self._trial.discard(host)
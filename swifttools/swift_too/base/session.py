@@ -0,0 +1,202 @@
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any
+
+import httpx
+
+# Default connection pool limits
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# httpcore trace events that indicate a brand new connection was opened
+_CONNECT_EVENTS = ("connection.connect_tcp.complete", "connection.connect_unix_socket.complete")
+# httpcore trace events that indicate a request was sent over a connection
+_REQUEST_EVENTS = ("http11.send_request_headers.started", "http2.send_request_headers.started")
+
+
+class TOOAPISession:
+    """Process-wide pool of keep-alive HTTP connections to the TOO API.
+
+    A single `httpx.Client` is shared by every synchronous request, and one
+    `httpx.AsyncClient` is shared per running event loop, so that repeated
+    API calls reuse TCP/TLS connections rather than performing a fresh
+    handshake each time. Clients are created lazily, are safe to use from
+    multiple threads, and are discarded (not closed) in a forked child
+    process so that parent connections are never shared.
+
+    Parameters
+    ----------
+    cookies : CookieJar, optional
+        Cookie jar shared by all clients, used for authenticated sessions.
+    max_connections : int
+        Maximum number of concurrent connections.
+    max_keepalive_connections : int
+        Maximum number of idle keep-alive connections retained in the pool.
+    keepalive_expiry : float
+        Time in seconds after which an idle connection is closed.
+    http2 : bool
+        Use HTTP/2 if the server supports it. Requires the `h2` package
+        (`pip install httpx[http2]`).
+    transport : httpx.BaseTransport or httpx.AsyncBaseTransport, optional
+        Custom transport used instead of the network, e.g. a
+        `ReplayTransport` answering from recorded responses. It is used by
+        the synchronous and/or asynchronous clients, depending on which
+        interfaces it implements.
+    """
+
+    def __init__(
+        self,
+        cookies: Any = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        transport: Any = None,
+    ):
+        self.cookies = cookies
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        self.transport = transport
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._client: httpx.Client | None = None
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._requests = 0
+        self._connections = 0
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Connection pool limits applied to new clients."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def configure(self, **kwargs) -> None:
+        """Update pool settings. Any open clients are closed, so the new
+        settings take effect on the next request.
+
+        Parameters
+        ----------
+        **kwargs
+            Any of `max_connections`, `max_keepalive_connections`,
+            `keepalive_expiry`, `http2` or `transport`.
+        """
+        allowed = {"max_connections", "max_keepalive_connections", "keepalive_expiry", "http2", "transport"}
+        unknown = set(kwargs) - allowed
+        if unknown:
+            raise TypeError(f"Unknown session option(s): {', '.join(sorted(unknown))}")
+
+        if kwargs.get("http2"):
+            try:
+                import h2  # type: ignore[import-not-found]  # noqa: F401
+            except ImportError:
+                raise ImportError("HTTP/2 support requires the `h2` package: pip install httpx[http2]")
+
+        self.close()
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def _check_fork(self) -> None:
+        """Drop clients inherited from a parent process after a fork."""
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._lock = threading.Lock()
+            self._client = None
+            self._async_clients = weakref.WeakKeyDictionary()
+            self._requests = 0
+            self._connections = 0
+
+    def _client_kwargs(self, transport_type: type) -> dict[str, Any]:
+        kwargs = {"cookies": self.cookies, "limits": self.limits, "http2": self.http2}
+        if isinstance(self.transport, transport_type):
+            kwargs["transport"] = self.transport
+        return kwargs
+
+    @property
+    def client(self) -> httpx.Client:
+        """Shared synchronous client, created on first use."""
+        self._check_fork()
+        with self._lock:
+            if self._client is None or self._client.is_closed is True:
+                self._client = httpx.Client(**self._client_kwargs(httpx.BaseTransport))
+            return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared asynchronous client for the currently running event loop."""
+        self._check_fork()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed is True:
+                client = httpx.AsyncClient(**self._client_kwargs(httpx.AsyncBaseTransport))
+                self._async_clients[loop] = client
+            return client
+
+    @property
+    def extensions(self) -> dict[str, Any]:
+        """Request extensions for the synchronous client, which attach the
+        connection reuse trace hook."""
+        return {"trace": self._trace}
+
+    @property
+    def async_extensions(self) -> dict[str, Any]:
+        """Request extensions for the asynchronous client."""
+        return {"trace": self._trace_async}
+
+    def _trace(self, event_name: str, info: dict) -> None:
+        """httpcore trace hook, used to count requests sent and connections
+        opened."""
+        if event_name in _CONNECT_EVENTS:
+            with self._lock:
+                self._connections += 1
+        elif event_name in _REQUEST_EVENTS:
+            with self._lock:
+                self._requests += 1
+
+    async def _trace_async(self, event_name: str, info: dict) -> None:
+        self._trace(event_name, info)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Number of requests made, connections opened and connections
+        reused since the pool was created or `reset_stats` was called."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "connections_opened": self._connections,
+                "connections_reused": max(self._requests - self._connections, 0),
+            }
+
+    def reset_stats(self) -> None:
+        """Reset connection reuse statistics."""
+        with self._lock:
+            self._requests = 0
+            self._connections = 0
+
+    def close(self) -> None:
+        """Close the shared synchronous client and forget any asynchronous
+        clients. Asynchronous clients should be closed from within their
+        event loop using `aclose`."""
+        self._check_fork()
+        with self._lock:
+            client, self._client = self._client, None
+            self._async_clients = weakref.WeakKeyDictionary()
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the asynchronous client for the running event loop."""
+        self._check_fork()
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
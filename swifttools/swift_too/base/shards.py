@@ -0,0 +1,268 @@
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import aclosing
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from .common import session
+
+# Default length of each shard (days)
+DEFAULT_SHARD_LENGTH = 7.0
+# Default number of shards fetched at once
+DEFAULT_SHARD_CONCURRENCY = 4
+
+# GET requests for time ranges longer than this (days) are automatically
+# split into shards of this length. None disables automatic sharding.
+auto_shard_length: float | None = None
+
+# Fields that are never copied to shards, or from shards to the merged result
+_NOT_COPIED = ("begin", "end", "length", "skycoord", "entries", "status", "username", "shared_secret", "autosubmit")
+
+# Marks the end of the shards passed between threads
+_DONE = object()
+
+
+def shard_ranges(begin: datetime, end: datetime, shard_length: float) -> list[tuple[datetime, datetime]]:
+    """Split the time range `begin` to `end` into consecutive ranges of at
+    most `shard_length` days."""
+    if shard_length <= 0:
+        raise ValueError("shard_length must be positive")
+    step = timedelta(days=shard_length)
+    ranges = []
+    start = begin
+    while start < end:
+        ranges.append((start, min(start + step, end)))
+        start += step
+    return ranges
+
+
+class TOOAPISharded:
+    """Mixin for timeline queries (e.g. AFST or PPST), which splits long time
+    ranges into shorter shards that are fetched concurrently, so that a long
+    query does not time out as one huge request.
+
+    `submit_sharded()` (or `get_sharded()`) fetches all shards and merges
+    their entries, removing duplicates of entries that span the boundary
+    between shards. `iter_shards()` (or `aiter_shards()`) returns each shard
+    in time order as soon as it has arrived, while later shards are still
+    downloading. Long queries are sharded automatically by `submit()` if
+    `auto_shard_length` is set."""
+
+    # Fields that identify an entry, used to remove duplicates
+    _shard_key_fields = ("begin", "end", "obs_id")
+
+    if TYPE_CHECKING:
+        # Shards are created with the constructor of the API class this is
+        # mixed into, TOOAPIBaseclass.__init__
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+
+    def _has_time_range(self) -> bool:
+        return getattr(self, "begin", None) is not None and getattr(self, "end", None) is not None
+
+    def _shards(self, shard_length: float) -> list[Any]:
+        """Unsubmitted copies of this query, one per shard of its time range."""
+        if not self._has_time_range():
+            return []
+        args = self._schema_payload(self._get_schema)  # type: ignore[attr-defined]
+        for name in _NOT_COPIED:
+            args.pop(name, None)
+        return [
+            type(self)(
+                **args,
+                begin=shard_begin,
+                end=shard_end,
+                username=self.username,  # type: ignore[attr-defined]
+                shared_secret=self.shared_secret,  # type: ignore[attr-defined]
+                autosubmit=False,
+            )
+            for shard_begin, shard_end in shard_ranges(self.begin, self.end, shard_length)  # type: ignore[attr-defined]
+        ]
+
+    def _should_shard(self) -> bool:
+        """Should a GET request be split into shards automatically?"""
+        if auto_shard_length is None or getattr(self, "_columnar_only", False) or not self._has_time_range():
+            return False
+        return self.end - self.begin > timedelta(days=auto_shard_length)  # type: ignore[attr-defined]
+
+    def submit_get(self, refresh: bool = False) -> bool:
+        """Perform an API GET request to the server, split into shards if the
+        time range is longer than `auto_shard_length`.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
+        if self._should_shard():
+            return self.submit_sharded(auto_shard_length, refresh=refresh)  # type: ignore[arg-type]
+        return super().submit_get(refresh)  # type: ignore[misc]
+
+    async def get(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request to the server, split into
+        shards if the time range is longer than `auto_shard_length`.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
+        if self._should_shard():
+            return await self.get_sharded(auto_shard_length, refresh=refresh)  # type: ignore[arg-type]
+        return await super().get(refresh)  # type: ignore[misc]
+
+    async def aiter_shards(
+        self,
+        shard_length: float = DEFAULT_SHARD_LENGTH,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        refresh: bool = False,
+    ) -> AsyncGenerator[Any, None]:
+        """Fetch the query in shards, yielding each shard in time order as
+        soon as it has arrived. Entries already yielded by an earlier shard
+        are removed from later ones. Failed shards are yielded with their
+        errors in `status`.
+
+        Parameters
+        ----------
+        shard_length : float
+            Length of each shard (days).
+        max_concurrency : int
+            Maximum number of shards fetched at once.
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+
+        Yields
+        ------
+        Query of the same class as this one, for one shard.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        shards = self._shards(shard_length)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(shard: Any) -> None:
+            async with semaphore:
+                try:
+                    if shard.validate_get():
+                        # Bypass automatic sharding for the shard itself
+                        await super(TOOAPISharded, shard).get(refresh)  # type: ignore[misc]
+                except Exception as e:
+                    shard.status.error(f"{type(e).__name__}: {e}")
+
+        tasks = [asyncio.ensure_future(fetch(shard)) for shard in shards]
+        seen: set[tuple[Any, ...]] = set()
+        try:
+            for shard, task in zip(shards, tasks):
+                await task
+                entries = []
+                for entry in shard.entries:
+                    key = tuple(getattr(entry, name, None) for name in self._shard_key_fields)
+                    if key not in seen:
+                        seen.add(key)
+                        entries.append(entry)
+                object.__setattr__(shard, "entries", entries)
+                yield shard
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def iter_shards(
+        self,
+        shard_length: float = DEFAULT_SHARD_LENGTH,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        refresh: bool = False,
+    ) -> Iterator[Any]:
+        """Fetch the query in shards, yielding each shard in time order as
+        soon as it has arrived, while later shards download in the
+        background. See `aiter_shards`."""
+        shards: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        async def produce() -> None:
+            try:
+                async with aclosing(self.aiter_shards(shard_length, max_concurrency, refresh)) as iterator:
+                    async for shard in iterator:
+                        shards.put(shard)
+                        if stop.is_set():
+                            break
+            finally:
+                await session.aclose()
+
+        def runner() -> None:
+            try:
+                asyncio.run(produce())
+            except BaseException as e:
+                shards.put(e)
+            shards.put(_DONE)
+
+        thread = threading.Thread(target=runner, daemon=True)
+        thread.start()
+        try:
+            while (shard := shards.get()) is not _DONE:
+                if isinstance(shard, BaseException):
+                    raise shard
+                yield shard
+        finally:
+            stop.set()
+
+    def _merge_shards(self, shards: list[Any]) -> bool:
+        """Combine the entries and status of each shard into this query."""
+        entries = []
+        for shard in shards:
+            entries.extend(shard.entries)
+            for error in shard.status.errors:
+                self.status.error(f"Shard {shard.begin:%Y-%m-%d} to {shard.end:%Y-%m-%d}: {error}")  # type: ignore[attr-defined]
+        object.__setattr__(self, "entries", entries)
+
+        # Copy other response fields (e.g. `afstmax`) from the last shard
+        fields = set(type(self).model_fields) - set(self._get_schema.model_fields) - set(_NOT_COPIED)  # type: ignore[attr-defined]
+        for shard in reversed(shards):
+            if shard.status.status == "Accepted":
+                for name in fields:
+                    object.__setattr__(self, name, getattr(shard, name))
+                break
+
+        if self.status.errors:  # type: ignore[attr-defined]
+            return False
+        self.status.status = "Accepted"  # type: ignore[attr-defined]
+        self._post_process()  # type: ignore[attr-defined]
+        self._invalidate_fingerprint()  # type: ignore[attr-defined]
+        return True
+
+    def submit_sharded(
+        self,
+        shard_length: float = DEFAULT_SHARD_LENGTH,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        refresh: bool = False,
+    ) -> bool:
+        """Fetch the query in shards of `shard_length` days, at most
+        `max_concurrency` at a time, and merge their entries.
+
+        Returns
+        -------
+        bool
+            Were all shards fetched successfully?
+        """
+        if not self._has_time_range():
+            return super().submit_get(refresh)  # type: ignore[misc]
+        return self._merge_shards(list(self.iter_shards(shard_length, max_concurrency, refresh)))
+
+    async def get_sharded(
+        self,
+        shard_length: float = DEFAULT_SHARD_LENGTH,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+        refresh: bool = False,
+    ) -> bool:
+        """Asynchronously fetch the query in shards of `shard_length` days,
+        at most `max_concurrency` at a time, and merge their entries.
+
+        Returns
+        -------
+        bool
+            Were all shards fetched successfully?
+        """
+        if not self._has_time_range():
+            return await super().get(refresh)  # type: ignore[misc]
+        async with aclosing(self.aiter_shards(shard_length, max_concurrency, refresh)) as iterator:
+            return self._merge_shards([shard async for shard in iterator])
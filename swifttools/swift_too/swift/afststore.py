@@ -0,0 +1,286 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from ..base.columnar import _column_spec, build_columns
+from ..base.constants import AFST_STORE_PATH
+from ..base.functions import utcnow
+from ..base.shards import DEFAULT_SHARD_LENGTH
+
+# Length of the AFST fetched by the first sync, if no start is given (days)
+DEFAULT_SYNC_DAYS = 30.0
+# Default time between automatic syncs of new AFST entries (seconds)
+DEFAULT_REFRESH_INTERVAL = 3600.0
+
+# Times are stored as seconds since this epoch
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _seconds(dt: datetime) -> float:
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH).total_seconds()
+
+
+def _datetime(seconds: float) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def _as_list(value: Any) -> list[Any] | None:
+    if value is None:
+        return None
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+class AFSTStore:
+    """Local mirror of the Swift As-Flown Science Timeline (AFST), stored in
+    SQLite, so that queries of past time ranges are answered from disk
+    rather than by the API.
+
+    `sync()` fetches the AFST since the last sync, up to `afstmax` (the time
+    up to which the AFST is final), which becomes the high-water mark for the
+    next sync. Entries are indexed by time, target ID and observation ID.
+    Once enabled, `ObsQuery` (`SwiftAFST`) queries by time range, optionally
+    with `target_id` or `obs_id`, that lie entirely within the mirrored time
+    range are answered locally. New entries are synced automatically at most
+    once every `refresh_interval` seconds.
+
+    The store is disabled by default, and is enabled with `enable()`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the SQLite database.
+    refresh_interval : float
+        Minimum time between automatic syncs (seconds).
+    enabled : bool
+        Is the store used by `SwiftAFST`?
+    """
+
+    def __init__(
+        self,
+        path: str | Path = AFST_STORE_PATH,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        enabled: bool = False,
+    ):
+        self.path = Path(path)
+        self.refresh_interval = refresh_interval
+        self.enabled = enabled
+        self._lock = threading.RLock()
+        self._initialized = False
+        self._checked = 0.0
+
+    def enable(self, path: str | Path | None = None) -> None:
+        """Enable the store, optionally changing its location."""
+        with self._lock:
+            if path is not None:
+                self.path = Path(path)
+                self._initialized = False
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the store. The mirrored AFST is kept on disk."""
+        self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "begin REAL NOT NULL, end REAL, obs_id TEXT, target_id INTEGER, ra REAL, dec REAL, body TEXT, "
+                "PRIMARY KEY (begin, obs_id))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_target_id ON entries (target_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_obs_id ON entries (obs_id)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _meta(self, conn: sqlite3.Connection) -> dict[str, float]:
+        return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+    @property
+    def coverage(self) -> tuple[datetime, datetime] | None:
+        """Time range mirrored by the store, ending at the high-water mark
+        (`afstmax` of the last sync), or None if it has never been synced."""
+        with self._lock, closing(self._connect()) as conn:
+            meta = self._meta(conn)
+        if "begin" not in meta:
+            return None
+        return _datetime(meta["begin"]), _datetime(meta["afstmax"])
+
+    def __len__(self) -> int:
+        with self._lock, closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def covers(self, begin: datetime, end: datetime) -> bool:
+        """Is the time range `begin` to `end` within the mirrored range?
+        Syncs new entries first, if a sync is due."""
+        self._ensure_current()
+        coverage = self.coverage
+        if coverage is None:
+            return False
+        return _seconds(coverage[0]) <= _seconds(begin) and _seconds(end) <= _seconds(coverage[1])
+
+    def sync(
+        self,
+        begin: datetime | None = None,
+        until: datetime | None = None,
+        shard_length: float = DEFAULT_SHARD_LENGTH,
+        username: str = "anonymous",
+        shared_secret: str = "anonymous",
+    ) -> bool:
+        """Fetch the AFST since the high-water mark from the API, in shards of
+        `shard_length` days, and add it to the store.
+
+        Parameters
+        ----------
+        begin : datetime, optional
+            Start of the mirrored time range. Defaults to `DEFAULT_SYNC_DAYS`
+            ago for the first sync. If earlier than the mirrored range, the
+            AFST from `begin` to the start of the range is also fetched.
+        until : datetime, optional
+            Fetch the AFST up to this time. Defaults to now.
+        shard_length : float
+            Length of each request (days).
+        username : str
+            TOO API username.
+        shared_secret : str
+            TOO API shared secret.
+
+        Returns
+        -------
+        bool
+            Were all requests successful?
+        """
+        # Imported here to avoid a circular import
+        from .obsquery import SwiftAFST
+
+        with self._lock:
+            self._checked = time.time()
+            end = until if until is not None else utcnow()
+            coverage = self.coverage
+            if coverage is None:
+                ranges = [(begin if begin is not None else end - timedelta(days=DEFAULT_SYNC_DAYS), end)]
+            else:
+                ranges = [(coverage[1], end)]
+                if begin is not None and begin < coverage[0]:
+                    ranges.insert(0, (begin, coverage[0]))
+
+            for start, stop in ranges:
+                if start >= stop:
+                    continue
+                afst = SwiftAFST(
+                    begin=start, end=stop, username=username, shared_secret=shared_secret, autosubmit=False
+                )
+                if not afst.submit_sharded(shard_length, refresh=True):
+                    return False
+                self._store(afst, start, stop)
+            return True
+
+    def _store(self, afst: Any, begin: datetime, end: datetime) -> None:
+        """Add the entries of an AFST query for `begin` to `end` to the
+        store, and extend the mirrored range up to its `afstmax`."""
+        afstmax = afst.afstmax if isinstance(afst.afstmax, datetime) else end
+        high = min(_seconds(end), _seconds(afstmax))
+        spec = _column_spec(type(afst)._entry_schema())
+
+        rows = []
+        longest = 0.0
+        for entry in afst.entries:
+            if entry.begin is None or _seconds(entry.begin) >= high:
+                # Entries after `afstmax` may still change
+                continue
+            values = entry.__dict__
+            body = {
+                key: values[name].isoformat() if isinstance(values.get(name), datetime) else values.get(name)
+                for name, key, _, _ in spec
+            }
+            entry_begin = _seconds(entry.begin)
+            entry_end = _seconds(entry.end) if entry.end is not None else None
+            if entry_end is not None:
+                longest = max(longest, entry_end - entry_begin)
+            # Entries without an observation ID are keyed on "", so that they
+            # are replaced by later syncs too
+            obs_id = entry.obs_id if entry.obs_id is not None else ""
+            rows.append(
+                (entry_begin, entry_end, obs_id, entry.target_id, body.get("ra"), body.get("dec"), json.dumps(body))
+            )
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            meta = self._meta(conn)
+            conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            updates = {
+                "begin": min(meta.get("begin", _seconds(begin)), _seconds(begin)),
+                "afstmax": max(meta.get("afstmax", high), high),
+                "longest": max(meta.get("longest", 0.0), longest),
+            }
+            conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", list(updates.items()))
+
+    def _ensure_current(self) -> None:
+        """Sync new entries, if the store has been synced before and a sync is
+        due."""
+        with self._lock:
+            if time.time() - self._checked > self.refresh_interval and self.coverage is not None:
+                self.sync()
+
+    def entries_json(
+        self, begin: datetime | None = None, end: datetime | None = None, target_id: Any = None, obs_id: Any = None
+    ) -> str:
+        """JSON array of the stored entries overlapping `begin` to `end` (all
+        entries if not given), in time order, optionally only those with the
+        given target ID(s) or observation ID(s)."""
+        with self._lock, closing(self._connect()) as conn:
+            clauses = []
+            params: list[Any] = []
+            if end is not None:
+                clauses.append("begin < ?")
+                params.append(_seconds(end))
+            if begin is not None:
+                # Bound `begin` from below too, so that the primary key index
+                # is used to find entries that overlap the start of the range
+                longest = self._meta(conn).get("longest", 0.0)
+                clauses += ["begin >= ?", "(end IS NULL OR end > ?)"]
+                params += [_seconds(begin) - longest, _seconds(begin)]
+            for column, values in (("target_id", _as_list(target_id)), ("obs_id", _as_list(obs_id))):
+                if values is not None:
+                    clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+                    params.extend(values)
+            where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            query = f"SELECT body FROM entries{where} ORDER BY begin"
+            return "[" + ",".join(row[0] for row in conn.execute(query, params)) + "]"
+
+    def query(
+        self, begin: datetime | None = None, end: datetime | None = None, target_id: Any = None, obs_id: Any = None
+    ) -> list[dict[str, Any]]:
+        """Stored entries as JSON dicts, as returned by the API. See
+        `entries_json`."""
+        return json.loads(self.entries_json(begin, end, target_id, obs_id))
+
+    def columns(self, begin: datetime | None = None, end: datetime | None = None) -> dict[str, Any]:
+        """Stored entries overlapping `begin` to `end` (all entries if not
+        given) as a dict of NumPy arrays, one per field, as returned by
+        `SwiftAFST.columns`."""
+        # Imported here to avoid a circular import
+        from .obsquery import SwiftAFSTEntry
+
+        return build_columns(SwiftAFSTEntry, self.query(begin, end))
+
+    def clear(self) -> None:
+        """Remove all entries and the high-water mark."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM meta")
+
+
+# Local AFST mirror used by `SwiftAFST`, enabled with `afst_store.enable()`
+afst_store = AFSTStore()
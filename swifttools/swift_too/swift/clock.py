@@ -1,12 +1,18 @@
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from pydantic import AliasChoices, ConfigDict, Field, computed_field, model_validator
 
 from ..base.common import TOOAPIBaseclass
+from ..base.functions import utcnow
 from ..base.schemas import BaseSchema
 from ..base.status import TOOStatus
 from .datetime import swiftdatetime
+from .datetimeplan import DatetimeRefs
+
+# Clock corrections for times older than this are considered final, and may be
+# kept in the response cache indefinitely
+CLOCK_CACHE_MIN_AGE = timedelta(days=7)
 
 
 class SwiftDateTimeSchema(BaseSchema):
@@ -97,6 +103,12 @@ class SwiftClock(TOOAPIBaseclass, SwiftClockSchema):
     _schema = SwiftClockSchema
     _get_schema = SwiftClockGetSchema
     _endpoint = "/swift/clock"
+    _cache_ttl = None
+
+    if TYPE_CHECKING:
+        # Instances are created by TOOAPIBaseclass.__init__, which also takes
+        # the API credentials and `autosubmit`, not just the schema fields
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
 
     @staticmethod
     def _scalar_or_list(values: list[Any]) -> Any:
@@ -118,6 +130,70 @@ class SwiftClock(TOOAPIBaseclass, SwiftClockSchema):
     def _convert_entries_timebase(self, isutc: bool) -> list[swiftdatetime]:
         return [swiftdatetime.frommet(entry.met, utcf=entry.utcf, isutc=isutc) for entry in self.entries]
 
+    def _response_cache_ttl(self) -> float | None:
+        """Only cache clock corrections once they are final."""
+        if not self.entries:
+            return 0
+        cutoff = utcnow() - CLOCK_CACHE_MIN_AGE
+        if all(entry.utctime < cutoff for entry in self.entries):
+            return None
+        return 0
+
+    def _local_correction(self) -> bool:
+        """Fill in clock corrections from the local UTCF table, if it is
+        enabled and covers all of the requested times."""
+        # Imported here as numpy is slow to import
+        from .utcf import utcf_table
+
+        if not utcf_table.enabled:
+            return False
+        corrected = utcf_table.correct(met=self.met, swifttime=self.swifttime, utctime=self.utctime)
+        if corrected is None:
+            return False
+        isutc = self.met is None and self.swifttime is None
+        self._set_entries(
+            [swiftdatetime.frommet(met, utcf=utcf, isutc=isutc) for met, utcf in zip(*(c.tolist() for c in corrected))]
+        )
+        self._sync_values_from_entries()
+        self.status.status = "Accepted"
+        return True
+
+    def submit_get(self, refresh: bool = False) -> bool:
+        """Perform an API GET request to the server, unless the local UTCF
+        table can answer it.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and local UTCF table, and always fetch
+            from the server.
+        """
+        if not refresh and self._local_correction():
+            return True
+        return super().submit_get(refresh)
+
+    async def get(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request to the server, unless the
+        local UTCF table can answer it.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and local UTCF table, and always fetch
+            from the server.
+        """
+        if not refresh and self._local_correction():
+            return True
+        return await super().get(refresh)
+
+    def _submit_get_async(self) -> bool:
+        """Perform an API GET request for a queued request, unless the local
+        UTCF table can answer it."""
+        if self._local_correction():
+            object.__setattr__(self, "complete", True)
+            return True
+        return super()._submit_get_async()
+
     def _post_process(self) -> None:
         converted = [swiftdatetime.frommet(e.met, utcf=e.utcf, isutc=e.isutc) for e in self.entries]
         self._set_entries(converted)
@@ -261,50 +337,13 @@ class TOOAPIClockCorrect:
                 title += " (Swift)"
         return title
 
-    def clock_correct(self) -> None:
-        """
-        Recursively find all datetime values in a Pydantic model,
-        apply a transformation function to them, and replace them in place.
-
-        Args:
-            model: A Pydantic BaseModel instance.
-            transform_func: A function that takes a list[datetime] and returns list[datetime].
-
-        Returns:
-            The same model instance with updated datetime values.
-        """
-        if self._clock is None:
-            # Step 1: Collect all datetime references (paths + objects)
-            datetime_refs = []
-
-            def collect_datetimes(obj: Any, path: list[Any]):
-                if isinstance(obj, datetime):
-                    datetime_refs.append((path.copy(), obj))
-                elif isinstance(obj, BaseSchema):
-                    for field_name, value in obj.__dict__.items():
-                        collect_datetimes(value, path + [("model", field_name)])
-                elif isinstance(obj, list):
-                    for i, item in enumerate(obj):
-                        collect_datetimes(item, path + [("list", i)])
-                elif isinstance(obj, dict):
-                    for k, v in obj.items():
-                        collect_datetimes(v, path + [("dict", k)])
-
-            collect_datetimes(self, [])
-            self._datetime_refs = datetime_refs
-            # Step 2: Apply transformation
-            self._clock = Clock(swifttime=[dt for _, dt in datetime_refs])
-            self._clock.to_utctime()
-        else:
-            datetime_refs = self._datetime_refs
-
-        # Step 3: Replace them in place.
-        # Prefer explicit UTC values, which are swiftdatetime instances.
-        replacement_values = self._clock.entries
+    def _collect_datetime_refs(self) -> DatetimeRefs:
+        """Find all datetime values in this model, and where they are."""
+        return DatetimeRefs(self)
 
-        for (path, _), new_value in zip(datetime_refs, replacement_values):
-            if isinstance(new_value, SwiftDateTimeSchema):
-                new_value = new_value.utctime  # type: ignore[assignment]
+    def _replace_by_path(self, datetime_refs: list[tuple[list[Any], datetime]], values: list[Any]) -> None:
+        """Replace datetimes given as a list of (path, value) references."""
+        for (path, _), new_value in zip(datetime_refs, values):
             current = self
             for kind, key in path[:-1]:
                 if kind == "model":
@@ -325,3 +364,92 @@ class TOOAPIClockCorrect:
             elif kind == "dict":
                 assert isinstance(current, dict), f"Expected dict but got {type(current)}"
                 current[key] = new_value
+
+    def clock_correct(self) -> None:
+        """
+        Find all datetime values in a Pydantic model, clock correct them, and
+        replace them in place. The fields holding datetimes are found from
+        each schema's field types, computed once per class, and lists of
+        entries are handled a field at a time.
+        """
+        if self._clock is None:
+            # Step 1: Collect all datetime references
+            datetime_refs = self._collect_datetime_refs()
+            self._datetime_refs = datetime_refs
+            # Step 2: Apply transformation
+            self._clock = Clock(swifttime=datetime_refs.values)
+            self._clock.to_utctime()
+        else:
+            datetime_refs = self._datetime_refs
+
+        # Step 3: Replace them in place.
+        # Prefer explicit UTC values, which are swiftdatetime instances.
+        replacement_values = [
+            entry.utctime if isinstance(entry, SwiftDateTimeSchema) else entry for entry in self._clock.entries
+        ]
+        if isinstance(datetime_refs, DatetimeRefs):
+            datetime_refs.assign(replacement_values)
+        else:
+            self._replace_by_path(datetime_refs, replacement_values)
+        # Values were replaced without __setattr__, so drop any cached hash
+        if hasattr(self, "_invalidate_fingerprint"):
+            self._invalidate_fingerprint()
+
+
+def clock_correct_many(objs: list[TOOAPIClockCorrect], chunk_size: int | None = None) -> bool:
+    """Clock correct many results (e.g. `SAA`, `VisQuery` or `PlanQuery`)
+    together. The datetimes in all of the results are gathered, and each
+    distinct time is corrected once, in as few API requests as possible (or
+    from the local UTCF table if it covers them all), rather than with one
+    request per result. Equivalent to calling `clock_correct()` on each.
+
+    Parameters
+    ----------
+    objs : list
+        Results to clock correct.
+    chunk_size : int, optional
+        Maximum number of times sent in a single API request.
+
+    Returns
+    -------
+    bool
+        Were the clock corrections fetched successfully? If not, the results
+        are left uncorrected.
+    """
+    # Imported here as numpy is slow to import
+    from .clockarray import DEFAULT_CHUNK_SIZE, SwiftClockArray
+    from .utcf import utcf_table
+
+    pending = [obj for obj in objs if obj._clock is None]
+    refs = [obj._collect_datetime_refs() for obj in pending]
+
+    # Correct each distinct time once
+    index: dict[datetime, int] = {}
+    for datetime_refs in refs:
+        for dt in datetime_refs.values:
+            index.setdefault(dt, len(index))
+    unique = list(index)
+
+    if unique:
+        corrected = utcf_table.correct(swifttime=unique) if utcf_table.enabled else None
+        if corrected is None:
+            array = SwiftClockArray(swifttime=unique, chunk_size=chunk_size or DEFAULT_CHUNK_SIZE)
+            if not array.status or array.met is None or array.utcf is None:
+                return False
+            corrected = array.met, array.utcf
+        met, utcf = (values.tolist() for values in corrected)
+    else:
+        met, utcf = [], []
+
+    for obj, datetime_refs in zip(pending, refs):
+        clock = Clock(autosubmit=False)
+        positions = [index[dt] for dt in datetime_refs.values]
+        clock._set_entries([swiftdatetime.frommet(met[i], utcf=utcf[i], isutc=True) for i in positions])
+        clock._sync_values_from_entries()
+        clock.status.status = "Accepted"
+        obj._datetime_refs = datetime_refs
+        obj._clock = clock
+
+    for obj in objs:
+        obj.clock_correct()
+    return True
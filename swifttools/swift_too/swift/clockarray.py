@@ -0,0 +1,284 @@
+import asyncio
+from collections import deque
+from concurrent.futures import CancelledError
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ..base.batch import DEFAULT_MAX_CONCURRENCY
+from ..base.functions import utcnow
+from ..base.repr import TOOAPIReprMixin
+from ..base.status import TOOStatus
+from .clock import CLOCK_CACHE_MIN_AGE, SwiftClock
+from .datetime import swiftdatetime
+
+# Maximum number of times sent to the API in a single request, which keeps
+# request URLs to a safe length
+DEFAULT_CHUNK_SIZE = 400
+
+# Swift Mission Elapsed Time is measured from this epoch
+MET_EPOCH = np.datetime64("2001-01-01T00:00:00", "us")
+
+
+def met_to_datetime64(met: np.ndarray, utcf: np.ndarray | float = 0.0) -> np.ndarray:
+    """Convert MET (seconds) to `datetime64[us]`, optionally applying a UTCF
+    correction (seconds). Equivalent to `swiftdatetime.frommet`."""
+    microseconds = np.round((np.asarray(met, dtype=float) + utcf) * 1e6)
+    return MET_EPOCH + microseconds.astype("timedelta64[us]")
+
+
+def _as_met(values: Any) -> np.ndarray:
+    return np.atleast_1d(np.asarray(values, dtype=float))
+
+
+def _as_datetime64(values: Any, utc: bool) -> np.ndarray:
+    """Convert datetimes, `datetime64` or astropy `Time` values to an array of
+    `datetime64[us]`."""
+    if hasattr(values, "datetime64"):
+        # astropy Time
+        values = values.utc.datetime64 if utc else values.datetime64
+    return np.atleast_1d(np.asarray(values, dtype="datetime64[us]"))
+
+
+class _SwiftClockChunk(SwiftClock):
+    """`SwiftClock` request for one chunk of a `SwiftClockArray`. The response
+    is parsed directly into arrays, rather than one `swiftdatetime` per
+    entry."""
+
+    # Request arguments, and the parsed response
+    _args: dict[str, list[Any]]
+    _met: np.ndarray
+    _utcf: np.ndarray
+
+    if TYPE_CHECKING:
+        # See SwiftClock.__init__
+        def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+
+    def _build_get_args(self) -> dict[str, Any]:
+        return dict(getattr(self, "_args", {}))
+
+    def _local_correction(self) -> bool:
+        # Always ask the API, as chunks are also used to build the local UTCF
+        # table
+        return False
+
+    def _normalize_response_payload(self, payload: Any) -> Any:  # type: ignore[override]
+        payload = super()._normalize_response_payload(payload)
+        if not isinstance(payload, dict) or "entries" not in payload:
+            return payload
+        entries = payload["entries"] or []
+        count = len(entries)
+        object.__setattr__(self, "_met", np.fromiter((entry["met"] for entry in entries), float, count))
+        object.__setattr__(self, "_utcf", np.fromiter((entry["utcf"] for entry in entries), float, count))
+        return {key: value for key, value in payload.items() if key == "status"}
+
+    def _post_process(self) -> None:
+        pass
+
+    def _response_cache_ttl(self) -> float | None:
+        """Only cache clock corrections once they are final."""
+        met = getattr(self, "_met", None)
+        if met is None or len(met) == 0:
+            return 0
+        cutoff = np.datetime64(utcnow() - CLOCK_CACHE_MIN_AGE, "us")
+        if np.all(met_to_datetime64(met, self._utcf) < cutoff):
+            return None
+        return 0
+
+
+class SwiftClockArray(TOOAPIReprMixin):
+    """Clock corrections for arrays of times, e.g. event times from a BAT or
+    XRT pipeline. Takes a NumPy array of MET values, or of Swift or UTC times
+    (`datetime64`, astropy `Time` or a list of `datetime`), and returns
+    columns of `met`, `utcf`, `swifttime` and `utctime` as NumPy arrays,
+    without creating a Python object for each time.
+
+    Large inputs are split into chunks of `chunk_size` times, which are
+    requested from the API concurrently, at most `max_concurrency` at once.
+
+    Attributes
+    ----------
+    met : np.ndarray
+        Mission Elapsed Time (seconds), as measured by Swift's clock.
+    utcf : np.ndarray
+        Universal Time Correction Factor (seconds).
+    swifttime : np.ndarray
+        Spacecraft time as `datetime64[us]`, not corrected for leap seconds
+        or clock drift.
+    utctime : np.ndarray
+        Universal Time as `datetime64[us]`, corrected for clock drift and
+        leap seconds.
+    status : TOOStatus
+        Status of API request
+    chunk_size : int
+        Maximum number of times sent in a single API request.
+    max_concurrency : int
+        Maximum number of chunks requested at once.
+    username : str (default 'anonymous')
+        TOO API username.
+    """
+
+    def __init__(
+        self,
+        met: Any = None,
+        utctime: Any = None,
+        swifttime: Any = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        username: str = "anonymous",
+        shared_secret: str = "anonymous",
+        autosubmit: bool = True,
+    ):
+        provided = [
+            name for name, value in (("met", met), ("utctime", utctime), ("swifttime", swifttime)) if value is not None
+        ]
+        if len(provided) != 1:
+            raise ValueError("Exactly one of 'met', 'utctime', or 'swifttime' must be provided")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._input = provided[0]
+        if met is not None:
+            self._values = _as_met(met)
+        else:
+            self._values = _as_datetime64(utctime if utctime is not None else swifttime, utc=utctime is not None)
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.username = username
+        self.shared_secret = shared_secret
+        self.status = TOOStatus()
+        self.met: np.ndarray | None = None
+        self.utcf: np.ndarray | None = None
+        self.swifttime: np.ndarray | None = None
+        self.utctime: np.ndarray | None = None
+        if autosubmit:
+            self.submit()
+
+    def _chunks(self) -> list[_SwiftClockChunk]:
+        """One `SwiftClock` request per chunk of input values."""
+        chunks = []
+        for start in range(0, len(self._values), self.chunk_size):
+            values = self._values[start : start + self.chunk_size]
+            if self._input == "met":
+                args = values.tolist()
+            else:
+                args = np.datetime_as_string(values, unit="us").tolist()
+            chunk = _SwiftClockChunk(username=self.username, shared_secret=self.shared_secret, autosubmit=False)
+            object.__setattr__(chunk, "_args", {self._input: args})
+            chunks.append(chunk)
+        return chunks
+
+    def _collect(self, chunks: list[_SwiftClockChunk], results: list[bool]) -> bool:
+        """Combine the results of each chunk into columns."""
+        for i, (chunk, result) in enumerate(zip(chunks, results)):
+            met = getattr(chunk, "_met", None)
+            if not result or met is None:
+                errors = chunk.status.errors or ["Request failed"]
+                for error in errors:
+                    self.status.error(f"Chunk {i}: {error}")
+            elif len(met) != len(chunk._args[self._input]):
+                self.status.error(f"Chunk {i}: expected {len(chunk._args[self._input])} times, got {len(met)}")
+        if self.status.errors:
+            return False
+
+        self.met = np.concatenate([chunk._met for chunk in chunks]) if chunks else np.array([], dtype=float)
+        self.utcf = np.concatenate([chunk._utcf for chunk in chunks]) if chunks else np.array([], dtype=float)
+        self.swifttime = met_to_datetime64(self.met)
+        self.utctime = met_to_datetime64(self.met, self.utcf)
+        self.status.status = "Accepted"
+        return True
+
+    def submit(self) -> bool:
+        """Request clock corrections for all times, blocking until all chunks
+        have completed.
+
+        Returns
+        -------
+        bool
+            Were all requests successful?
+        """
+        chunks = self._chunks()
+        if len(chunks) == 1:
+            results = [chunks[0].submit_get()]
+        else:
+            # Run chunks concurrently on the shared worker pool. Only
+            # `max_concurrency` are queued at once, as the timeout of a queued
+            # request starts when it is queued, not when it is sent.
+            results = []
+            in_flight: deque = deque()
+            for chunk in chunks:
+                if len(in_flight) >= self.max_concurrency:
+                    results.append(self._wait(*in_flight.popleft()))
+                in_flight.append((chunk, chunk._start_async_submission(chunk._submit_get_async)))
+            while in_flight:
+                results.append(self._wait(*in_flight.popleft()))
+        return self._collect(chunks, results)
+
+    @staticmethod
+    def _wait(chunk: _SwiftClockChunk, job: Any) -> bool:
+        """Wait for the queued request of a chunk to complete."""
+        try:
+            return job.result()
+        except (TimeoutError, CancelledError) as e:
+            chunk.status.error(f"Request failed: {type(e).__name__}")
+            return False
+
+    async def get(self) -> bool:
+        """Asynchronously request clock corrections for all times.
+
+        Returns
+        -------
+        bool
+            Were all requests successful?
+        """
+        chunks = self._chunks()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(chunk: _SwiftClockChunk) -> bool:
+            async with semaphore:
+                return await chunk.get()
+
+        results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return self._collect(chunks, list(results))
+
+    def to_swiftclock(self) -> SwiftClock:
+        """Convert to a `SwiftClock`, with one `swiftdatetime` per entry."""
+        clock = SwiftClock(username=self.username, shared_secret=self.shared_secret, autosubmit=False)
+        if self.met is not None:
+            clock._set_entries(
+                [
+                    swiftdatetime.frommet(met, utcf=utcf, isutc=True)
+                    for met, utcf in zip(self.met.tolist(), self.utcf.tolist())  # type: ignore[union-attr]
+                ]
+            )
+            clock._sync_values_from_entries()
+            clock.status.status = self.status.status
+        return clock
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> tuple[float, float, datetime, datetime]:
+        assert self.met is not None, "Clock corrections have not been fetched."
+        return (
+            float(self.met[index]),
+            float(self.utcf[index]),  # type: ignore[index]
+            self.swifttime[index].item(),  # type: ignore[index]
+            self.utctime[index].item(),  # type: ignore[index]
+        )
+
+    @property
+    def _table(self) -> tuple[list[str], list[list[Any]]]:
+        if self.met is None:
+            return [], []
+        header = ["MET (s)", "Swift Time", "UTC Time", "UTCF (s)"]
+        return header, [[met, swift, utc, utcf] for met, utcf, swift, utc in (self[i] for i in range(len(self)))]
+
+    def __repr__(self) -> str:
+        return f"SwiftClockArray({self._input}=<{len(self)} values>, chunk_size={self.chunk_size})"
+
+
+ClockArray = SwiftClockArray
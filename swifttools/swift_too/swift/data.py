@@ -3,13 +3,8 @@ import warnings
 from fnmatch import fnmatch
 from typing import Any
 
-import boto3  # type: ignore[import-untyped]
-import boto3.session  # type: ignore[import-untyped]
 import httpx
-from botocore import UNSIGNED  # type: ignore[import-untyped]
-from botocore.client import BaseClient, Config  # type: ignore[import-untyped]
 from pydantic import Field
-from tqdm.auto import tqdm
 
 from ..base.common import TOOAPIBaseclass
 from ..base.repr import TOOAPIReprMixin
@@ -66,6 +61,8 @@ class SwiftDataFile(BaseSchema, TOOAPIReprMixin):
             key_name = self.url.replace("https://heasarc.gsfc.nasa.gov/FTP/", "")
             s3.download_file("nasa-heasarc", key_name, fullfilepath)
         else:
+            from tqdm.auto import tqdm
+
             try:
                 response_ctx = httpx.stream("GET", self.url, follow_redirects=True)
                 with response_ctx as response:
@@ -199,7 +196,8 @@ class SwiftData(TOOAPIBaseclass, SwiftDataSchema):
     match: str | list[str] | None = None
     quiet: bool = False
     aws: bool = False
-    _s3: BaseClient | None = None
+    # boto3 S3 client, created when needed as boto3 is slow to import
+    _s3: Any = None
 
     def __getitem__(self, i):
         if len(self.entries) == 0:
@@ -237,6 +235,10 @@ class SwiftData(TOOAPIBaseclass, SwiftDataSchema):
         # Set up S3 client if needed
         if not self.uksdc and not self.itsdc and self.aws is True:
             # Set up S3 stuff
+            import boto3  # type: ignore[import-untyped]
+            from botocore import UNSIGNED  # type: ignore[import-untyped]
+            from botocore.client import Config  # type: ignore[import-untyped]
+
             config = Config(
                 connect_timeout=5,
                 retries={"max_attempts": 0},
@@ -292,6 +294,8 @@ class SwiftData(TOOAPIBaseclass, SwiftDataSchema):
         if self.quiet:
             dfiles = self.entries
         else:
+            from tqdm.auto import tqdm
+
             dfiles = tqdm(self.entries, desc="Downloading files", unit="files")
         for dfile in dfiles:
             # Don't re-download a file unless clobber=True
@@ -1,14 +1,29 @@
 from datetime import datetime, timedelta
 
 
+def _restore(state: bytes, utcf: float | None, isutc: bool) -> "swiftdatetime":
+    """Unpickle a swiftdatetime."""
+    value = swiftdatetime(state)
+    value.utcf = utcf
+    value._isutc = isutc
+    return value
+
+
 class swiftdatetime(datetime):
-    """Extend datetime to store met, utcf and swifttime. Default value is UTC"""
+    """Extend datetime to store met, utcf and swifttime. Default value is UTC.
+
+    Instances use `__slots__` rather than an instance `__dict__`, and the
+    Swift and UTC times are calculated when accessed rather than stored, as
+    results can hold many thousands of them."""
+
+    __slots__ = ("_utctime", "_swifttime", "_met", "utcf", "_isutc", "_isutc_set")
 
     _utctime: datetime | None
     _swifttime: datetime | None
     _met: float | None
-    _utcf: float | None
+    utcf: float | None
     _isutc: bool
+    _isutc_set: bool
 
     def __new__(self, *args, **kwargs):
         return super().__new__(self, *args)
@@ -25,6 +40,10 @@ class swiftdatetime(datetime):
         for key in kwargs.keys():
             setattr(self, key, kwargs[key])
 
+    def __reduce_ex__(self, protocol):
+        # Preserve the time base and UTCF when pickled or copied
+        return _restore, (datetime.__reduce__(self)[1][0], self.utcf, self._isutc)
+
     def __repr__(self):
         return f"swiftdatetime({self.year}, {self.month}, {self.day}, {self.hour}, {self.minute}, {self.second}, {self.microsecond}, isutc={self.isutc}, utcf={self.utcf})"
 
@@ -83,20 +102,23 @@ class swiftdatetime(datetime):
 
     @property
     def utctime(self) -> datetime | None:
-        if self._utctime is None:
-            if self.isutc:
-                self._utctime = datetime(
-                    self.year,
-                    self.month,
-                    self.day,
-                    self.hour,
-                    self.minute,
-                    self.second,
-                    self.microsecond,
-                )
-            elif self.utcf is not None and self.swifttime is not None:
-                self._utctime = self.swifttime + timedelta(seconds=self.utcf)
-        return self._utctime
+        if self._utctime is not None:
+            return self._utctime
+        if self._isutc:
+            return datetime(
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                self.microsecond,
+            )
+        if self.utcf is not None:
+            swifttime = self.swifttime
+            if swifttime is not None:
+                return swifttime + timedelta(seconds=self.utcf)
+        return None
 
     @utctime.setter
     def utctime(self, utc):
@@ -116,20 +138,23 @@ class swiftdatetime(datetime):
 
     @property
     def swifttime(self) -> datetime | None:
-        if self._swifttime is None:
-            if not self.isutc:
-                self._swifttime = datetime(
-                    self.year,
-                    self.month,
-                    self.day,
-                    self.hour,
-                    self.minute,
-                    self.second,
-                    self.microsecond,
-                )
-            elif self.utcf is not None and self.utctime is not None:
-                self._swifttime = self.utctime - timedelta(seconds=self.utcf)
-        return self._swifttime
+        if self._swifttime is not None:
+            return self._swifttime
+        if not self._isutc:
+            return datetime(
+                self.year,
+                self.month,
+                self.day,
+                self.hour,
+                self.minute,
+                self.second,
+                self.microsecond,
+            )
+        if self.utcf is not None:
+            utctime = self.utctime
+            if utctime is not None:
+                return utctime - timedelta(seconds=self.utcf)
+        return None
 
     @swifttime.setter
     def swifttime(self, st):
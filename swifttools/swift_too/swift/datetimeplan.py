@@ -0,0 +1,190 @@
+import types
+from datetime import datetime
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
+
+from ..base.schemas import BaseSchema
+
+# Kinds of field, derived from their type annotations
+_DATETIME = "datetime"
+_MODEL = "model"
+_LIST = "list"
+_DYNAMIC = "dynamic"
+
+# Containers that are searched for datetimes
+_CONTAINER_TYPES = (list, dict)
+
+# Ways to replace a group of datetimes
+_ATTRIBUTE = 0
+_ITEM = 1
+
+# Cache of field plans by class
+_plans: dict[type, tuple[tuple[tuple[str, Any], ...], frozenset[str]]] = {}
+
+
+def _field_kind(annotation: Any) -> Any:
+    """Kind of value a field holds, based on its type annotation: None if it
+    cannot hold a datetime, `_DATETIME`, `_MODEL`, `(_LIST, kind)`, or
+    `_DYNAMIC` if it has to be searched at runtime."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _field_kind(get_args(annotation)[0])
+    if origin is Literal:
+        return None
+    if origin is Union or origin is types.UnionType:
+        kinds = {_field_kind(arg) for arg in get_args(annotation)} - {None}
+        if len(kinds) > 1:
+            return _DYNAMIC
+        return kinds.pop() if kinds else None
+    if origin is list:
+        args = get_args(annotation)
+        kind = _field_kind(args[0]) if args else _DYNAMIC
+        return (_LIST, kind) if kind is not None else None
+    if isinstance(annotation, type) and origin is None and annotation is not Any:
+        if issubclass(annotation, datetime):
+            return _DATETIME
+        if issubclass(annotation, BaseSchema):
+            return _MODEL
+        if annotation is not object and not issubclass(annotation, _CONTAINER_TYPES):
+            # Other types (numbers, strings, SkyCoord, ...) are not searched
+            return None
+    return _DYNAMIC
+
+
+def _plan(cls: type) -> tuple[tuple[tuple[str, Any], ...], frozenset[str]]:
+    """Fields of a schema that may hold datetimes, with the kind of value each
+    holds, and the names of all fields. Computed once per class."""
+    plan = _plans.get(cls)
+    if plan is None:
+        fields = getattr(cls, "model_fields", {})
+        kinds = ((name, _field_kind(field.annotation)) for name, field in fields.items())
+        plan = tuple((name, kind) for name, kind in kinds if kind is not None), frozenset(fields)
+        _plans[cls] = plan
+    return plan
+
+
+class DatetimeRefs:
+    """Locations of all datetimes found in an object, so that they can be
+    replaced in place. Datetimes in lists of entries are grouped by field,
+    so that they are found and replaced a column at a time.
+
+    Attributes
+    ----------
+    values : list
+        The datetimes found, in the order they are replaced by `assign`.
+    """
+
+    def __init__(self, obj: Any = None):
+        self.values: list[datetime] = []
+        # (how, container(s), key(s)) for each group of values
+        self._groups: list[tuple[int, Any, Any]] = []
+        if obj is not None:
+            self._collect(obj)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def assign(self, values: list[Any]) -> None:
+        """Replace the datetimes with `values`, given in the same order as
+        `self.values`."""
+        start = 0
+        for how, containers, keys in self._groups:
+            if start >= len(values):
+                break
+            if how == _ATTRIBUTE:
+                # Set directly, so that validate-assignment doesn't coerce the
+                # new values
+                for obj, value in zip(containers, values[start : start + len(containers)]):
+                    obj.__dict__[keys] = value
+                start += len(containers)
+            else:
+                for key, value in zip(keys, values[start : start + len(keys)]):
+                    containers[key] = value
+                start += len(keys)
+
+    def _add_attribute(self, objs: list[Any], name: str, values: list[datetime]) -> None:
+        self._groups.append((_ATTRIBUTE, objs, name))
+        self.values.extend(values)
+
+    def _add_item(self, container: Any, key: Any, value: datetime) -> None:
+        self._groups.append((_ITEM, container, [key]))
+        self.values.append(value)
+
+    def _collect(self, obj: Any) -> None:
+        if isinstance(obj, BaseSchema):
+            self._collect_models([obj])
+        else:
+            self._collect_dynamic(obj)
+
+    def _collect_models(self, models: list[BaseSchema]) -> None:
+        """Collect datetimes from a list of schemas of one type, a field at a
+        time."""
+        fields, names = _plan(type(models[0]))
+        for name, kind in fields:
+            column: list[Any] = [model.__dict__.get(name) for model in models]
+            if kind is _DATETIME:
+                objs = [model for model, value in zip(models, column) if isinstance(value, datetime)]
+                if len(objs) < len(models):
+                    column = [value for value in column if isinstance(value, datetime)]
+                if objs:
+                    self._add_attribute(objs, name, column)
+            else:
+                for model, value in zip(models, column):
+                    if value is not None:
+                        self._collect_field(model, name, value, kind)
+
+        # Also search any other public attributes set on the instances
+        for model in models:
+            if len(model.__dict__) > len(names):
+                for name, value in model.__dict__.items():
+                    if name not in names and not name.startswith("_"):
+                        self._collect_field(model, name, value, _DYNAMIC)
+
+    def _collect_field(self, model: BaseSchema, name: str, value: Any, kind: Any) -> None:
+        if isinstance(value, datetime):
+            self._add_attribute([model], name, [value])
+        elif isinstance(value, BaseSchema):
+            self._collect_models([value])
+        elif isinstance(value, list) and isinstance(kind, tuple):
+            self._collect_list(value, kind[1])
+        else:
+            self._collect_dynamic(value)
+
+    def _collect_list(self, items: list[Any], kind: Any) -> None:
+        if kind is _MODEL:
+            # Group entries by type, which is normally just one
+            by_type: dict[type, list[BaseSchema]] = {}
+            others = []
+            for i, item in enumerate(items):
+                if isinstance(item, BaseSchema):
+                    by_type.setdefault(type(item), []).append(item)
+                else:
+                    others.append(i)
+            for models in by_type.values():
+                self._collect_models(models)
+            for i in others:
+                self._collect_dynamic(items[i], items, i)
+        elif kind is _DATETIME:
+            keys = [i for i, item in enumerate(items) if isinstance(item, datetime)]
+            if keys:
+                self._groups.append((_ITEM, items, keys))
+                self.values.extend(items[i] for i in keys)
+        else:
+            for i, item in enumerate(items):
+                self._collect_dynamic(item, items, i)
+
+    def _collect_dynamic(self, obj: Any, container: Any = None, key: Any = None) -> None:
+        """Search a value of unknown type for datetimes."""
+        if isinstance(obj, datetime):
+            if container is not None:
+                self._add_item(container, key, obj)
+        elif isinstance(obj, BaseSchema):
+            self._collect_models([obj])
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                self._collect_dynamic(item, obj, i)
+        elif isinstance(obj, dict):
+            for k, v in obj.items():
+                self._collect_dynamic(v, obj, k)
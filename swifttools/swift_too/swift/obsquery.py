@@ -2,9 +2,11 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 from typing import Any
 
+import httpx
 from pydantic import BaseModel, ConfigDict, computed_field, model_validator
 
 from ..base.back_compat import TOOAPIBackCompat
+from ..base.columnar import TOOAPIColumnar
 from ..base.common import TOOAPIBaseclass
 from ..base.repr import TOOAPIReprMixin
 from ..base.schemas import (
@@ -16,6 +18,7 @@ from ..base.schemas import (
     OptionalBeginEndLengthSchema,
     OptionalCoordinateSchema,
 )
+from ..base.shards import TOOAPISharded
 from ..base.status import TOOStatus
 from .clock import SwiftDateTimeSchema, TOOAPIClockCorrect
 from .data import TOOAPIDownloadData
@@ -232,14 +235,24 @@ class SwiftObservation(TOOAPIBaseclass, TOOAPIDownloadData, TOOAPIBackCompat, Ba
     def __getitem__(self, index: int) -> SwiftAFSTEntry:
         return self.entries[index]
 
+    def __setitem__(self, index: int, value: SwiftAFSTEntry) -> None:
+        self.entries[index] = value
+        self._invalidate_fingerprint()
+
     def __len__(self) -> int:
         return len(self.entries)
 
     def append(self, value: SwiftAFSTEntry) -> None:
         self.entries.append(value)
+        self._invalidate_fingerprint()
 
     def extend(self, value: list[SwiftAFSTEntry]) -> None:
         self.entries.extend(value)
+        self._invalidate_fingerprint()
+
+    def _invalidate_fingerprint(self) -> None:
+        super()._invalidate_fingerprint()
+        self.__dict__.pop("_aggregate_cache", None)
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -287,47 +300,56 @@ class SwiftObservation(TOOAPIBaseclass, TOOAPIDownloadData, TOOAPIBackCompat, Ba
             return self.entries[0].dec_object
         return None
 
+    def _aggregates(self) -> dict[str, Any]:
+        """Exposure, slew time, begin and end of the observation, calculated
+        in one pass over the snapshots on first use, and cached until the
+        snapshots change."""
+        cached = self.__dict__.get("_aggregate_cache")
+        if cached is not None and cached[0] == id(self):
+            return cached[1]
+
+        exposure = slewtime = 0
+        first = last = None
+        for entry in self.entries:
+            begin, settle, end = entry.begin, entry.settle, entry.end
+            if settle is not None:
+                if end is not None:
+                    exposure += int((end - settle).total_seconds())
+                if begin is not None:
+                    slewtime += int((settle - begin).total_seconds())
+            if begin is not None and (first is None or begin < first):
+                first = begin
+            if end is not None and (last is None or end > last):
+                last = end
+        aggregates = {
+            "exposure": timedelta(seconds=exposure) if exposure > 0 else None,
+            "slewtime": timedelta(seconds=slewtime) if slewtime > 0 else None,
+            "begin": first,
+            "end": last,
+        }
+        # Keyed on id(self), as copies of the model share its __dict__ values
+        object.__setattr__(self, "_aggregate_cache", (id(self), aggregates))
+        return aggregates
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def exposure(self) -> timedelta | None:  # Updated return type to Optional[timedelta]
-        if len(self.entries) == 0:
-            return None
-        total_seconds = sum(
-            [
-                int((e.end - e.settle).total_seconds())
-                for e in self.entries
-                if e.end is not None and e.settle is not None
-            ]
-        )
-        return timedelta(seconds=total_seconds) if total_seconds > 0 else None
+        return self._aggregates()["exposure"]
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def slewtime(self) -> timedelta | None:  # Updated return type to Optional[timedelta>
-        if len(self.entries) == 0:
-            return None
-        total_seconds = sum(
-            [
-                int((e.settle - e.begin).total_seconds())
-                for e in self.entries
-                if e.begin is not None and e.settle is not None
-            ]
-        )
-        return timedelta(seconds=total_seconds) if total_seconds > 0 else None
+        return self._aggregates()["slewtime"]
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def begin(self) -> datetime | None:  # Updated return type to Optional[datetime]
-        if len(self.entries) == 0:
-            return None
-        return min([q.begin for q in self.entries if q.begin is not None])
+        return self._aggregates()["begin"]
 
     @computed_field  # type: ignore[prop-decorator]
     @property
     def end(self) -> datetime | None:  # Updated return type to Optional[datetime]
-        if len(self.entries) == 0:
-            return None
-        return max([q.end for q in self.entries if q.end is not None])
+        return self._aggregates()["end"]
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -392,7 +414,54 @@ class SwiftObservations(dict, TOOAPIBaseclass):  # type: ignore[misc]
         return header, [self[obsid]._table[1][0] for obsid in self.keys()]
 
 
+class TOOAPIObservations:
+    """Mixin for timelines (e.g. AFST or PPST), which groups `entries` into
+    observations by observation ID. The grouping is built in one pass on
+    first use, and cached until the entries change (are replaced, appended
+    to, fetched again or clock corrected)."""
+
+    @property
+    def observations(self) -> SwiftObservations:
+        """Entries grouped into a `SwiftObservation` per observation ID."""
+        cached = self.__dict__.get("_observation_cache")
+        if cached is not None and cached[0] == id(self):
+            return cached[1]
+
+        groups: dict[Any, list[Any]] = {}
+        for entry in self.entries:  # type: ignore[attr-defined]
+            group = groups.get(entry.obs_id)
+            if group is None:
+                group = groups[entry.obs_id] = []
+            group.append(entry)
+        observations = SwiftObservations()
+        for obs_id, group in groups.items():
+            observation = SwiftObservation()
+            observation.extend(group)
+            observations[obs_id] = observation
+        object.__setattr__(self, "_observation_cache", (id(self), observations))
+        return observations
+
+    def _invalidate_fingerprint(self) -> None:
+        super()._invalidate_fingerprint()  # type: ignore[misc]
+        self.__dict__.pop("_observation_cache", None)
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self.entries[index] = value  # type: ignore[attr-defined]
+        self._invalidate_fingerprint()
+
+    def append(self, value: Any) -> None:
+        self.entries.append(value)  # type: ignore[attr-defined]
+        self._invalidate_fingerprint()
+
+    def extend(self, value: list[Any]) -> None:
+        self.entries.extend(value)  # type: ignore[attr-defined]
+        self._invalidate_fingerprint()
+
+
 class SwiftAFST(
+    TOOAPIColumnar,
+    TOOAPISharded,
+    TOOAPIObservations,
     TOOAPIBaseclass,
     TOOAPIAutoResolve,
     TOOAPIClockCorrect,
@@ -440,8 +509,8 @@ class SwiftAFST(
     _schema = SwiftAFSTSchema
     _get_schema = SwiftAFSTGetSchema
 
-    # Observations
-    _observations = SwiftObservations()
+    # Completed AFST queries can be cached (see `_response_cache_ttl`)
+    _cache_ttl = None
 
     # Local variables
     _local = ["obsid", "name", "skycoord", "length", "target_id", "shared_secret"]
@@ -462,13 +531,66 @@ class SwiftAFST(
         """API name for the class."""
         return "Swift_AFST"
 
-    @property
-    def observations(self) -> SwiftObservations:
-        if len(self.entries) > 0 and len(self._observations.keys()) == 0:
-            for q in self.entries:
-                self._observations[q.obs_id] = SwiftObservation()
-            _ = [self._observations[q.obs_id].append(q) for q in self.entries]
-        return self._observations
+    def _response_cache_ttl(self) -> float | None:
+        """Only cache queries for time ranges that are entirely in the past,
+        as the timeline up to `afstmax` will not change."""
+        if self.end is None or not isinstance(self.afstmax, datetime):
+            return 0
+        if self.end.replace(tzinfo=None) <= self.afstmax.replace(tzinfo=None):
+            return None
+        return 0
+
+    def _local_query(self) -> bool:
+        """Answer the query from the local AFST mirror, if it is enabled and
+        covers the requested time range. Searches by coordinates are always
+        sent to the API."""
+        # Imported here to avoid a circular import
+        from .afststore import afst_store
+
+        if not afst_store.enabled or self.begin is None or self.end is None or self.ra is not None:
+            return False
+        if not afst_store.covers(self.begin, self.end):
+            return False
+        entries = afst_store.entries_json(self.begin, self.end, self.target_id, self.obs_id)
+        afstmax = afst_store.coverage[1].isoformat()  # type: ignore[index]
+        content = f'{{"entries":{entries},"afstmax":"{afstmax}","status":{{"status":"Accepted"}}}}'
+        return self._handle_response(httpx.Response(200, content=content.encode()))
+
+    def submit_get(self, refresh: bool = False) -> bool:
+        """Perform an API GET request to the server, unless the local AFST
+        mirror can answer it.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and local AFST mirror, and always fetch
+            from the server.
+        """
+        if not refresh and self._local_query():
+            return True
+        return super().submit_get(refresh)
+
+    async def get(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request to the server, unless the
+        local AFST mirror can answer it.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and local AFST mirror, and always fetch
+            from the server.
+        """
+        if not refresh and self._local_query():
+            return True
+        return await super().get(refresh)
+
+    def _submit_get_async(self) -> bool:
+        """Perform an API GET request for a queued request, unless the local
+        AFST mirror can answer it."""
+        if self._local_query():
+            object.__setattr__(self, "complete", True)
+            return True
+        return super()._submit_get_async()
 
     def __getitem__(self, index: int) -> SwiftAFSTEntry:
         return self.entries[index]
@@ -479,9 +601,6 @@ class SwiftAFST(
     def __iter__(self) -> Generator:
         yield from self.entries
 
-    def append(self, value: SwiftAFSTEntry) -> None:
-        self.entries.append(value)
-
 
 # Alias names for class for better PEP8 and future compat
 Swift_ObsQuery = SwiftAFST
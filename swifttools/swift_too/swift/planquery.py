@@ -3,13 +3,15 @@ from datetime import datetime
 from pydantic import ConfigDict, Field, model_validator
 
 from ..base.back_compat import TOOAPIBackCompat
+from ..base.columnar import TOOAPIColumnar
 from ..base.common import TOOAPIBaseclass
 from ..base.repr import TOOAPIReprMixin
 from ..base.schemas import AstropyAngle, BaseSchema, OptionalBeginEndLengthSchema, OptionalCoordinateSchema
+from ..base.shards import TOOAPISharded
 from ..base.status import TOOStatus
 from .clock import TOOAPIClockCorrect
 from .data import TOOAPIDownloadData
-from .obsquery import SwiftObservation, SwiftObservations
+from .obsquery import TOOAPIObservations
 from .resolve import TOOAPIAutoResolve
 from .schemas import ObsIDSDC
 
@@ -128,7 +130,15 @@ class SwiftPPSTSchema(OptionalBeginEndLengthSchema, OptionalCoordinateSchema):
 
 
 class SwiftPPST(
-    TOOAPIBaseclass, TOOAPIDownloadData, TOOAPIAutoResolve, TOOAPIClockCorrect, SwiftPPSTSchema, TOOAPIBackCompat
+    TOOAPIColumnar,
+    TOOAPISharded,
+    TOOAPIObservations,
+    TOOAPIBaseclass,
+    TOOAPIDownloadData,
+    TOOAPIAutoResolve,
+    TOOAPIClockCorrect,
+    SwiftPPSTSchema,
+    TOOAPIBackCompat,
 ):
     """Class to fetch Swift Pre-Planned Science Timeline (PPST) for given
     constraints. Essentially this will return what Swift was planned to observe
@@ -169,9 +179,6 @@ class SwiftPPST(
     _isutc = False
     _local = ["obsid", "name", "skycoord", "length", "target_id", "shared_secret"]
 
-    # Observations
-    _observations = SwiftObservations()
-
     @property
     def _table(self):
         if len(self.entries) > 0:
@@ -180,14 +187,6 @@ class SwiftPPST(
             header = []
         return header, [ppt._table[1][0] for ppt in self.entries]
 
-    @property
-    def observations(self):
-        if len(self.entries) > 0 and len(self._observations.keys()) == 0:
-            for q in self.entries:
-                self._observations[q.obs_id] = SwiftObservation()
-            _ = [self._observations[q.obs_id].append(q) for q in self.entries]
-        return self._observations
-
     def __getitem__(self, index):
         return self.entries[index]
 
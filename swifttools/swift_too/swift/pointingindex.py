@@ -0,0 +1,170 @@
+from typing import Any
+
+import numpy as np
+
+# Default search radius (degrees), as used by `ObsQuery` and `PlanQuery`
+DEFAULT_RADIUS = 12 / 60
+# Default height of the declination bands the index is divided into (degrees)
+DEFAULT_BAND_HEIGHT = 1.0
+# Maximum number of positions searched at once, which bounds memory use
+DEFAULT_QUERY_CHUNK = 4096
+
+
+def _unit_vectors(ra: np.ndarray, dec: np.ndarray) -> np.ndarray:
+    ra, dec = np.radians(ra), np.radians(dec)
+    cos_dec = np.cos(dec)
+    return np.stack([cos_dec * np.cos(ra), cos_dec * np.sin(ra), np.sin(dec)], axis=-1)
+
+
+class PointingIndex:
+    """Spatial index of Swift pointings, e.g. the entries of an `ObsQuery`
+    (AFST) or `PlanQuery` (PPST), for cone searches of many positions at once
+    without an API request per position.
+
+    Pointings are sorted into declination bands, and by RA within each band,
+    so that the pointings near each position are found by binary search. Their
+    distances are then calculated from unit vectors, for all positions at
+    once.
+
+    Parameters
+    ----------
+    columns : dict
+        Pointings as a dict of NumPy arrays, including `ra` and `dec`
+        (degrees), e.g. `SwiftAFST.columns`. Pointings without coordinates
+        are ignored.
+    band_height : float
+        Height of each declination band (degrees).
+
+    Attributes
+    ----------
+    columns : dict
+        The pointings. Searches return indices into these arrays.
+    """
+
+    def __init__(self, columns: dict[str, Any], band_height: float = DEFAULT_BAND_HEIGHT):
+        if band_height <= 0:
+            raise ValueError("band_height must be positive")
+        self.columns = columns
+        self.band_height = band_height
+
+        ra = np.asarray(columns["ra"], dtype=float)
+        dec = np.asarray(columns["dec"], dtype=float)
+        rows = np.flatnonzero(np.isfinite(ra) & np.isfinite(dec))
+        key = self._band(dec[rows]) * 360.0 + np.mod(ra[rows], 360.0)
+        order = np.argsort(key, kind="stable")
+        self._rows = rows[order]
+        self._key = key[order]
+        self._vectors = _unit_vectors(ra[self._rows], dec[self._rows])
+
+    @classmethod
+    def from_result(cls, result: Any, band_height: float = DEFAULT_BAND_HEIGHT) -> "PointingIndex":
+        """Index the entries of an `ObsQuery` or `PlanQuery` result."""
+        return cls(result.columns, band_height)
+
+    @classmethod
+    def from_store(cls, store: Any = None, begin: Any = None, end: Any = None) -> "PointingIndex":
+        """Index the entries of the local AFST mirror (by default
+        `afst_store`), optionally only those between `begin` and `end`."""
+        if store is None:
+            from .afststore import afst_store as store
+        return cls(store.columns(begin, end))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _band(self, dec: np.ndarray) -> np.ndarray:
+        bands = int(np.ceil(180.0 / self.band_height))
+        return np.clip(np.floor((dec + 90.0) / self.band_height), 0, bands - 1).astype(np.int64)
+
+    def _candidates(self, ra: np.ndarray, dec: np.ndarray, radius: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Positions and (sorted) pointings that may be within `radius`:
+        those in the bands and RA range spanned by each cone."""
+        first = self._band(dec - radius)
+        count = self._band(dec + radius) - first + 1
+        position = np.repeat(np.arange(len(ra)), count)
+        band = first[position] + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+
+        # Widest extent of each cone in RA, or all RA if it contains a pole.
+        # Slightly widened, so that pointings on the edge are not missed.
+        sin_ratio = np.sin(np.radians(radius)) / np.maximum(np.cos(np.radians(dec)), 1e-12)
+        half = np.degrees(np.arcsin(np.clip(sin_ratio, 0.0, 1.0))) + 1e-9
+        half = np.where(np.abs(dec) + radius < 90.0, half, 180.0)[position]
+        low = np.mod(ra[position] - half, 360.0)
+        whole = half >= 180.0
+        low[whole] = 0.0
+        high = np.where(whole, 360.0, low + 2 * half)
+
+        # Split RA ranges that wrap through 360 degrees
+        wraps = high > 360.0
+        position = np.concatenate([position, position[wraps]])
+        band = np.concatenate([band, band[wraps]])
+        low = np.concatenate([low, np.zeros(wraps.sum())])
+        high = np.concatenate([np.minimum(high, 360.0), high[wraps] - 360.0])
+
+        start = np.searchsorted(self._key, band * 360.0 + low, side="left")
+        stop = np.searchsorted(self._key, band * 360.0 + high, side="left")
+        count = stop - start
+        candidate = np.repeat(start - np.cumsum(count) + count, count) + np.arange(count.sum())
+        return np.repeat(position, count), candidate
+
+    def query_pairs(
+        self, ra: Any, dec: Any, radius: Any = DEFAULT_RADIUS, chunk_size: int = DEFAULT_QUERY_CHUNK
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find all pointings within `radius` of each position.
+
+        Parameters
+        ----------
+        ra, dec : float or array
+            J2000 coordinates of each position (degrees).
+        radius : float or array
+            Search radius, for all positions or per position (degrees).
+        chunk_size : int
+            Number of positions searched at once.
+
+        Returns
+        -------
+        tuple
+            Arrays of the index of each matching position, the index of the
+            matching pointing in `columns`, and their separation (degrees),
+            ordered by position then pointing.
+        """
+        ra, dec, radius = (np.atleast_1d(np.asarray(v, dtype=float)) for v in np.broadcast_arrays(ra, dec, radius))
+        vectors = _unit_vectors(ra, dec)
+        positions, pointings, separations = [], [], []
+        for begin in range(0, len(ra), chunk_size):
+            chunk = slice(begin, begin + chunk_size)
+            position, candidate = self._candidates(ra[chunk], dec[chunk], radius[chunk])
+            position += begin
+            cos_separation = np.einsum("ij,ij->i", self._vectors[candidate], vectors[position])
+            match = cos_separation >= np.cos(np.radians(radius[position]))
+            position, candidate = position[match], candidate[match]
+            positions.append(position)
+            pointings.append(self._rows[candidate])
+            # From the chord length, which unlike arccos is accurate for small
+            # separations
+            chord = np.linalg.norm(self._vectors[candidate] - vectors[position], axis=1)
+            separations.append(np.degrees(2 * np.arcsin(np.minimum(chord / 2, 1.0))))
+
+        position = np.concatenate(positions) if positions else np.empty(0, dtype=np.int64)
+        pointing = np.concatenate(pointings) if pointings else np.empty(0, dtype=np.int64)
+        separation = np.concatenate(separations) if separations else np.empty(0)
+        order = np.lexsort((pointing, position))
+        return position[order], pointing[order], separation[order]
+
+    def query(self, ra: Any, dec: Any, radius: Any = DEFAULT_RADIUS) -> list[np.ndarray]:
+        """Indices (into `columns`) of the pointings within `radius` of each
+        position, as one array per position. See `query_pairs`."""
+        position, pointing, _ = self.query_pairs(ra, dec, radius)
+        counts = np.bincount(position, minlength=np.broadcast(ra, dec, radius).size)
+        return np.split(pointing, np.cumsum(counts)[:-1])
+
+    def crossmatch(self, ra: Any, dec: Any, radius: Any = DEFAULT_RADIUS) -> Any:
+        """Pointings within `radius` of each position, as a pandas
+        `DataFrame` with a row per match, giving the index of the `position`,
+        the `separation` (degrees) and the columns of the pointing."""
+        import pandas as pd  # type: ignore[import-untyped]
+
+        position, pointing, separation = self.query_pairs(ra, dec, radius)
+        data = {"position": position, "separation": separation}
+        data.update({name: np.asarray(column)[pointing] for name, column in self.columns.items()})
+        return pd.DataFrame(data)
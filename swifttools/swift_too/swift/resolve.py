@@ -1,8 +1,12 @@
+from http import HTTPStatus
+
+import httpx
 from pydantic import ConfigDict, Field, computed_field, model_validator
 
 from ..base.common import TOOAPIBaseclass
 from ..base.schemas import BaseSchema, OptionalCoordinateSchema
 from ..base.status import TOOStatus
+from .resolvecache import resolve_cache
 
 
 class SwiftResolveGetSchema(BaseSchema):
@@ -45,6 +49,8 @@ class SwiftResolve(TOOAPIBaseclass, SwiftResolveSchema):
     """
 
     _endpoint: str = "/resolve"
+    # Resolved coordinates rarely change, so cache them for 30 days
+    _cache_ttl = 30 * 86400
     _schema = SwiftResolveSchema
     _get_schema = SwiftResolveGetSchema
 
@@ -59,6 +65,79 @@ class SwiftResolve(TOOAPIBaseclass, SwiftResolveSchema):
         """
         return self.validate_get()
 
+    def _local_query(self) -> bool | None:
+        """Answer the query from the name resolution cache, if it is enabled
+        and has an entry for this name. Returns None if it does not, or
+        whether the name was resolved."""
+        if not resolve_cache.enabled or self.name is None:
+            return None
+        cached = resolve_cache.get(self.name)
+        if cached is None:
+            return None
+        if "error" in cached:
+            self.status.error(cached["error"])
+            return False
+        payload = {**cached, "name": self.name, "status": {"status": "Accepted"}}
+        # Bypass `_handle_response` here, so the cached answer is not cached
+        # again
+        return super()._handle_response(httpx.Response(200, json=payload))
+
+    def _remember(self, response: httpx.Response, result: bool) -> None:
+        """Add the outcome of a request to the name resolution cache. Names
+        are cached as unresolvable only if the API said so, rather than if
+        the request failed."""
+        if not resolve_cache.enabled or self.name is None:
+            return
+        if result and self.ra is not None and self.dec is not None:
+            resolve_cache.set(self.name, float(self.ra), float(self.dec), self.resolver)
+        elif isinstance(response.status_code, int) and (
+            HTTPStatus.OK <= response.status_code < HTTPStatus.MULTIPLE_CHOICES
+            or response.status_code in (HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND, HTTPStatus.UNPROCESSABLE_ENTITY)
+        ):
+            error = self.status.errors[0] if self.status.errors else f"Could not resolve name {self.name}"
+            resolve_cache.set_error(self.name, error)
+
+    def _handle_response(self, response: httpx.Response) -> bool:
+        result = super()._handle_response(response)
+        self._remember(response, result)
+        return result
+
+    def submit_get(self, refresh: bool = False) -> bool:
+        """Perform an API GET request to the server, unless the name
+        resolution cache can answer it.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response and name resolution caches, and always fetch
+            from the server.
+        """
+        if not refresh and (result := self._local_query()) is not None:
+            return result
+        return super().submit_get(refresh)
+
+    async def get(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request to the server, unless the
+        name resolution cache can answer it.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response and name resolution caches, and always fetch
+            from the server.
+        """
+        if not refresh and (result := self._local_query()) is not None:
+            return result
+        return await super().get(refresh)
+
+    def _submit_get_async(self) -> bool:
+        """Perform an API GET request for a queued request, unless the name
+        resolution cache can answer it."""
+        if (result := self._local_query()) is not None:
+            object.__setattr__(self, "complete", True)
+            return result
+        return super()._submit_get_async()
+
     @property
     def _table(self):
         """Displays values in class as a table"""
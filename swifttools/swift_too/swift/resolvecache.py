@@ -0,0 +1,160 @@
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from ..base.constants import RESOLVE_CACHE_PATH
+
+# Default time resolved coordinates are cached for (seconds)
+DEFAULT_TTL = 30 * 86400
+# Default time names that could not be resolved are cached for (seconds)
+DEFAULT_NEGATIVE_TTL = 86400
+
+
+def normalize_name(name: str) -> str:
+    """Cache key for a source name: case-folded, with leading, trailing and
+    repeated whitespace removed."""
+    return " ".join(name.split()).casefold()
+
+
+class ResolveCache:
+    """Persistent cache of name resolutions, stored in SQLite, shared by
+    `Resolve` (`SwiftResolve`) and by every class that resolves a `name`
+    (`TOOAPIAutoResolve`), so that each name is resolved by the API only once.
+
+    Names are normalized before lookup (see `normalize_name`), so e.g. "m31"
+    and "M31 " share an entry. Names that the API could not resolve are also
+    cached, for `negative_ttl` seconds, so that a bad name in a list of targets
+    is not looked up again each time. Failed requests (e.g. server errors)
+    are not cached.
+
+    The cache is disabled by default, and is enabled with `enable()`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the SQLite database.
+    ttl : float
+        Time resolved coordinates are cached for (seconds). None means
+        forever.
+    negative_ttl : float
+        Time names that could not be resolved are cached for (seconds). 0
+        disables caching of failures.
+    enabled : bool
+        Is the cache enabled?
+    """
+
+    def __init__(
+        self,
+        path: str | Path = RESOLVE_CACHE_PATH,
+        ttl: float | None = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        enabled: bool = False,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    def enable(self, path: str | Path | None = None) -> None:
+        """Enable the cache, optionally changing its location."""
+        if path is not None:
+            self.path = Path(path)
+            self._initialized = False
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the cache. Cached resolutions are kept on disk."""
+        self.enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS names ("
+                "key TEXT PRIMARY KEY, ra REAL, dec REAL, resolver TEXT, error TEXT, expires REAL)"
+            )
+            self._initialized = True
+        return conn
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Cached resolution of `name`, as a dict of `ra`, `dec` and
+        `resolver`, or of `error` if the name could not be resolved. None if
+        it is not cached or has expired."""
+        key = normalize_name(name)
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT ra, dec, resolver, error, expires FROM names WHERE key = ?", (key,)).fetchone()
+            if row is None or (row[4] is not None and row[4] <= now):
+                if row is not None:
+                    conn.execute("DELETE FROM names WHERE key = ?", (key,))
+                self._misses += 1
+                return None
+            if row[3] is not None:
+                self._negative_hits += 1
+                return {"error": row[3]}
+            self._hits += 1
+            return {"ra": row[0], "dec": row[1], "resolver": row[2]}
+
+    def _set(self, name: str, values: tuple[Any, ...], ttl: float | None) -> None:
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO names VALUES (?, ?, ?, ?, ?, ?)", (normalize_name(name), *values, expires)
+            )
+            self._stores += 1
+
+    def set(self, name: str, ra: float, dec: float, resolver: str | None = None) -> None:
+        """Cache the resolved coordinates of `name`."""
+        self._set(name, (ra, dec, resolver, None), self.ttl)
+
+    def set_error(self, name: str, error: str) -> None:
+        """Cache that `name` could not be resolved, with the API's error."""
+        if self.negative_ttl > 0:
+            self._set(name, (None, None, None, error), self.negative_ttl)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Remove the cached resolution of `name`, or all resolutions if
+        None."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            if name is None:
+                conn.execute("DELETE FROM names")
+            else:
+                conn.execute("DELETE FROM names WHERE key = ?", (normalize_name(name),))
+
+    clear = invalidate
+
+    def __len__(self) -> int:
+        with self._lock, closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM names").fetchone()[0]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache hit, negative hit (names cached as unresolvable), miss and
+        store counts for this process."""
+        return {
+            "hits": self._hits,
+            "negative_hits": self._negative_hits,
+            "misses": self._misses,
+            "stores": self._stores,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset cache statistics."""
+        self._hits = self._negative_hits = self._misses = self._stores = 0
+
+
+# Opt-in persistent cache of name resolutions, enabled with
+# `resolve_cache.enable()`
+resolve_cache = ResolveCache()
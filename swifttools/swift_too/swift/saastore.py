@@ -0,0 +1,246 @@
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..base.batch import DEFAULT_MAX_CONCURRENCY, RequestBatch
+from ..base.constants import SAA_STORE_PATH
+from ..base.intervals import IntervalSet
+from ..base.shards import shard_ranges
+
+# Length of each SAA request (days), the API's default length
+DEFAULT_FETCH_DAYS = 1.0
+
+_DAY = np.timedelta64(1, "D")
+# Bounds of open-ended time ranges
+_EARLIEST = np.datetime64("1900-01-01", "us")
+_LATEST = np.datetime64("2200-01-01", "us")
+
+
+def _seconds(times: np.ndarray) -> list[float]:
+    return (times.astype("datetime64[us]").astype(np.int64) / 1e6).tolist()
+
+
+def _times(seconds: list[float]) -> np.ndarray:
+    return (np.array(seconds, dtype=float) * 1e6).round().astype(np.int64).astype("datetime64[us]")
+
+
+class SAAStore:
+    """Local store of Swift's South Atlantic Anomaly (SAA) passages, stored in
+    SQLite, for flagging many times as in or out of the SAA without an API
+    request per time range.
+
+    The store records which time ranges it has fetched, and `fetch()` (or
+    `in_saa()`) only requests the whole UTC days not already fetched, so the
+    store is extended incrementally as it is used. Passages are kept in
+    memory as an `IntervalSet`, so that `in_saa()` is a binary search per
+    time. The spacecraft and BAT (`bat=True`) definitions of the SAA are
+    stored separately.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the SQLite database.
+    fetch_days : float
+        Length of each request (days).
+    max_concurrency : int
+        Maximum number of requests in flight at once.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = SAA_STORE_PATH,
+        fetch_days: float = DEFAULT_FETCH_DAYS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        self.path = Path(path)
+        self.fetch_days = fetch_days
+        self.max_concurrency = max_concurrency
+        self._lock = threading.RLock()
+        self._initialized = False
+        # Passages and fetched ranges, by SAA definition, loaded on first use
+        self._passages: dict[bool, IntervalSet] = {}
+        self._coverage: dict[bool, IntervalSet] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS passages (bat INTEGER NOT NULL, begin REAL NOT NULL, end REAL NOT NULL, "
+                "PRIMARY KEY (bat, begin, end))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS coverage (bat INTEGER NOT NULL, begin REAL NOT NULL, end REAL NOT NULL, "
+                "PRIMARY KEY (bat, begin, end))"
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _load(self, bat: bool) -> None:
+        """Load the passages and fetched ranges of an SAA definition."""
+        if bat in self._passages:
+            return
+        with closing(self._connect()) as conn:
+            for table, store in (("passages", self._passages), ("coverage", self._coverage)):
+                rows = conn.execute(f"SELECT begin, end FROM {table} WHERE bat = ?", (int(bat),)).fetchall()
+                store[bat] = IntervalSet(_times([row[0] for row in rows]), _times([row[1] for row in rows]))
+
+    def coverage(self, bat: bool = False) -> IntervalSet:
+        """Time ranges fetched so far."""
+        with self._lock:
+            self._load(bat)
+            return self._coverage[bat]
+
+    def passages(self, begin: Any = None, end: Any = None, bat: bool = False) -> IntervalSet:
+        """Stored SAA passages, optionally only those between `begin` and
+        `end`. Does not fetch missing time ranges."""
+        with self._lock:
+            self._load(bat)
+            passages = self._passages[bat]
+        if begin is None and end is None:
+            return passages
+        return passages.clip(begin if begin is not None else _EARLIEST, end if end is not None else _LATEST)
+
+    def missing(self, begin: Any, end: Any, bat: bool = False) -> IntervalSet:
+        """Whole UTC days between `begin` and `end` that have not been
+        fetched."""
+        first = np.datetime64(begin, "us").astype("datetime64[D]")
+        last = np.datetime64(end, "us").astype("datetime64[D]") + _DAY
+        return IntervalSet([first], [last]) - self.coverage(bat)
+
+    def fetch(
+        self,
+        begin: Any,
+        end: Any,
+        bat: bool = False,
+        username: str = "anonymous",
+        shared_secret: str = "anonymous",
+    ) -> bool:
+        """Fetch the SAA passages between `begin` and `end` from the API,
+        skipping days already fetched, in requests of `fetch_days` days.
+
+        Parameters
+        ----------
+        begin, end : datetime
+            Time range (UTC).
+        bat : bool
+            Fetch the BAT definition of the SAA, rather than the spacecraft
+            definition.
+        username : str
+            TOO API username.
+        shared_secret : str
+            TOO API shared secret.
+
+        Returns
+        -------
+        bool
+            Were all requests successful? Ranges whose requests succeeded are
+            stored either way.
+        """
+        # Imported here to avoid a circular import
+        from .saa import SwiftSAA
+
+        with self._lock:
+            ranges = [
+                shard
+                for missing_begin, missing_end in self.missing(begin, end, bat)
+                for shard in shard_ranges(missing_begin, missing_end, self.fetch_days)
+            ]
+            if not ranges:
+                return True
+            queries = [
+                SwiftSAA(
+                    begin=range_begin,
+                    end=range_end,
+                    bat=bat,
+                    username=username,
+                    shared_secret=shared_secret,
+                    autosubmit=False,
+                )
+                for range_begin, range_end in ranges
+            ]
+            batch = RequestBatch(queries, max_concurrency=self.max_concurrency)
+            batch.submit()
+
+            passages: list[tuple[datetime, datetime]] = []
+            fetched: list[tuple[datetime, datetime]] = []
+            for (range_begin, range_end), result in zip(ranges, batch):
+                if result.success:
+                    fetched.append((range_begin, range_end))
+                    passages.extend((entry.begin, entry.end) for entry in result.request.entries)
+            self._store(passages, fetched, bat)
+            return all(batch)
+
+    def _store(
+        self, passages: list[tuple[datetime, datetime]], fetched: list[tuple[datetime, datetime]], bat: bool
+    ) -> None:
+        """Add passages, and the time ranges they were fetched for, to the
+        store."""
+        new_passages = IntervalSet.from_windows(passages)
+        new_coverage = IntervalSet.from_windows(fetched)
+        with self._lock, closing(self._connect()) as conn, conn:
+            for table, intervals in (("passages", new_passages), ("coverage", new_coverage)):
+                rows = zip([int(bat)] * len(intervals), _seconds(intervals.begin), _seconds(intervals.end))
+                conn.executemany(f"INSERT OR IGNORE INTO {table} VALUES (?, ?, ?)", rows)
+            if bat in self._passages:
+                self._passages[bat] = self._passages[bat] | new_passages
+                self._coverage[bat] = self._coverage[bat] | new_coverage
+
+    def in_saa(
+        self,
+        times: Any,
+        bat: bool = False,
+        fetch: bool = True,
+        username: str = "anonymous",
+        shared_secret: str = "anonymous",
+    ) -> np.ndarray:
+        """Is Swift in the SAA at each time?
+
+        Parameters
+        ----------
+        times : array
+            Times to test (`datetime64` or a list of `datetime`, UTC), in any
+            order.
+        bat : bool
+            Use the BAT definition of the SAA, rather than the spacecraft
+            definition.
+        fetch : bool
+            Fetch the days between the first and last time that are not yet
+            stored. If False, or if fetching fails, times that have not been
+            fetched are reported as not in the SAA.
+        username : str
+            TOO API username.
+        shared_secret : str
+            TOO API shared secret.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True for times within an SAA passage.
+        """
+        times = np.asarray(times, dtype="datetime64[us]")
+        if fetch and times.size:
+            valid = times[~np.isnat(times)]
+            if valid.size:
+                self.fetch(valid.min(), valid.max(), bat, username, shared_secret)
+        return self.passages(bat=bat).contains(times.ravel()).reshape(times.shape)
+
+    def clear(self) -> None:
+        """Remove all passages and fetched ranges."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM passages")
+            conn.execute("DELETE FROM coverage")
+            self._passages.clear()
+            self._coverage.clear()
+
+
+# Local store of SAA passages
+saa_store = SAAStore()
@@ -0,0 +1,239 @@
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..base.constants import LEAP_SECONDS, SWIFT_LAUNCH, UTCF_TABLE_PATH
+from ..base.functions import utcnow
+from .clock import CLOCK_CACHE_MIN_AGE
+from .clockarray import MET_EPOCH, SwiftClockArray, met_to_datetime64
+
+# Default spacing of the UTCF table (seconds of MET)
+DEFAULT_SPACING = 86400.0
+# Default time between checks for new clock corrections (seconds)
+DEFAULT_REFRESH_INTERVAL = 86400.0
+
+
+def _met(dt: Any) -> Any:
+    """MET (seconds) for datetimes, ignoring clock corrections."""
+    return (np.asarray(dt, dtype="datetime64[us]") - MET_EPOCH) / np.timedelta64(1, "s")
+
+
+class UTCFTable:
+    """Local table of Swift clock corrections (UTCF), so that MET and UTC can
+    be converted without an API request for every query.
+
+    The table holds the UTCF at regular intervals of MET (`spacing`), from
+    launch until `CLOCK_CACHE_MIN_AGE` ago, after which corrections are final.
+    It is fetched from the API once, saved to disk, and extended with newer
+    corrections at most once every `refresh_interval` seconds. UTCF is
+    interpolated linearly between entries, except across a leap second, where
+    it steps at the moment the leap second took effect. Times outside the
+    table are not covered, and must be converted by the API.
+
+    The table is disabled by default, and is enabled with `enable()`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the saved table.
+    spacing : float
+        Interval between table entries (seconds of MET).
+    refresh_interval : float
+        Minimum time between checks for new clock corrections (seconds).
+    enabled : bool
+        Is the table used by `Clock`?
+    """
+
+    def __init__(
+        self,
+        path: str | Path = UTCF_TABLE_PATH,
+        spacing: float = DEFAULT_SPACING,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        enabled: bool = False,
+    ):
+        self.path = Path(path)
+        self.spacing = spacing
+        self.refresh_interval = refresh_interval
+        self.enabled = enabled
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._met = np.empty(0)
+        self._utcf = np.empty(0)
+        self._updated = 0.0
+        self._checked = 0.0
+
+    def enable(self, path: str | Path | None = None) -> None:
+        """Enable the table, optionally changing where it is saved."""
+        with self._lock:
+            if path is not None:
+                self.path = Path(path)
+                self._loaded = False
+            self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the table. The saved table is kept on disk."""
+        self.enabled = False
+
+    @property
+    def met(self) -> np.ndarray:
+        """MET of each table entry (seconds)."""
+        return self._met
+
+    @property
+    def utcf(self) -> np.ndarray:
+        """UTCF at each table entry (seconds)."""
+        return self._utcf
+
+    def __len__(self) -> int:
+        return len(self._met)
+
+    def load(self) -> bool:
+        """Load the saved table from disk. Returns False if there is none."""
+        with self._lock:
+            self._loaded = True
+            try:
+                with np.load(self.path) as data:
+                    self._met = data["met"]
+                    self._utcf = data["utcf"]
+                    self._updated = float(data["updated"])
+            except (OSError, KeyError, ValueError):
+                return False
+            return True
+
+    def save(self) -> None:
+        """Save the table to disk."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(self.path.name + ".tmp")
+            with open(temporary, "wb") as f:
+                np.savez(f, met=self._met, utcf=self._utcf, updated=self._updated)
+            os.replace(temporary, self.path)
+
+    def refresh(self, until: datetime | None = None) -> bool:
+        """Fetch clock corrections newer than the last table entry from the
+        API, and save the table.
+
+        Parameters
+        ----------
+        until : datetime, optional
+            Extend the table up to this (UTC) time. Defaults to
+            `CLOCK_CACHE_MIN_AGE` ago, as more recent corrections may change.
+
+        Returns
+        -------
+        bool
+            Was the table updated successfully?
+        """
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            end = _met(until if until is not None else utcnow() - CLOCK_CACHE_MIN_AGE)
+            start = self._met[-1] + self.spacing if len(self._met) else _met(SWIFT_LAUNCH)
+            if start <= end:
+                clock = SwiftClockArray(met=np.arange(start, end, self.spacing))
+                if not clock.status:
+                    return False
+                self._met = np.concatenate([self._met, clock.met])  # type: ignore[list-item]
+                self._utcf = np.concatenate([self._utcf, clock.utcf])  # type: ignore[list-item]
+            self._updated = time.time()
+            self.save()
+            return True
+
+    def _ensure_current(self) -> None:
+        """Load the table, and fetch newer corrections if it is due."""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            now = time.time()
+            if now - max(self._updated, self._checked) > self.refresh_interval:
+                # Don't retry a failed refresh on every call
+                self._checked = now
+                self.refresh()
+
+    def covers(self, met: Any) -> np.ndarray:
+        """Which of the given MET values are within the table?"""
+        met = np.asarray(met, dtype=float)
+        if len(self._met) == 0:
+            return np.zeros(met.shape, dtype=bool)
+        return (met >= self._met[0]) & (met <= self._met[-1])
+
+    def utcf_at(self, met: Any) -> np.ndarray:
+        """UTCF (seconds) at the given MET values, NaN outside the table."""
+        shape = np.shape(met)
+        met = np.atleast_1d(np.asarray(met, dtype=float))
+        if len(self._met) == 0:
+            return np.full(shape, np.nan)
+        utcf = np.interp(met, self._met, self._utcf, left=np.nan, right=np.nan)
+
+        # Don't interpolate across leap seconds, rather step from the UTCF
+        # before to the UTCF after at the moment the leap second took effect
+        for leap in LEAP_SECONDS:
+            before = np.searchsorted(self._met, _met(leap)) - 1
+            if before < 0:
+                continue
+            boundary = _met(leap) - self._utcf[before]
+            right = np.searchsorted(self._met, boundary, side="right")
+            if right == len(self._met):
+                continue
+            left = right - 1
+            between = (met > self._met[left]) & (met < self._met[right])
+            utcf[between & (met < boundary)] = self._utcf[left]
+            utcf[between & (met >= boundary)] = self._utcf[right]
+        return utcf.reshape(shape)
+
+    def met_to_utc(self, met: Any) -> np.ndarray:
+        """UTC times (`datetime64[us]`) for MET values, NaT outside the
+        table."""
+        return met_to_datetime64(met, self.utcf_at(met))
+
+    def utc_to_met(self, utc: Any) -> np.ndarray:
+        """MET values for UTC times (`datetime64` or `datetime`), NaN outside
+        the table."""
+        seconds = _met(utc)
+        if len(self._met) == 0:
+            return np.full(np.shape(seconds), np.nan)
+        # UTCF varies slowly with MET, so a couple of iterations converge
+        met = seconds - np.interp(seconds, self._met, self._utcf)
+        for _ in range(2):
+            met = seconds - self.utcf_at(met)
+        return met
+
+    def correct(
+        self, met: Any = None, swifttime: Any = None, utctime: Any = None
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """MET and UTCF for the given MET, Swift times or UTC times, or None
+        if any of them are outside the table.
+
+        Parameters
+        ----------
+        met : float or list, optional
+            MET values (seconds).
+        swifttime : datetime or list, optional
+            Swift times.
+        utctime : datetime or list, optional
+            UTC times.
+
+        Returns
+        -------
+        tuple or None
+            Arrays of MET and UTCF (seconds).
+        """
+        self._ensure_current()
+        if met is not None:
+            met = np.atleast_1d(np.asarray(met, dtype=float))
+        elif swifttime is not None:
+            met = np.atleast_1d(_met(swifttime))
+        else:
+            met = np.atleast_1d(self.utc_to_met(utctime))
+        if not self.covers(met).all():
+            return None
+        return met, self.utcf_at(met)
+
+
+# Local UTCF table used by `Clock`, enabled with `utcf_table.enable()`
+utcf_table = UTCFTable()
@@ -96,6 +96,7 @@ class SwiftUVOTMode(TOOAPIBaseclass, TOOAPIInstruments, SwiftUVOTModeSchema, TOO
     _schema = SwiftUVOTModeSchema
     _get_schema = SwiftUVOTModeGetSchema
     _endpoint = "/swift/uvot_mode"
+    _cache_ttl = None
 
     def _post_process(self):
         if len(self.entries) == 0:
@@ -0,0 +1,236 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+
+from ..base.batch import DEFAULT_MAX_CONCURRENCY, RequestBatch
+
+# Default HEALPix resolution of the sky tiles whose visibility is shared by
+# all targets within them. Pixels are about 0.9 degrees across.
+DEFAULT_NSIDE = 64
+# Default maximum number of tiles kept in the tile cache
+DEFAULT_MAX_TILES = 100000
+# Windows of consecutive days closer than this are joined (seconds)
+JOIN_TOLERANCE = 60.0
+
+_DAY = timedelta(days=1)
+
+
+def healpix_pixel(ra: Any, dec: Any, nside: int = DEFAULT_NSIDE) -> np.ndarray:
+    """HEALPix pixel (RING ordering) containing each position.
+
+    Parameters
+    ----------
+    ra, dec : float or array
+        J2000 coordinates (degrees).
+    nside : int
+        HEALPix resolution.
+    """
+    ra, dec = np.broadcast_arrays(np.asarray(ra, dtype=float), np.asarray(dec, dtype=float))
+    z = np.sin(np.radians(dec))
+    za = np.abs(z)
+    tt = np.mod(ra, 360.0) / 90.0
+
+    # Equatorial region
+    temp1 = nside * (0.5 + tt)
+    temp2 = nside * z * 0.75
+    jp = (temp1 - temp2).astype(np.int64)
+    jm = (temp1 + temp2).astype(np.int64)
+    ring = nside + 1 + jp - jm
+    ip = np.mod((jp + jm - nside + (1 - (ring & 1)) + 1) // 2, 4 * nside)
+    equatorial = 2 * nside * (nside - 1) + (ring - 1) * 4 * nside + ip
+
+    # Polar caps
+    tp = tt - np.floor(tt)
+    tmp = nside * np.sqrt(3 * (1 - za))
+    ring = (tp * tmp).astype(np.int64) + ((1 - tp) * tmp).astype(np.int64) + 1
+    ip = np.mod((tt * ring).astype(np.int64), 4 * ring)
+    polar = np.where(z > 0, 2 * ring * (ring - 1) + ip, 12 * nside**2 - 2 * ring * (ring + 1) + ip)
+
+    return np.where(za <= 2 / 3, equatorial, polar)
+
+
+def healpix_center(pixel: Any, nside: int = DEFAULT_NSIDE) -> tuple[np.ndarray, np.ndarray]:
+    """J2000 coordinates (degrees) of the center of each HEALPix pixel (RING
+    ordering)."""
+    pixel = np.asarray(pixel, dtype=np.int64)
+    npix = 12 * nside**2
+    ncap = 2 * nside * (nside - 1)
+
+    # Every region is calculated for every pixel, so ignore division by zero
+    # for pixels outside each region
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # North polar cap
+        ring_n = (1 + np.sqrt(1 + 2 * pixel).astype(np.int64)) // 2
+        z_n = 1 - ring_n**2 / (3 * nside**2)
+        phi_n = (pixel - 2 * ring_n * (ring_n - 1) + 0.5) * np.pi / (2 * ring_n)
+
+        # Equatorial region
+        offset = pixel - ncap
+        ring_e = offset // (4 * nside) + nside
+        z_e = (2 * nside - ring_e) * 2 / (3 * nside)
+        shift = np.where((ring_e + nside) & 1, 1.0, 0.5)
+        phi_e = (np.mod(offset, 4 * nside) + 1 - shift) * np.pi / (2 * nside)
+
+        # South polar cap
+        remaining = npix - pixel
+        ring_s = (1 + np.sqrt(np.maximum(2 * remaining - 1, 0)).astype(np.int64)) // 2
+        z_s = -1 + ring_s**2 / (3 * nside**2)
+        phi_s = (4 * ring_s + 0.5 - (remaining - 2 * ring_s * (ring_s - 1))) * np.pi / (2 * ring_s)
+
+    z = np.select([pixel < ncap, pixel < npix - ncap], [z_n, z_e], z_s)
+    phi = np.select([pixel < ncap, pixel < npix - ncap], [phi_n, phi_e], phi_s)
+    return np.degrees(phi), np.degrees(np.arcsin(z))
+
+
+class VisTileCache:
+    """In-memory cache of the visibility windows of sky tiles, each a HEALPix
+    pixel for one UTC day, shared by all calls to `SwiftVisQuery.batch`.
+    When full, the least recently used tiles are evicted.
+
+    Parameters
+    ----------
+    max_tiles : int
+        Maximum number of tiles cached.
+    """
+
+    def __init__(self, max_tiles: int = DEFAULT_MAX_TILES):
+        self.max_tiles = max_tiles
+        self._tiles: dict[tuple[Any, ...], list[tuple[datetime, datetime]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> list[tuple[datetime, datetime]] | None:
+        """Windows of a tile, or None if not cached."""
+        with self._lock:
+            windows = self._tiles.pop(key, None)
+            if windows is not None:
+                self._tiles[key] = windows
+            return windows
+
+    def set(self, key: tuple[Any, ...], windows: list[tuple[datetime, datetime]]) -> None:
+        """Cache the windows of a tile."""
+        with self._lock:
+            self._tiles.pop(key, None)
+            self._tiles[key] = windows
+            while len(self._tiles) > self.max_tiles:
+                del self._tiles[next(iter(self._tiles))]
+
+    def clear(self) -> None:
+        """Remove all tiles."""
+        with self._lock:
+            self._tiles.clear()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+
+# Tile cache used by `SwiftVisQuery.batch`
+vis_tile_cache = VisTileCache()
+
+
+def _coordinates(coords: Any) -> tuple[np.ndarray, np.ndarray]:
+    """RA and Dec (degrees) of a `SkyCoord`, or of a sequence of (RA, Dec)
+    pairs."""
+    if hasattr(coords, "icrs"):
+        coords = coords.icrs
+        return np.atleast_1d(coords.ra.deg), np.atleast_1d(coords.dec.deg)
+    pairs = np.asarray(coords, dtype=float).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _join(windows: list[tuple[datetime, datetime]], begin: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+    """Windows of consecutive days clipped to `begin` to `end`, with windows
+    that continue across midnight joined."""
+    joined: list[tuple[datetime, datetime]] = []
+    for window_begin, window_end in windows:
+        window_begin, window_end = max(window_begin, begin), min(window_end, end)
+        if window_begin > window_end:
+            continue
+        if joined and (window_begin - joined[-1][1]).total_seconds() <= JOIN_TOLERANCE:
+            joined[-1] = (joined[-1][0], max(joined[-1][1], window_end))
+        else:
+            joined.append((window_begin, window_end))
+    return joined
+
+
+def batch_windows(
+    coords: Any,
+    begin: datetime,
+    length: float = 7.0,
+    hires: bool = False,
+    nside: int = DEFAULT_NSIDE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache: VisTileCache | None = None,
+    username: str = "anonymous",
+    shared_secret: str = "anonymous",
+) -> Any:
+    """Visibility windows of many targets. See `SwiftVisQuery.batch`."""
+    import pandas as pd  # type: ignore[import-untyped]
+
+    # Imported here to avoid a circular import
+    from .visquery import SwiftVisQuery
+
+    if cache is None:
+        cache = vis_tile_cache
+    ra, dec = _coordinates(coords)
+    end = begin + timedelta(days=length)
+    first_day = datetime(begin.year, begin.month, begin.day)
+    days = [first_day + i * _DAY for i in range(int(np.ceil((end - first_day) / _DAY)))]
+    pixels = healpix_pixel(ra, dec, nside)
+    unique_pixels = np.unique(pixels)
+
+    # Fetch the tiles that are not already cached, at the center of each
+    # pixel
+    center_ra, center_dec = healpix_center(unique_pixels, nside)
+    windows: dict[tuple[Any, ...], list[tuple[datetime, datetime]]] = {}
+    queries = {}
+    for pixel, pixel_ra, pixel_dec in zip(unique_pixels.tolist(), center_ra.tolist(), center_dec.tolist()):
+        for day in days:
+            key = (nside, pixel, day, hires)
+            tile = cache.get(key)
+            if tile is not None:
+                windows[key] = tile
+            else:
+                queries[key] = SwiftVisQuery(
+                    ra=pixel_ra,
+                    dec=pixel_dec,
+                    begin=day,
+                    length=1,
+                    hires=hires,
+                    username=username,
+                    shared_secret=shared_secret,
+                    autosubmit=False,
+                )
+    errors = {}
+    if queries:
+        batch = RequestBatch(list(queries.values()), max_concurrency=max_concurrency)
+        batch.submit()
+        for key, result in zip(queries, batch):
+            if result.success:
+                tile = [(window.begin, window.end) for window in result.request.windows]
+                cache.set(key, tile)
+                windows[key] = tile
+            else:
+                errors[key[1]] = result.error or "Request failed"
+
+    # Join the windows of each day, for each pixel
+    pixel_windows = {}
+    for pixel in unique_pixels.tolist():
+        if pixel not in errors:
+            tiles = [window for day in days for window in windows[(nside, pixel, day, hires)]]
+            pixel_windows[pixel] = _join(tiles, begin, end)
+
+    rows: list[tuple[int, datetime, datetime]] = []
+    failed: dict[int, str] = {}
+    for index, pixel in enumerate(pixels.tolist()):
+        if pixel in errors:
+            failed[index] = errors[pixel]
+            continue
+        rows.extend((index, window_begin, window_end) for window_begin, window_end in pixel_windows[pixel])
+    table = pd.DataFrame(rows, columns=["index", "begin", "end"])
+    table["begin"] = pd.to_datetime(table["begin"])
+    table["end"] = pd.to_datetime(table["end"])
+    table["length"] = table["end"] - table["begin"]
+    table.attrs["errors"] = failed
+    return table
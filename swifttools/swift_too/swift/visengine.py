@@ -0,0 +1,343 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .pointingindex import _unit_vectors
+
+# Swift pointing constraints (degrees)
+SUN_CONSTRAINT = 46.0
+MOON_CONSTRAINT = 23.0
+# Minimum angle between a target and the Earth's limb (degrees)
+EARTH_LIMB_CONSTRAINT = 28.0
+
+# Equatorial radius of the Earth (km)
+EARTH_RADIUS = 6378.137
+
+# Default time steps of low and high resolution visibility (seconds)
+DEFAULT_STEP = 600.0
+DEFAULT_HIRES_STEP = 60.0
+# Maximum number of targets whose constraints are evaluated at once, which
+# bounds memory use
+DEFAULT_TARGET_CHUNK = 1024
+# Time between the calculated positions of the Sun and Moon (seconds), which
+# are interpolated in between
+EPHEMERIS_STEP = 3600.0
+
+
+def time_grid(begin: datetime, end: datetime, step: float) -> np.ndarray:
+    """Times from `begin` to `end` (inclusive) every `step` seconds, as
+    `datetime64[us]`."""
+    if step <= 0:
+        raise ValueError("step must be positive")
+    begin64, end64 = np.datetime64(begin, "us"), np.datetime64(end, "us")
+    times = np.arange(begin64, end64, np.timedelta64(int(step * 1e6), "us"))
+    return np.append(times, end64) if len(times) == 0 or times[-1] != end64 else times
+
+
+@lru_cache(maxsize=32)
+def _ephemeris(body: str, begin: np.datetime64, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Times (seconds since `begin`) and unit vectors of a body every
+    `EPHEMERIS_STEP` seconds."""
+    # Imported here as astropy is slow to import
+    from astropy.coordinates import get_body  # type: ignore[import-untyped]
+    from astropy.time import Time  # type: ignore[import-untyped]
+
+    seconds = np.arange(count) * EPHEMERIS_STEP
+    times = begin + (seconds * 1e6).astype("timedelta64[us]")
+    xyz = get_body(body, Time(times, scale="utc")).cartesian.xyz.value.T
+    return seconds, xyz / np.linalg.norm(xyz, axis=1, keepdims=True)
+
+
+def body_vectors(body: str, times: np.ndarray) -> np.ndarray:
+    """Geocentric unit vectors (GCRS, whose axes are aligned with J2000) of a
+    solar system body (e.g. "sun" or "moon") at each time.
+
+    Positions are calculated every `EPHEMERIS_STEP` seconds and interpolated,
+    as calculating them at each time is slow."""
+    times = np.asarray(times, dtype="datetime64[us]")
+    # Align the ephemeris to whole hours, so that it is cached for overlapping
+    # time ranges
+    begin = times.min().astype("datetime64[h]").astype("datetime64[us]")
+    seconds = (times - begin) / np.timedelta64(1, "s")
+    count = int(seconds.max() // EPHEMERIS_STEP) + 2
+    nodes, vectors = _ephemeris(body, begin, count)
+    xyz = np.stack([np.interp(seconds, nodes, vectors[:, i]) for i in range(3)], axis=-1)
+    return xyz / np.linalg.norm(xyz, axis=1, keepdims=True)
+
+
+class Orbit:
+    """Swift's position and velocity over time, in an Earth-centered inertial
+    frame aligned with J2000 (GCRS), used to apply the Earth constraint.
+
+    Positions between the given times are interpolated linearly, so they
+    should be sampled every minute or so.
+
+    Parameters
+    ----------
+    times : array
+        Times of each position (`datetime64` or a list of `datetime`, UTC).
+    position : array
+        Position (km) at each time, shape (n, 3).
+    velocity : array, optional
+        Velocity (km/s) at each time, shape (n, 3). Calculated from the
+        positions if not given.
+    """
+
+    def __init__(self, times: Any, position: Any, velocity: Any = None):
+        self.times = np.asarray(times, dtype="datetime64[us]")
+        self.position = np.asarray(position, dtype=float)
+        if len(self.times) < 2 or self.position.shape != (len(self.times), 3):
+            raise ValueError("An orbit needs a position (x, y, z) at two or more times")
+        if velocity is None:
+            seconds = (self.times - self.times[0]) / np.timedelta64(1, "s")
+            velocity = np.gradient(self.position, seconds, axis=0)
+        self.velocity = np.asarray(velocity, dtype=float)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "Orbit":
+        """Read an orbit from a text file, with a line per time giving the ISO
+        format UTC time and x, y, z position (km), optionally followed by the
+        velocity (km/s). Values may be separated by whitespace or commas, and
+        lines starting with "#" are ignored."""
+        times, rows = [], []
+        with open(path) as f:
+            for line in f:
+                values = line.replace(",", " ").split()
+                if not values or values[0].startswith("#"):
+                    continue
+                times.append(np.datetime64(values[0].rstrip("Z"), "us"))
+                rows.append([float(value) for value in values[1:]])
+        data = np.array(rows)
+        return cls(times, data[:, :3], data[:, 3:6] if data.shape[1] >= 6 else None)
+
+    @classmethod
+    def from_tle(cls, tle: str | Path, begin: datetime, end: datetime, step: float = DEFAULT_HIRES_STEP) -> "Orbit":
+        """Propagate a two-line element set (TLE) from `begin` to `end`.
+        Requires sgp4.
+
+        Parameters
+        ----------
+        tle : str or Path
+            File containing the TLE, or the TLE itself. The last two lines
+            are used.
+        begin, end : datetime
+            Time range of the orbit (UTC).
+        step : float
+            Time between positions (seconds).
+        """
+        try:
+            from sgp4.api import Satrec  # type: ignore[import-not-found]
+        except ImportError:
+            raise ImportError("Propagating a TLE requires the `sgp4` package: pip install sgp4")
+        from astropy import units as u  # type: ignore[import-untyped]
+        from astropy.coordinates import GCRS, TEME, CartesianDifferential, CartesianRepresentation  # type: ignore[import-untyped]
+        from astropy.time import Time  # type: ignore[import-untyped]
+
+        text = Path(tle).read_text() if "\n" not in str(tle) else str(tle)
+        line1, line2 = [line.strip() for line in text.strip().splitlines()][-2:]
+        satellite = Satrec.twoline2rv(line1, line2)
+
+        times = time_grid(begin, end, step)
+        t = Time(times, scale="utc")
+        error, position, velocity = satellite.sgp4_array(t.jd1, t.jd2)
+        if np.any(error):
+            raise ValueError("TLE propagation failed")
+        teme = TEME(
+            CartesianRepresentation(position.T * u.km).with_differentials(
+                CartesianDifferential(velocity.T * u.km / u.s)
+            ),
+            obstime=t,
+        )
+        gcrs = teme.transform_to(GCRS(obstime=t))
+        return cls(
+            times,
+            gcrs.cartesian.xyz.to_value(u.km).T,
+            gcrs.velocity.d_xyz.to_value(u.km / u.s).T,
+        )
+
+    def covers(self, begin: datetime, end: datetime) -> bool:
+        """Is the time range `begin` to `end` within the orbit?"""
+        return self.times[0] <= np.datetime64(begin, "us") and np.datetime64(end, "us") <= self.times[-1]
+
+    def at(self, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Position and velocity, interpolated at each time."""
+        seconds = (self.times - self.times[0]) / np.timedelta64(1, "s")
+        when = (np.asarray(times, dtype="datetime64[us]") - self.times[0]) / np.timedelta64(1, "s")
+        position = np.stack([np.interp(when, seconds, self.position[:, i]) for i in range(3)], axis=-1)
+        velocity = np.stack([np.interp(when, seconds, self.velocity[:, i]) for i in range(3)], axis=-1)
+        return position, velocity
+
+
+class VisibilityEngine:
+    """Local calculation of Swift target visibility, for many targets at
+    once without an API request per target.
+
+    Targets are constrained when they are within `sun` degrees of the Sun or
+    `moon` degrees of the Moon. If an `orbit` is given, high resolution
+    visibility also applies the Earth constraint (within `earth` degrees of
+    the Earth's limb), and low resolution visibility within the orbit's time
+    range excludes targets so close to the orbit pole that they are behind
+    the Earth constraint for the whole orbit. Constraints are evaluated every
+    `step` (or `hires_step`) seconds, so window edges are accurate to a time
+    step.
+
+    Once enabled, `VisQuery` (`SwiftVisQuery`) calculates windows locally,
+    rather than by the API, whenever the engine can answer the query. High
+    resolution queries need an `orbit` covering the requested times.
+
+    Parameters
+    ----------
+    orbit : Orbit, optional
+        Swift's orbit, needed for the Earth constraint.
+    sun, moon, earth : float
+        Sun, Moon and Earth limb constraints (degrees).
+    step, hires_step : float
+        Time step for low and high resolution visibility (seconds).
+    enabled : bool
+        Is the engine used by `SwiftVisQuery`?
+    """
+
+    def __init__(
+        self,
+        orbit: Orbit | None = None,
+        sun: float = SUN_CONSTRAINT,
+        moon: float = MOON_CONSTRAINT,
+        earth: float = EARTH_LIMB_CONSTRAINT,
+        step: float = DEFAULT_STEP,
+        hires_step: float = DEFAULT_HIRES_STEP,
+        enabled: bool = False,
+    ):
+        self.orbit = orbit
+        self.sun = sun
+        self.moon = moon
+        self.earth = earth
+        self.step = step
+        self.hires_step = hires_step
+        self.enabled = enabled
+
+    def enable(self, orbit: Orbit | None = None) -> None:
+        """Enable the engine, optionally setting the orbit."""
+        if orbit is not None:
+            self.orbit = orbit
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Disable the engine."""
+        self.enabled = False
+
+    def can_calculate(self, begin: datetime, end: datetime, hires: bool = False) -> bool:
+        """Can visibility between `begin` and `end` be calculated locally?"""
+        return not hires or (self.orbit is not None and self.orbit.covers(begin, end))
+
+    def visible(self, ra: Any, dec: Any, times: Any, hires: bool = False) -> np.ndarray:
+        """Visibility of each target at each time.
+
+        Parameters
+        ----------
+        ra, dec : float or array
+            J2000 coordinates of each target (degrees).
+        times : array
+            Times to evaluate (`datetime64` or a list of `datetime`, UTC).
+        hires : bool
+            Apply the Earth constraint at each time, rather than only
+            excluding targets near the orbit pole. Requires an `orbit`.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of shape (targets, times), True where the target is
+            not constrained.
+        """
+        ra, dec = np.broadcast_arrays(np.atleast_1d(np.asarray(ra, dtype=float)), np.asarray(dec, dtype=float))
+        times = np.atleast_1d(np.asarray(times, dtype="datetime64[us]"))
+        if hires and self.orbit is None:
+            raise ValueError("High resolution visibility requires an orbit")
+
+        # (direction, cosine of the constraint angle) for each constraint, and
+        # whether the constraint applies on both sides (the orbit pole)
+        constraints = [
+            (body_vectors("sun", times), np.cos(np.radians(self.sun)), False),
+            (body_vectors("moon", times), np.cos(np.radians(self.moon)), False),
+        ]
+        # The orbit precesses, so is not extrapolated for the pole constraint
+        if self.orbit is not None and (hires or self.orbit.covers(times.min(), times.max())):
+            position, velocity = self.orbit.at(times)
+            distance = np.linalg.norm(position, axis=1)
+            limit = np.arcsin(np.minimum(EARTH_RADIUS / distance, 1.0)) + np.radians(self.earth)
+            if hires:
+                constraints.append((-position / distance[:, None], np.cos(limit), False))
+            else:
+                # Targets within this angle of the orbit pole are constrained
+                # by the Earth for the whole orbit
+                pole = np.cross(position, velocity)
+                pole /= np.linalg.norm(pole, axis=1, keepdims=True)
+                constraints.append((pole, np.cos(np.maximum(limit - np.pi / 2, 0.0)), True))
+
+        vectors = _unit_vectors(ra, dec)
+        visible = np.empty((len(vectors), len(times)), dtype=bool)
+        for start in range(0, len(vectors), DEFAULT_TARGET_CHUNK):
+            chunk = vectors[start : start + DEFAULT_TARGET_CHUNK]
+            ok = np.ones((len(chunk), len(times)), dtype=bool)
+            for direction, cos_limit, both_sides in constraints:
+                cos_angle = chunk @ direction.T
+                ok &= (np.abs(cos_angle) if both_sides else cos_angle) < cos_limit
+            visible[start : start + len(chunk)] = ok
+        return visible
+
+    def intervals(
+        self, ra: Any, dec: Any, begin: datetime, end: datetime, hires: bool = False
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Visibility windows of each target between `begin` and `end`, as
+        arrays, which is faster than `windows` for many targets.
+
+        Returns
+        -------
+        tuple
+            Arrays of the index of the target, and the begin and end
+            (`datetime64[us]`) of each window, ordered by target then time.
+        """
+        times = time_grid(begin, end, self.hires_step if hires else self.step)
+        visible = self.visible(ra, dec, times, hires)
+        padded = np.zeros((visible.shape[0], visible.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = visible
+        edges = np.diff(padded, axis=1)
+        target, first = np.nonzero(edges == 1)
+        _, after = np.nonzero(edges == -1)
+        return target, times[first], times[after - 1]
+
+    def windows(self, ra: Any, dec: Any, begin: datetime, end: datetime, hires: bool = False) -> list[list[Any]]:
+        """Visibility windows of each target between `begin` and `end`, as a
+        list of `SwiftVisWindow` per target. See `intervals`."""
+        # Imported here to avoid a circular import
+        from .visquery import SwiftVisWindow
+
+        target, first, last = self.intervals(ra, dec, begin, end, hires)
+        windows: list[list[Any]] = [[] for _ in range(np.broadcast(np.atleast_1d(ra), dec).size)]
+        for i, window_begin, window_end in zip(target.tolist(), first.tolist(), last.tolist()):
+            windows[i].append(SwiftVisWindow.model_construct(begin=window_begin, end=window_end))
+        return windows
+
+
+# Local visibility engine used by `SwiftVisQuery`, enabled with
+# `vis_engine.enable()`
+vis_engine = VisibilityEngine()
+
+
+def _as_datetime(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+
+
+def query_window(begin: Any, end: Any, length: Any) -> tuple[datetime, datetime]:
+    """Time range of a `SwiftVisQuery`, applying the API's defaults of
+    starting now and lasting 7 days."""
+    # Imported here to avoid a circular import
+    from ..base.functions import utcnow
+
+    begin = _as_datetime(begin) if begin is not None else utcnow()
+    if end is None:
+        days = length.total_seconds() / 86400 if isinstance(length, timedelta) else length
+        end = begin + timedelta(days=float(days) if isinstance(days, (int, float)) else 7.0)
+    return begin, _as_datetime(end)
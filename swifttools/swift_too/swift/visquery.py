@@ -1,9 +1,11 @@
 from datetime import datetime, timedelta
+from typing import Any
 
 from pydantic import BaseModel, Field, computed_field, model_validator
 
 from swifttools.swift_too.base.functions import utcnow
 
+from ..base.batch import DEFAULT_MAX_CONCURRENCY
 from ..base.common import TOOAPIBaseclass
 from ..base.repr import TOOAPIReprMixin
 from ..base.schemas import (
@@ -17,6 +19,7 @@ from ..base.schemas import (
 from ..base.status import TOOStatus
 from .clock import TOOAPIClockCorrect
 from .resolve import TOOAPIAutoResolve
+from .visbatch import DEFAULT_NSIDE, batch_windows
 
 
 class SwiftVisWindow(BaseSchema, TOOAPIClockCorrect, TOOAPIReprMixin):
@@ -166,6 +169,122 @@ class SwiftVisQuery(TOOAPIBaseclass, TOOAPIClockCorrect, TOOAPIAutoResolve, Swif
     def __len__(self):
         return len(self.windows)
 
+    @classmethod
+    def batch(
+        cls,
+        coords: Any,
+        begin: datetime,
+        length: float | timedelta = 7,
+        hires: bool = False,
+        nside: int = DEFAULT_NSIDE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        username: str = "anonymous",
+        shared_secret: str = "anonymous",
+    ) -> Any:
+        """Visibility windows of many targets, sharing queries between nearby
+        targets.
+
+        Targets are grouped into sky tiles, each a HEALPix pixel for one UTC
+        day, and the visibility of each tile is queried once, at the center
+        of the pixel, and shared by all targets within it. Tiles already
+        queried by earlier calls are taken from `vis_tile_cache`, and the
+        rest are queried concurrently. Windows of consecutive days are
+        joined.
+
+        Parameters
+        ----------
+        coords : SkyCoord or list
+            Targets, as a `SkyCoord` or a sequence of (RA, Dec) pairs in J2000
+            decimal degrees.
+        begin : datetime
+            Start of the time range.
+        length : float or timedelta
+            Length of the time range (days).
+        hires : bool
+            Calculate visibility with high resolution, including Earth
+            constraints.
+        nside : int
+            HEALPix resolution of the tiles. Larger values give smaller tiles
+            (0.9 degrees across for 64), and so more queries.
+        max_concurrency : int
+            Maximum number of queries in flight at once.
+        username : str
+            username for TOO API (default 'anonymous')
+        shared_secret : str
+            shared secret for TOO API (default 'anonymous')
+
+        Returns
+        -------
+        pandas.DataFrame
+            A row per window, giving the `index` of the target in `coords`
+            and the window's `begin`, `end` and `length`. Targets whose tiles
+            could not be queried have no rows, and their errors are given in
+            `attrs["errors"]`, keyed by index.
+        """
+        if isinstance(length, timedelta):
+            length = length.total_seconds() / 86400
+        return batch_windows(
+            coords,
+            begin,
+            length,
+            hires=hires,
+            nside=nside,
+            max_concurrency=max_concurrency,
+            username=username,
+            shared_secret=shared_secret,
+        )
+
+    def _local_query(self) -> bool:
+        """Calculate the visibility windows with the local visibility engine,
+        if it is enabled and can calculate them."""
+        # Imported here to avoid a circular import
+        from .visengine import query_window, vis_engine
+
+        if not vis_engine.enabled or self.ra is None or self.dec is None:
+            return False
+        begin, end = query_window(self.begin, self.end, self.length)
+        if not vis_engine.can_calculate(begin, end, self.hires):
+            return False
+        windows = vis_engine.windows(float(self.ra), float(self.dec), begin, end, self.hires)[0]
+        object.__setattr__(self, "windows", windows)
+        self.status.status = "Accepted"
+        self._invalidate_fingerprint()
+        return True
+
+    def submit_get(self, refresh: bool = False) -> bool:
+        """Perform an API GET request to the server, unless the local
+        visibility engine can calculate the windows.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
+        if not refresh and self._local_query():
+            return True
+        return super().submit_get(refresh)
+
+    async def get(self, refresh: bool = False) -> bool:
+        """Perform an asynchronous API GET request to the server, unless the
+        local visibility engine can calculate the windows.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Bypass the response cache and always fetch from the server.
+        """
+        if not refresh and self._local_query():
+            return True
+        return await super().get(refresh)
+
+    def _submit_get_async(self) -> bool:
+        """Perform an API GET request for a queued request, unless the local
+        visibility engine can calculate the windows."""
+        if self._local_query():
+            object.__setattr__(self, "complete", True)
+            return True
+        return super()._submit_get_async()
+
 
 # Shorthand alias for class
 VisQuery = SwiftVisQuery
@@ -70,3 +70,18 @@ def disable_validate_assignment():
         BaseSchema.model_config.pop("validate_assignment", None)
     else:
         BaseSchema.model_config["validate_assignment"] = original
+
+
+@pytest.fixture(autouse=True)
+def reset_session_pool(monkeypatch):
+    """Discard pooled HTTP clients around each test, so that patched
+    `httpx.Client` mocks are picked up and never leak between tests. Retries
+    are made without waiting, and circuit breaker state is reset."""
+    import swifttools.swift_too.base.common as common_module
+
+    monkeypatch.setattr(common_module.retry_policy, "backoff_factor", 0.0)
+    common_module.session.close()
+    common_module.circuit_breaker.reset()
+    yield
+    common_module.session.close()
+    common_module.circuit_breaker.reset()
@@ -0,0 +1,47 @@
+# Local fixtures for tests/swift_too/base/batch
+import asyncio
+
+import pytest
+
+
+class FakeRequest:
+    """Minimal stand-in for an API object with an async `get()`"""
+
+    _get_schema = object()
+
+    def __init__(self, result=True, exc=None, delay=0.0, tracker=None):
+        from swifttools.swift_too.base.status import TOOStatus
+
+        self.status = TOOStatus()
+        self.result = result
+        self.exc = exc
+        self.delay = delay
+        self.tracker = tracker
+
+    def validate_get(self):
+        return True
+
+    async def get(self):
+        if self.tracker is not None:
+            self.tracker["active"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        try:
+            await asyncio.sleep(self.delay)
+            if self.exc is not None:
+                raise self.exc
+            if not self.result:
+                self.status.error("failed")
+            return self.result
+        finally:
+            if self.tracker is not None:
+                self.tracker["active"] -= 1
+
+
+@pytest.fixture
+def fake_request_cls():
+    return FakeRequest
+
+
+@pytest.fixture
+def tracker():
+    return {"active": 0, "peak": 0}
@@ -0,0 +1,75 @@
+import pytest
+
+from swifttools.swift_too import RequestBatch, gather
+from swifttools.swift_too.base.batch import BatchResult
+
+
+class TestGather:
+    @pytest.mark.asyncio
+    async def test_results_in_order(self, fake_request_cls):
+        requests = [fake_request_cls(delay=0.01 * (3 - i)) for i in range(3)]
+        results = await gather(requests, max_concurrency=3)
+        assert [r.request for r in results] == requests
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, fake_request_cls, tracker):
+        requests = [fake_request_cls(delay=0.01, tracker=tracker) for _ in range(10)]
+        await gather(requests, max_concurrency=3)
+        assert tracker["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_exception_is_isolated(self, fake_request_cls):
+        requests = [fake_request_cls(exc=RuntimeError("boom")), fake_request_cls()]
+        results = await gather(requests)
+        assert [r.success for r in results] == [False, True]
+
+    @pytest.mark.asyncio
+    async def test_exception_message(self, fake_request_cls):
+        results = await gather([fake_request_cls(exc=RuntimeError("boom"))])
+        assert results[0].error == "RuntimeError: boom"
+
+    @pytest.mark.asyncio
+    async def test_status_error_reported(self, fake_request_cls):
+        results = await gather([fake_request_cls(result=False)])
+        assert results[0].error == "failed"
+
+    @pytest.mark.asyncio
+    async def test_elapsed_recorded(self, fake_request_cls):
+        results = await gather([fake_request_cls(delay=0.01)])
+        assert results[0].elapsed >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_not_pending_is_skipped(self, fake_request_cls):
+        request = fake_request_cls()
+        request.status.status = "Accepted"
+        results = await gather([request])
+        assert results[0].success is False
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self, fake_request_cls):
+        with pytest.raises(ValueError):
+            await gather([fake_request_cls()], max_concurrency=0)
+
+
+class TestRequestBatch:
+    def test_submit_sync(self, fake_request_cls):
+        batch = RequestBatch([fake_request_cls(), fake_request_cls(result=False)], max_concurrency=2)
+        assert batch.submit() is False
+        assert len(batch.successful) == 1 and len(batch.failed) == 1
+
+    @pytest.mark.asyncio
+    async def test_submit_inside_running_loop(self, fake_request_cls):
+        batch = RequestBatch([fake_request_cls()])
+        assert batch.submit() is True
+
+    @pytest.mark.asyncio
+    async def test_run(self, fake_request_cls):
+        batch = RequestBatch([fake_request_cls()])
+        assert await batch.run() is True
+        assert isinstance(batch[0], BatchResult)
+
+    def test_table(self, fake_request_cls):
+        batch = RequestBatch([fake_request_cls()])
+        batch.submit()
+        header, table = batch._table
+        assert header[0] == "#" and table[0][1] == "FakeRequest"
@@ -0,0 +1,22 @@
+# Local fixtures for tests/swift_too/base/cache
+import pytest
+
+from swifttools.swift_too.base.cache import ResponseCache
+from swifttools.swift_too.base.common import response_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(path=tmp_path / "responses.sqlite", enabled=True)
+
+
+@pytest.fixture
+def enabled_response_cache(tmp_path):
+    """Enable the shared response cache in a temporary location"""
+    path, max_size, ttl = response_cache.path, response_cache.max_size, dict(response_cache.ttl)
+    response_cache.enable(path=tmp_path / "responses.sqlite")
+    response_cache.reset_stats()
+    yield response_cache
+    response_cache.disable()
+    response_cache.path, response_cache.max_size, response_cache.ttl = path, max_size, ttl
+    response_cache._initialized = False
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from swifttools.swift_too.base.cache import ResponseCache
+from swifttools.swift_too.base.functions import utcnow
+from swifttools.swift_too.swift.clock import SwiftClock
+from swifttools.swift_too.swift.datetime import swiftdatetime
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+from swifttools.swift_too.swift.resolve import SwiftResolve
+
+
+class TestResponseCache:
+    def test_disabled_by_default(self, tmp_path):
+        assert ResponseCache(path=tmp_path / "c.sqlite").enabled is False
+
+    def test_set_get(self, cache):
+        cache.set("key", "/resolve", b"body")
+        assert cache.get("key") == b"body"
+
+    def test_miss(self, cache):
+        assert cache.get("missing") is None
+        assert cache.stats["misses"] == 1
+
+    def test_hit_counted(self, cache):
+        cache.set("key", "/resolve", b"body")
+        cache.get("key")
+        assert cache.stats == {"hits": 1, "misses": 0, "stores": 1, "evictions": 0}
+
+    def test_expired(self, cache):
+        cache.set("key", "/resolve", b"body", ttl=-1)
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_persistent(self, cache):
+        cache.set("key", "/resolve", b"body")
+        assert ResponseCache(path=cache.path, enabled=True).get("key") == b"body"
+
+    def test_creates_directory(self, tmp_path):
+        cache = ResponseCache(path=tmp_path / "a" / "b" / "c.sqlite", enabled=True)
+        cache.set("key", "/resolve", b"body")
+        assert cache.path.exists()
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.max_size = 10
+        cache.set("a", "/resolve", b"12345")
+        time.sleep(0.01)
+        cache.set("b", "/resolve", b"12345")
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("c", "/resolve", b"12345")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"12345"
+        assert cache.stats["evictions"] == 1
+
+    def test_invalidate_endpoint(self, cache):
+        cache.set("a", "/resolve", b"1")
+        cache.set("b", "/swift/clock", b"2")
+        cache.invalidate("/resolve")
+        assert cache.get("a") is None
+        assert cache.get("b") == b"2"
+
+    def test_clear(self, cache):
+        cache.set("a", "/resolve", b"1")
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_key_normalized(self):
+        assert ResponseCache.key("url", {"a": 1, "b": 2}) == ResponseCache.key("url", {"b": 2, "a": 1})
+
+    def test_key_depends_on_username(self):
+        assert ResponseCache.key("url", {"a": 1}, "alice") != ResponseCache.key("url", {"a": 1}, "bob")
+
+
+class TestRequestCaching:
+    def test_disabled_always_fetches(self, mock_client, mock_cookie_jar, resolve_response):
+        mock_client.return_value.get.return_value = resolve_response
+        SwiftResolve(name="M31")
+        SwiftResolve(name="M31")
+        assert mock_client.return_value.get.call_count == 2
+
+    def test_repeat_request_from_cache(self, enabled_response_cache, mock_client, mock_cookie_jar, resolve_response):
+        mock_client.return_value.get.return_value = resolve_response
+        SwiftResolve(name="M31")
+        resolve = SwiftResolve(name="M31")
+        assert mock_client.return_value.get.call_count == 1
+        assert resolve.ra == pytest.approx(10.68)
+        assert resolve.resolver == "Simbad"
+
+    def test_refresh_bypasses_cache(self, enabled_response_cache, mock_client, mock_cookie_jar, resolve_response):
+        mock_client.return_value.get.return_value = resolve_response
+        SwiftResolve(name="M31")
+        resolve = SwiftResolve(name="M31", autosubmit=False)
+        assert resolve.submit_get(refresh=True) is True
+        assert mock_client.return_value.get.call_count == 2
+
+    def test_failed_response_not_cached(self, enabled_response_cache, mock_client, mock_cookie_jar, resolve_response):
+        mock_client.return_value.get.return_value = resolve_response
+        resolve_response.status_code = 500
+        SwiftResolve(name="M31")
+        assert len(enabled_response_cache) == 0
+
+    def test_async_get_uses_worker_thread(self, enabled_response_cache, mock_cookie_jar, resolve_response):
+        threads = []
+        cache_get, cache_set = enabled_response_cache.get, enabled_response_cache.set
+
+        def get(*args):
+            threads.append(threading.get_ident())
+            return cache_get(*args)
+
+        def set(*args):
+            threads.append(threading.get_ident())
+            return cache_set(*args)
+
+        async def fetch():
+            resolve = SwiftResolve(name="M31", autosubmit=False)
+            return await resolve.get(), threading.get_ident()
+
+        with (
+            patch("httpx.AsyncClient") as mock_client,
+            patch.object(enabled_response_cache, "get", get),
+            patch.object(enabled_response_cache, "set", set),
+        ):
+            mock_client.return_value.get = AsyncMock(return_value=resolve_response)
+            result, loop_thread = asyncio.run(fetch())
+        assert result is True
+        assert len(threads) == 2
+        assert loop_thread not in threads
+        assert len(enabled_response_cache) == 1
+
+    def test_ttl_override_disables(self, enabled_response_cache, mock_client, mock_cookie_jar, resolve_response):
+        enabled_response_cache.ttl["/resolve"] = 0
+        mock_client.return_value.get.return_value = resolve_response
+        SwiftResolve(name="M31")
+        SwiftResolve(name="M31")
+        assert mock_client.return_value.get.call_count == 2
+
+
+class TestCachePolicy:
+    def test_resolve_cached(self):
+        assert SwiftResolve(name="M31", autosubmit=False)._response_cache_ttl() == 30 * 86400
+
+    def test_clock_recent_not_cached(self):
+        clock = SwiftClock(met=100000000, autosubmit=False)
+        recent = swiftdatetime(*(utcnow() - timedelta(days=1)).timetuple()[:6])
+        recent.isutc = True
+        clock._set_entries([swiftdatetime.frommet(100000000, utcf=-20.0, isutc=True), recent])
+        assert clock._response_cache_ttl() == 0
+
+    def test_clock_old_cached(self):
+        clock = SwiftClock(met=100000000, autosubmit=False)
+        clock._set_entries([swiftdatetime.frommet(100000000, utcf=-20.0, isutc=True)])
+        assert clock._response_cache_ttl() is None
+
+    def test_afst_within_afstmax_cached(self):
+        afst = SwiftAFST(begin=datetime(2020, 1, 1), end=datetime(2020, 1, 2), autosubmit=False)
+        afst.afstmax = datetime(2024, 1, 1)
+        assert afst._response_cache_ttl() is None
+
+    def test_afst_beyond_afstmax_not_cached(self):
+        afst = SwiftAFST(begin=datetime(2020, 1, 1), end=datetime(2020, 1, 2), autosubmit=False)
+        afst.afstmax = datetime(2020, 1, 1) + timedelta(hours=1)
+        assert afst._response_cache_ttl() == 0
@@ -0,0 +1,16 @@
+# Local fixtures for tests/swift_too/base/coalesce
+import threading
+
+import pytest
+
+from swifttools.swift_too.base.coalesce import RequestCoalescer
+
+
+@pytest.fixture
+def coalescer():
+    return RequestCoalescer()
+
+
+@pytest.fixture
+def gate():
+    return threading.Event()
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import swifttools.swift_too.base.common as common_module
+from swifttools.swift_too.base.session import TOOAPISession
+from swifttools.swift_too.swift.resolve import SwiftResolve
+
+
+class TestRequestCoalescer:
+    def test_single_call(self, coalescer):
+        assert coalescer.do("key", lambda: 1) == (1, False)
+
+    def test_no_key_not_shared(self, coalescer):
+        assert coalescer.do(None, lambda: 1) == (1, False)
+        assert coalescer.stats == {"requests": 0, "shared": 0}
+
+    def test_concurrent_calls_shared(self, coalescer, gate):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            gate.wait(5)
+            return "response"
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(coalescer.do, "key", fn) for _ in range(4)]
+            while coalescer.stats["shared"] < 3:
+                time.sleep(0.001)
+            gate.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert len(calls) == 1
+        assert [r[0] for r in results] == ["response"] * 4
+        assert sorted(r[1] for r in results) == [False, True, True, True]
+        assert len(coalescer) == 0
+
+    def test_different_keys_not_shared(self, coalescer):
+        assert coalescer.do("a", lambda: 1) == (1, False)
+        assert coalescer.do("b", lambda: 2) == (2, False)
+        assert coalescer.stats == {"requests": 2, "shared": 0}
+
+    def test_sequential_calls_not_shared(self, coalescer):
+        coalescer.do("key", lambda: 1)
+        assert coalescer.do("key", lambda: 2) == (2, False)
+
+    def test_exception_shared(self, coalescer, gate):
+        def fn():
+            gate.wait(5)
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(coalescer.do, "key", fn) for _ in range(2)]
+            while coalescer.stats["shared"] < 1:
+                time.sleep(0.001)
+            gate.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match="boom"):
+                    future.result(timeout=5)
+
+    def test_disabled(self, coalescer):
+        coalescer.enabled = False
+        assert coalescer.do("key", lambda: 1) == (1, False)
+        assert coalescer.stats["requests"] == 0
+
+    def test_async_calls_shared(self, coalescer):
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "response"
+
+        async def main():
+            return await asyncio.gather(*(coalescer.do_async("key", fn) for _ in range(5)))
+
+        results = asyncio.run(main())
+        assert len(calls) == 1
+        assert [r[0] for r in results] == ["response"] * 5
+        assert coalescer.stats == {"requests": 1, "shared": 4}
+        assert len(coalescer) == 0
+
+    def test_async_exception_shared(self, coalescer):
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(*(coalescer.do_async("key", fn) for _ in range(2)), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_async_leader_cancelled(self, coalescer):
+        async def fn():
+            await asyncio.sleep(0.01)
+            return "response"
+
+        async def main():
+            leader = asyncio.create_task(coalescer.do_async("key", fn))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(coalescer.do_async("key", fn))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(main()) == ("response", False)
+
+
+class TestRequestCoalescing:
+    def test_concurrent_identical_requests(self, mock_client, mock_cookie_jar, resolve_response, gate):
+        def get(*args, **kwargs):
+            gate.wait(5)
+            return resolve_response
+
+        mock_client.return_value.get.side_effect = get
+        common_module.inflight.reset_stats()
+        resolves = [SwiftResolve(name="M31", autosubmit=False) for _ in range(3)]
+        threads = [threading.Thread(target=r.submit) for r in resolves]
+        for thread in threads:
+            thread.start()
+        while common_module.inflight.stats["shared"] < 2:
+            time.sleep(0.001)
+        gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert mock_client.return_value.get.call_count == 1
+        assert all(r.ra == pytest.approx(10.68) for r in resolves)
+        assert all(r.status.status == "Accepted" for r in resolves)
+
+    def test_shared_failure_reports_error(self, mock_client, mock_cookie_jar, gate):
+        def get(*args, **kwargs):
+            gate.wait(5)
+            raise ConnectionError("unreachable")
+
+        mock_client.return_value.get.side_effect = get
+        common_module.inflight.reset_stats()
+        resolves = [SwiftResolve(name="M31", autosubmit=False) for _ in range(2)]
+        threads = [threading.Thread(target=r.submit) for r in resolves]
+        for thread in threads:
+            thread.start()
+        while common_module.inflight.stats["shared"] < 1:
+            time.sleep(0.001)
+        gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert mock_client.return_value.get.call_count == 1
+        assert all(r.status.errors == ["Request failed: unreachable"] for r in resolves)
+
+    def test_async_identical_requests(self, mock_cookie_jar, resolve_response, monkeypatch):
+        calls = []
+
+        async def get(*args, **kwargs):
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return resolve_response
+
+        client = type("Client", (), {"get": staticmethod(get)})()
+        monkeypatch.setattr(TOOAPISession, "async_client", property(lambda self: client))
+
+        async def main():
+            resolves = [SwiftResolve(name="M31", autosubmit=False) for _ in range(3)]
+            return resolves, await asyncio.gather(*(r.get() for r in resolves))
+
+        resolves, results = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert results == [True, True, True]
+        assert all(r.resolver == "Simbad" for r in resolves)
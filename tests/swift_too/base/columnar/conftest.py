@@ -0,0 +1,43 @@
+# Local fixtures for tests/swift_too/base/columnar
+from datetime import datetime
+
+import httpx
+import pytest
+
+from ...conftest import afst_entry
+from ...conftest import afst_payload as afst_response
+
+
+@pytest.fixture
+def afst_payload():
+    entries = [afst_entry(i) for i in range(4)]
+    entries[3]["end"] = None
+    entries[3]["fom"] = None
+    return afst_response(entries, datetime(2024, 1, 1), datetime(2024, 1, 3))
+
+
+@pytest.fixture
+def ppst_payload():
+    entries = [afst_entry(i) for i in range(3)]
+    for entry in entries:
+        del entry["settle"]
+        entry["fom"] = 2.5
+    return {
+        "begin": "2024-01-01T00:00:00Z",
+        "end": "2024-01-03T00:00:00Z",
+        "entries": entries,
+        "status": {"status": "Accepted"},
+    }
+
+
+@pytest.fixture
+def api(mock_api, afst_payload, ppst_payload):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        payload = afst_payload if request.url.path.endswith("obsquery") else ppst_payload
+        return httpx.Response(200, json=payload)
+
+    mock_api(handler)
+    return requests
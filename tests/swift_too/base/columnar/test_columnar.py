@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+from swifttools.swift_too.swift.planquery import SwiftPPST
+
+
+@pytest.fixture
+def afst(api):
+    return SwiftAFST(begin=datetime(2024, 1, 1), length=2, autosubmit=False)
+
+
+@pytest.fixture
+def ppst(api):
+    return SwiftPPST(begin=datetime(2024, 1, 1), length=2, autosubmit=False)
+
+
+class TestColumns:
+    def test_from_entries(self, afst):
+        assert afst.submit_get()
+        columns = afst.columns
+        assert columns["begin"].dtype == np.dtype("datetime64[us]")
+        assert columns["begin"][1] == np.datetime64("2024-01-01T00:30:00")
+        assert np.isnat(columns["end"][3])
+        assert columns["target_name"].tolist() == [f"Target {i}" for i in range(4)]
+        assert columns["target_id"].dtype == np.int64
+        assert np.isnan(columns["fom"][3])
+
+    def test_request_settings_not_columns(self, afst):
+        afst.submit_get()
+        assert "username" not in afst.columns
+        assert "skycoord" not in afst.columns
+
+    def test_columnar_only(self, afst):
+        assert afst.submit_columnar()
+        assert afst.entries == []
+        assert afst.status.status == "Accepted"
+        assert len(afst.columns["begin"]) == 4
+
+    def test_columnar_matches_entries(self, afst):
+        afst.submit_get()
+        from_entries = afst.columns
+        afst.submit_columnar()
+        from_payload = afst.columns
+        assert from_entries.keys() == from_payload.keys()
+        for name in from_entries:
+            if from_entries[name].dtype == object:
+                assert from_entries[name].tolist() == from_payload[name].tolist()
+            else:
+                np.testing.assert_array_equal(from_entries[name], from_payload[name])
+
+    def test_obs_id_validated(self, afst):
+        afst.submit_get()
+        expected = afst.entries[0].obs_id
+        afst.submit_columnar()
+        assert isinstance(expected, str)
+        assert afst.columns["obs_id"][0] == expected
+
+    def test_submit_get_after_columnar(self, afst):
+        afst.submit_columnar()
+        afst.submit_get()
+        assert len(afst.entries) == 4
+        assert afst.columns["target_name"][0] == "Target 0"
+
+    @pytest.mark.asyncio
+    async def test_get_columnar(self, afst):
+        assert await afst.get_columnar()
+        assert afst.entries == []
+        assert len(afst.columns["begin"]) == 4
+
+    def test_timezones(self, ppst):
+        ppst.submit_columnar()
+        assert ppst.columns["begin"][0] == np.datetime64("2024-01-01T00:00:00")
+        assert ppst.columns["fom"].dtype == float
+
+    def test_empty(self, afst, afst_payload):
+        afst_payload["entries"] = []
+        afst.submit_columnar()
+        assert len(afst.to_numpy_structured()) == 0
+
+
+class TestExport:
+    def test_numpy_structured(self, afst):
+        afst.submit_columnar()
+        array = afst.to_numpy_structured()
+        assert len(array) == 4
+        assert array["roll"][0] == 12.5
+        assert array.dtype["begin"] == np.dtype("datetime64[us]")
+
+    def test_pandas(self, ppst):
+        ppst.submit_get()
+        frame = ppst.to_pandas()
+        assert len(frame) == 3
+        assert frame["begin"].dtype.kind == "M"
+        assert frame["target_name"].iloc[2] == "Target 2"
+
+    def test_arrow(self, afst):
+        pa = pytest.importorskip("pyarrow")
+        afst.submit_columnar()
+        table = afst.to_arrow()
+        assert table.num_rows == 4
+        assert table.schema.field("begin").type == pa.timestamp("us")
@@ -100,6 +100,47 @@ class TestMockTOOAPIBaseclass:
         assert isinstance(hash(obj), int)
         assert obj in {obj}
 
+    def test_hash_is_cached(self, mock_too_api_baseclass):
+        obj = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        hash(obj)
+        with patch.object(mock_too_api_baseclass, "model_dump", side_effect=AssertionError("re-serialized")):
+            assert obj in {obj}
+
+    def test_hash_invalidated_on_assignment(self, mock_too_api_baseclass):
+        obj = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        before = hash(obj)
+        obj.obs_id = 8
+        assert hash(obj) != before
+        assert hash(obj) == hash(mock_too_api_baseclass(obs_id=8, autosubmit=False))
+
+    def test_hash_invalidated_on_response(self, mock_too_api_baseclass):
+        obj = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        before = hash(obj)
+        response = Mock(status_code=200)
+        response.json.return_value = {"obs_id": 9}
+        assert obj._handle_response(response)
+        assert hash(obj) != before
+
+    def test_fingerprint_not_shared_with_copy(self, mock_too_api_baseclass):
+        obj = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        obj.fingerprint()
+        copied = obj.model_copy(update={"obs_id": 8})
+        assert copied.fingerprint() != obj.fingerprint()
+
+    def test_fingerprint_request_only_ignores_results(self, mock_too_api_baseclass):
+        obj = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        other = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        other.status.error("failed")
+        assert other.fingerprint(request_only=True) == obj.fingerprint(request_only=True)
+        assert other.fingerprint() != obj.fingerprint()
+
+    def test_hash_request_only_setting(self, mock_too_api_baseclass, monkeypatch):
+        monkeypatch.setattr(common_module, "hash_request_only", True)
+        obj = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        other = mock_too_api_baseclass(obs_id=7, autosubmit=False)
+        other.status.error("failed")
+        assert hash(obj) == hash(other)
+
     def test_get_schema_for_init_uses_default_attr(self, mock_base_class, mock_too_api_baseclass, mock_schema):
         class Wrapper:
             default = mock_schema
@@ -147,8 +188,8 @@ class TestMockTOOAPIBaseclass:
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "success"}
 
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.post.return_value = Mock(status_code=200)
 
             # Mock model_validate
             def mock_model_validate(data):
@@ -166,8 +207,8 @@ class TestMockTOOAPIBaseclass:
             mock_response = Mock()
             mock_response.status_code = 400
             mock_response.text = "Bad Request"
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.post.return_value = Mock(status_code=200)
 
             result = mock_base_class.submit_get()
             assert result is False
@@ -179,8 +220,8 @@ class TestMockTOOAPIBaseclass:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.post.return_value = Mock(status_code=200)
 
             result = mock_base_class.submit_get()
             assert result is False
@@ -430,7 +471,7 @@ class TestMockTOOAPIBaseclass:
             mock_response.status_code = 400
             mock_response.text = "Bad Request"
 
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = mock_base_class.submit_post()
             assert result is False
@@ -446,7 +487,7 @@ class TestMockTOOAPIBaseclass:
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
 
-            mock_client.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_client.return_value.post.return_value = mock_response
 
             result = mock_base_class.submit_post()
             assert result is False
@@ -599,9 +640,9 @@ class TestMockTOOAPIBaseclass:
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "success"}
             # Mock both GET and POST responses (POST is for login)
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             login_response = Mock(status_code=200)
-            mock_client.return_value.__enter__.return_value.post.return_value = login_response
+            mock_client.return_value.post.return_value = login_response
             # Don't patch _ensure_authenticated - let it run and call save
             m.submit_get()
             mock_cookie_jar.save.assert_called_with(ignore_discard=True)
@@ -645,9 +686,6 @@ class TestMockTOOAPIBaseclass:
     def test_queue_get_success(
         self, mock_cookie_jar, mock_client, mock_base_class, mock_validated_payload, mock_too_api_baseclass, mock_schema
     ):
-        import time
-        from unittest.mock import patch
-
         mock_base_class.status.status = "Pending"
         object.__setattr__(mock_base_class, "complete", False)
         assert mock_base_class.complete is False
@@ -657,8 +695,8 @@ class TestMockTOOAPIBaseclass:
             mock_response.status_code = 200
             mock_response.json.return_value = {"status": "success"}
 
-            mock_client.return_value.__enter__.return_value.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+            mock_client.return_value.get.return_value = mock_response
+            mock_client.return_value.post.return_value = Mock(status_code=200)
 
             # Mock model_validate
             def mock_model_validate(data):
@@ -666,10 +704,8 @@ class TestMockTOOAPIBaseclass:
                 return mock_base_class
 
             with patch.object(mock_too_api_baseclass, "model_validate", side_effect=mock_model_validate):
-                result = mock_base_class.queue()
-                assert result is True
-                # Wait a bit for the thread to complete
-                time.sleep(0.1)
+                job = mock_base_class.queue()
+                assert job.result(timeout=5) is True
                 assert mock_base_class.complete is True
 
     def test_queue_validation_failures(self, mock_base_class, post_only_model_cls, mock_too_api_baseclass):
@@ -685,45 +721,39 @@ class TestMockTOOAPIBaseclass:
     def test_queue_post_success_and_not_pending_success(self, post_only_model_cls):
         obj = post_only_model_cls(username="u", shared_secret="s", autosubmit=False)
         obj.status.status = "Pending"
-        thread_mock = Mock()
-        thread_mock.start.return_value = None
-        with patch("swifttools.swift_too.base.common.threading.Thread", return_value=thread_mock):
+        with patch("swifttools.swift_too.base.common.scheduler.submit", return_value=Mock()) as submit_mock:
             with patch.object(post_only_model_cls, "validate_post", return_value=True):
-                assert obj.queue() is True
+                assert obj.queue() is submit_mock.return_value
 
-    def test_queue_post_success_and_not_pending_thread_count(self, post_only_model_cls):
+    def test_queue_post_success_and_not_pending_no_threads(self, post_only_model_cls):
         obj = post_only_model_cls(username="u", shared_secret="s", autosubmit=False)
         obj.status.status = "Pending"
-        thread_mock = Mock()
-        thread_mock.start.return_value = None
-        with patch("swifttools.swift_too.base.common.threading.Thread", return_value=thread_mock):
+        with patch("swifttools.swift_too.base.common.scheduler.submit", return_value=Mock()) as submit_mock:
             with patch.object(post_only_model_cls, "validate_post", return_value=True):
                 obj.queue()
-                assert thread_mock.start.call_count == 2
+                assert submit_mock.call_count == 1
 
     def test_queue_post_success_and_not_pending_not_pending(self, post_only_model_cls):
         obj = post_only_model_cls(username="u", shared_secret="s", autosubmit=False)
         obj.status.status = "Complete"
         assert obj.queue() is False
 
-    def test_queue_watchdog_timeout_sets_error_and_complete(self, mock_base_class):
-        mock_base_class._timeout = 0
+    def test_queue_timeout_sets_error_and_complete_complete(self, mock_base_class):
         object.__setattr__(mock_base_class, "complete", False)
-
-    def test_queue_watchdog_timeout_sets_error_and_complete_complete(self, mock_base_class):
-        mock_base_class._timeout = 0
-        object.__setattr__(mock_base_class, "complete", False)
-        with patch("swifttools.swift_too.base.common.time.sleep", return_value=None):
-            mock_base_class._queue_watchdog()
+        mock_base_class._queue_timeout(30)
         assert mock_base_class.complete is True
 
-    def test_queue_watchdog_timeout_sets_error_and_complete_error(self, mock_base_class):
-        mock_base_class._timeout = 0
+    def test_queue_timeout_sets_error_and_complete_error(self, mock_base_class):
         object.__setattr__(mock_base_class, "complete", False)
-        with patch("swifttools.swift_too.base.common.time.sleep", return_value=None):
-            mock_base_class._queue_watchdog()
+        mock_base_class._queue_timeout(30)
         assert any("Asynchronous request timed out" in e for e in mock_base_class.status.errors)
 
+    def test_queue_timeout_ignored_when_complete(self, mock_base_class):
+        object.__setattr__(mock_base_class, "complete", True)
+        mock_base_class.status.errors = []
+        mock_base_class._queue_timeout(30)
+        assert mock_base_class.status.errors == []
+
     def test_ensure_authenticated_branches_anonymous(self, mock_base_class):
         client = Mock()
         mock_base_class.username = "anonymous"
@@ -769,8 +799,8 @@ class TestMockTOOAPIBaseclass:
         self, mock_cookie_jar, mock_client, mock_base_class, mock_validated_payload, mock_too_api_baseclass, mock_schema
     ):
         with patch.object(mock_schema, "model_validate", return_value=mock_validated_payload):
-            mock_client.return_value.__enter__.return_value.get.side_effect = Exception("x")
-            mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+            mock_client.return_value.get.side_effect = Exception("x")
+            mock_client.return_value.post.return_value = Mock(status_code=200)
             assert mock_base_class.submit_get() is False
 
         with patch.object(mock_too_api_baseclass, "_post_schema", Mock()) as mock_schema:
@@ -781,21 +811,21 @@ class TestMockTOOAPIBaseclass:
         with patch.object(mock_too_api_baseclass, "_post_schema", Mock()) as mock_schema:
             mock_schema.model_fields = {}
             mock_schema.model_validate.return_value.model_dump.return_value = {"p": 1}
-            mock_client.return_value.__enter__.return_value.post.side_effect = Exception("x")
+            mock_client.return_value.post.side_effect = Exception("x")
             assert mock_base_class.submit_post() is False
 
         with patch.object(mock_too_api_baseclass, "_post_schema", Mock()) as mock_schema:
             mock_schema.model_fields = {}
             mock_schema.model_validate.return_value.model_dump.return_value = {"p": 1}
             with patch.object(mock_too_api_baseclass, "_ensure_authenticated", return_value=True):
-                mock_client.return_value.__enter__.return_value.post.side_effect = Exception("boom")
+                mock_client.return_value.post.side_effect = Exception("boom")
                 assert mock_base_class.submit_post() is False
 
         with patch.object(mock_too_api_baseclass, "_post_schema", Mock()) as mock_schema:
             mock_schema.model_fields = {}
             mock_schema.model_validate.return_value.model_dump.return_value = {"p": 1}
-            mock_client.return_value.__enter__.return_value.post.side_effect = None
-            mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+            mock_client.return_value.post.side_effect = None
+            mock_client.return_value.post.return_value = Mock(status_code=200)
             with patch.object(mock_too_api_baseclass, "_ensure_authenticated", return_value=True):
                 with patch.object(mock_too_api_baseclass, "_handle_response", return_value=True):
                     assert mock_base_class.submit_post() is True
@@ -811,7 +841,7 @@ class TestMockTOOAPIBaseclass:
 
         with patch.object(mock_too_api_baseclass, "_ensure_authenticated", return_value=True):
             with patch.object(mock_schema, "model_validate", return_value=mock_validated_payload):
-                mock_client.return_value.__enter__.return_value.get.side_effect = Exception("x")
+                mock_client.return_value.get.side_effect = Exception("x")
                 object.__setattr__(mock_base_class, "complete", False)
                 mock_base_class._submit_get_async()
                 assert mock_base_class.complete is True
@@ -835,7 +865,7 @@ class TestMockTOOAPIBaseclass:
             mock_schema.model_fields = {}
             mock_schema.model_validate.return_value.model_dump.return_value = {"p": 1}
             with patch.object(mock_too_api_baseclass, "_ensure_authenticated", return_value=True):
-                mock_client.return_value.__enter__.return_value.post.side_effect = Exception("x")
+                mock_client.return_value.post.side_effect = Exception("x")
                 object.__setattr__(mock_base_class, "complete", False)
                 mock_base_class._submit_post_async()
                 assert mock_base_class.complete is True
@@ -844,8 +874,8 @@ class TestMockTOOAPIBaseclass:
             mock_schema.model_fields = {}
             mock_schema.model_validate.return_value.model_dump.return_value = {"p": 1}
             with patch.object(mock_too_api_baseclass, "_ensure_authenticated", return_value=True):
-                mock_client.return_value.__enter__.return_value.post.side_effect = None
-                mock_client.return_value.__enter__.return_value.post.return_value = Mock(status_code=200)
+                mock_client.return_value.post.side_effect = None
+                mock_client.return_value.post.return_value = Mock(status_code=200)
                 with patch.object(mock_too_api_baseclass, "_handle_response_async") as m_async:
                     mock_base_class._submit_post_async()
                     m_async.assert_called_once()
@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 from pydantic import BaseModel
 
@@ -19,6 +20,15 @@ def mock_cookie_jar():
         yield mock
 
 
+@pytest.fixture
+def resolve_response():
+    return httpx.Response(
+        200,
+        json={"name": "M31", "ra": 10.68, "dec": 41.27, "resolver": "Simbad", "status": {"status": "Accepted"}},
+        request=httpx.Request("GET", "https://www.swift.psu.edu/api/v1.2/resolve"),
+    )
+
+
 @pytest.fixture
 def mock_validated_payload():
     validated = Mock()
@@ -0,0 +1,30 @@
+# Local fixtures for tests/swift_too/base/intervals
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+START = datetime(2024, 1, 1)
+
+
+def random_set(rng, n, span_minutes=2000):
+    """Begin and end of random, possibly overlapping intervals on a whole
+    minute grid."""
+    begin = rng.integers(0, span_minutes, n)
+    end = begin + rng.integers(0, 60, n)
+    minute = np.timedelta64(1, "m")
+    return np.datetime64(START, "us") + begin * minute, np.datetime64(START, "us") + end * minute
+
+
+def grid_mask(begin, end, span_minutes=2100):
+    """Membership of each whole minute, from a loop over the intervals."""
+    times = np.datetime64(START, "us") + np.arange(span_minutes) * np.timedelta64(1, "m")
+    mask = np.zeros(span_minutes, dtype=bool)
+    for b, e in zip(begin, end):
+        mask |= (times >= b) & (times < e)
+    return times, mask
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(5)
@@ -0,0 +1,131 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from swifttools.swift_too.base.columnar import build_columns
+from swifttools.swift_too.base.intervals import IntervalSet
+from swifttools.swift_too.swift.obsquery import SwiftAFST, SwiftAFSTEntry
+from swifttools.swift_too.swift.saa import SwiftSAA, SwiftSAAEntry
+from swifttools.swift_too.swift.visquery import SwiftVisQuery, SwiftVisWindow
+
+from .conftest import START, grid_mask, random_set
+
+
+def hours(*pairs):
+    """IntervalSet of (begin, end) pairs of hours after START."""
+    return IntervalSet([START + timedelta(hours=b) for b, _ in pairs], [START + timedelta(hours=e) for _, e in pairs])
+
+
+class TestConstruction:
+    def test_merges_overlapping_and_touching(self):
+        intervals = hours((5, 6), (0, 2), (1, 3), (3, 4), (7, 7))
+        assert list(intervals) == list(hours((0, 4), (5, 6)))
+        assert len(intervals) == 2
+
+    def test_contained_interval(self):
+        assert hours((0, 10), (2, 3), (4, 5)) == hours((0, 10))
+
+    def test_empty(self):
+        intervals = IntervalSet()
+        assert len(intervals) == 0
+        assert intervals.duration == timedelta(0)
+        assert START not in intervals
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            IntervalSet([START], [])
+
+    def test_from_windows(self):
+        windows = [SwiftVisWindow(begin=START, end=START + timedelta(hours=1)), (START + timedelta(hours=2), None)]
+        assert IntervalSet.from_windows(windows) == hours((0, 1))
+
+
+class TestAlgebra:
+    def test_examples(self):
+        a = hours((0, 2), (4, 6))
+        b = hours((1, 5))
+        assert a | b == hours((0, 6))
+        assert a & b == hours((1, 2), (4, 5))
+        assert a - b == hours((0, 1), (5, 6))
+        assert b - a == hours((2, 4))
+        assert a.complement() == hours((2, 4))
+        assert a.complement(START - timedelta(hours=1), START + timedelta(hours=7)) == hours((-1, 0), (2, 4), (6, 7))
+        assert a.clip(START + timedelta(hours=1), START + timedelta(hours=5)) == hours((1, 2), (4, 5))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_loops(self, seed):
+        rng = np.random.default_rng(seed)
+        a_begin, a_end = random_set(rng, 60)
+        b_begin, b_end = random_set(rng, 60)
+        a, b = IntervalSet(a_begin, a_end), IntervalSet(b_begin, b_end)
+        times, in_a = grid_mask(a_begin, a_end)
+        _, in_b = grid_mask(b_begin, b_end)
+
+        for result, expected in (
+            (a | b, in_a | in_b),
+            (a & b, in_a & in_b),
+            (a - b, in_a & ~in_b),
+            (b - a, in_b & ~in_a),
+        ):
+            assert np.array_equal(result.contains(times), expected)
+            assert result.duration == timedelta(minutes=int(expected.sum()))
+            # Results are sorted, disjoint and not touching
+            assert np.all(result.begin[1:] > result.end[:-1])
+
+    def test_contains_is_half_open(self):
+        intervals = hours((0, 1))
+        assert START in intervals
+        assert START + timedelta(minutes=59) in intervals
+        assert START + timedelta(hours=1) not in intervals
+        assert START - timedelta(seconds=1) not in intervals
+        assert intervals.contains([START, START + timedelta(hours=2)]).tolist() == [True, False]
+
+    def test_durations(self):
+        intervals = hours((0, 1), (2, 5))
+        assert intervals.duration == timedelta(hours=4)
+        assert intervals.durations.tolist() == [timedelta(hours=1), timedelta(hours=3)]
+        assert intervals[1] == (START + timedelta(hours=2), START + timedelta(hours=5))
+
+
+class TestFromResult:
+    def test_visquery(self):
+        query = SwiftVisQuery(ra=10.0, dec=20.0, begin=START, length=1, autosubmit=False)
+        query.windows = [
+            SwiftVisWindow(begin=START, end=START + timedelta(hours=2)),
+            SwiftVisWindow(begin=START + timedelta(hours=3), end=START + timedelta(hours=4)),
+        ]
+        assert IntervalSet.from_result(query) == hours((0, 2), (3, 4))
+
+    def test_saa(self):
+        saa = SwiftSAA(begin=START, length=1, autosubmit=False)
+        saa.entries = [SwiftSAAEntry(begin=START + timedelta(hours=1), end=START + timedelta(hours=1.5))]
+        assert IntervalSet.from_result(saa) == hours((1, 1.5))
+
+    def test_visibility_outside_saa(self):
+        vis = IntervalSet.from_result(
+            SwiftVisQuery(
+                ra=10.0,
+                dec=20.0,
+                begin=START,
+                length=1,
+                windows=[SwiftVisWindow(begin=START, end=START + timedelta(hours=4))],
+                autosubmit=False,
+            )
+        )
+        saa = hours((1, 1.5), (3, 5))
+        assert (vis - saa).duration == timedelta(hours=2.5)
+
+    def test_afst(self):
+        afst = SwiftAFST(begin=START, end=START + timedelta(days=1), autosubmit=False)
+        times = [(START + timedelta(hours=i), START + timedelta(hours=i, minutes=30)) for i in range(3)]
+        entries = [SwiftAFSTEntry.model_construct(begin=begin, end=end) for begin, end in times]
+        object.__setattr__(afst, "entries", entries)
+        expected = hours((0, 0.5), (1, 1.5), (2, 2.5))
+        assert IntervalSet.from_result(afst) == expected
+
+        # Results fetched as columns only, ignoring entries without times
+        rows = [{"begin": begin.isoformat(), "end": end.isoformat()} for begin, end in times] + [{"begin": None}]
+        object.__setattr__(afst, "entries", [])
+        object.__setattr__(afst, "_column_data", build_columns(SwiftAFSTEntry, rows))
+        assert IntervalSet.from_result(afst) == expected
@@ -0,0 +1,38 @@
+# Local fixtures for tests/swift_too/base/jobs
+import threading
+
+import pytest
+
+from swifttools.swift_too.base.jobs import QueueScheduler
+
+
+class FakeRequest:
+    """Minimal stand-in for a queued API object"""
+
+    def __init__(self):
+        self.complete = False
+        self.timed_out = None
+
+    def on_timeout(self, wait_seconds):
+        self.timed_out = wait_seconds
+        self.complete = True
+
+
+@pytest.fixture
+def fake_request():
+    return FakeRequest()
+
+
+@pytest.fixture
+def job_scheduler():
+    sched = QueueScheduler(max_workers=2)
+    yield sched
+    sched.shutdown(wait=True)
+
+
+@pytest.fixture
+def gate():
+    """Event used to hold a worker busy until released"""
+    event = threading.Event()
+    yield event
+    event.set()
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from swifttools.swift_too import QueryJob
+from swifttools.swift_too.base.jobs import TimeoutTimer
+
+
+class TestQueueScheduler:
+    def test_submit_returns_job(self, job_scheduler, fake_request):
+        job = job_scheduler.submit(fake_request, lambda: True)
+        assert isinstance(job, QueryJob)
+
+    def test_result(self, job_scheduler, fake_request):
+        job = job_scheduler.submit(fake_request, lambda: True)
+        assert job.result(timeout=5) is True
+
+    def test_done(self, job_scheduler, fake_request):
+        job = job_scheduler.submit(fake_request, lambda: True)
+        job.result(timeout=5)
+        assert job.done()
+
+    def test_exception_propagates(self, job_scheduler, fake_request):
+        def boom():
+            raise RuntimeError("boom")
+
+        job = job_scheduler.submit(fake_request, boom)
+        with pytest.raises(RuntimeError, match="boom"):
+            job.result(timeout=5)
+
+    def test_worker_pool_is_bounded(self, job_scheduler, fake_request, gate):
+        before = threading.active_count()
+        jobs = [job_scheduler.submit(fake_request, gate.wait, timeout=60) for _ in range(20)]
+        assert threading.active_count() - before <= job_scheduler.max_workers + 1
+        gate.set()
+        assert all(job.result(timeout=5) for job in jobs)
+
+    def test_cancel_pending_job(self, job_scheduler, fake_request, gate):
+        _ = [job_scheduler.submit(fake_request, gate.wait) for _ in range(job_scheduler.max_workers)]
+        job = job_scheduler.submit(fake_request, lambda: True)
+        assert job.cancel() is True
+        with pytest.raises(CancelledError):
+            job.result(timeout=1)
+        assert fake_request.complete is True
+
+    def test_timeout(self, job_scheduler, fake_request, gate):
+        job = job_scheduler.submit(fake_request, gate.wait, timeout=0.05, on_timeout=fake_request.on_timeout)
+        with pytest.raises(TimeoutError):
+            job.result(timeout=5)
+        assert fake_request.timed_out == 0.05
+
+    def test_timeout_cancelled_on_completion(self, job_scheduler, fake_request):
+        job = job_scheduler.submit(fake_request, lambda: True, timeout=60)
+        job.result(timeout=5)
+        assert len(job_scheduler.timer) == 0
+
+    def test_done_callback(self, job_scheduler, fake_request):
+        called = threading.Event()
+        job = job_scheduler.submit(fake_request, lambda: True)
+        job.add_done_callback(lambda j: called.set() if j is job else None)
+        assert called.wait(5)
+
+    def test_await_job(self, job_scheduler, fake_request):
+        async def main():
+            return await job_scheduler.submit(fake_request, lambda: True)
+
+        assert asyncio.run(main()) is True
+
+    def test_job_is_truthy(self, job_scheduler, fake_request):
+        assert job_scheduler.submit(fake_request, lambda: True)
+
+
+class TestTimeoutTimer:
+    def test_fires_in_deadline_order(self):
+        timer = TimeoutTimer()
+        fired = []
+        done = threading.Event()
+        timer.schedule(0.02, lambda: fired.append(2) or done.set())
+        timer.schedule(0.01, lambda: fired.append(1))
+        assert done.wait(5)
+        assert fired == [1, 2]
+
+    def test_cancel(self):
+        timer = TimeoutTimer()
+        fired = []
+        entry = timer.schedule(0.01, lambda: fired.append(1))
+        timer.cancel(entry)
+        time.sleep(0.05)
+        assert fired == []
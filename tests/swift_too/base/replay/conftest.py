@@ -0,0 +1,29 @@
+# Local fixtures for tests/swift_too/base/replay
+import httpx
+import pytest
+
+import swifttools.swift_too.base.common as common_module
+from swifttools.swift_too.base.replay import Cassette, RecordingTransport
+
+RESOLVE_PAYLOAD = {"name": "Crab", "ra": 83.63, "dec": 22.01, "resolver": "Simbad", "status": {"status": "Accepted"}}
+
+
+@pytest.fixture(autouse=True)
+def reset_transport():
+    yield
+    common_module.session.configure(transport=None)
+
+
+@pytest.fixture
+def api_transport():
+    """Stand-in for the network, which resolves any name to the Crab."""
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=RESOLVE_PAYLOAD))
+
+
+@pytest.fixture
+def cassette(api_transport):
+    """Cassette holding a recorded response for resolving "Crab"."""
+    cassette = Cassette()
+    client = httpx.Client(transport=RecordingTransport(cassette, transport=api_transport))
+    client.get("https://www.swift.psu.edu/api/v2/resolve", params={"name": "Crab", "shared_secret": "secret"})
+    return cassette
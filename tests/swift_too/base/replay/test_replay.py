@@ -0,0 +1,177 @@
+import asyncio
+
+import httpx
+import pytest
+
+import swifttools.swift_too.base.common as common_module
+from swifttools.swift_too.base.replay import (
+    Cassette,
+    RecordingTransport,
+    ReplayApp,
+    ReplayTransport,
+    request_key,
+    use_cassette,
+)
+from swifttools.swift_too.swift.resolve import SwiftResolve
+
+URL = "https://www.swift.psu.edu/api/v2/resolve"
+
+
+class TestCassette:
+    def test_records_response(self, cassette):
+        assert len(cassette) == 1
+
+    def test_secrets_not_recorded(self, cassette, tmp_path):
+        cassette.save(tmp_path / "cassette.json")
+        assert "secret" not in (tmp_path / "cassette.json").read_text()
+
+    def test_save_and_load(self, cassette, tmp_path):
+        cassette.save(tmp_path / "cassette.json")
+        loaded = Cassette(tmp_path / "cassette.json")
+        assert loaded.play(request_key("GET", "/api/v2/resolve", "name=Crab"))["status"] == 200
+
+    def test_key_ignores_argument_order(self):
+        assert request_key("GET", "/a", "x=1&y=2") == request_key("get", "/a", "y=2&x=1")
+
+    def test_key_ignores_credentials(self):
+        assert request_key("GET", "/a", "x=1&shared_secret=abc") == request_key("GET", "/a", "x=1")
+
+    def test_play_in_order_repeating_last(self):
+        cassette = Cassette()
+        for status in (202, 200):
+            cassette._add(
+                {
+                    "request": {"method": "GET", "path": "/a", "query": ""},
+                    "response": {"status": status, "headers": [], "body": ""},
+                }
+            )
+        key = request_key("GET", "/a", "")
+        assert [cassette.play(key)["status"] for _ in range(3)] == [202, 200, 200]
+
+    def test_rewind(self):
+        cassette = Cassette()
+        cassette._add(
+            {"request": {"method": "GET", "path": "/a"}, "response": {"status": 202, "headers": [], "body": ""}}
+        )
+        cassette._add(
+            {"request": {"method": "GET", "path": "/a"}, "response": {"status": 200, "headers": [], "body": ""}}
+        )
+        key = request_key("GET", "/a", "")
+        cassette.play(key)
+        cassette.rewind()
+        assert cassette.play(key)["status"] == 202
+
+    def test_binary_body(self):
+        cassette = Cassette()
+        request = httpx.Request("GET", URL)
+        cassette.record(request, httpx.Response(200, content=b"\xff\xfe", request=request))
+        assert Cassette.content(cassette.play(request_key("GET", "/api/v2/resolve", ""))) == b"\xff\xfe"
+
+
+class TestReplayTransport:
+    def test_replays_response(self, cassette):
+        client = httpx.Client(transport=ReplayTransport(cassette))
+        assert client.get(URL, params={"name": "Crab"}).json()["ra"] == 83.63
+
+    def test_unrecorded_request(self, cassette):
+        transport = ReplayTransport(cassette)
+        response = httpx.Client(transport=transport).get(URL, params={"name": "Vela"})
+        assert response.status_code == 404
+        assert transport.stats["misses"] == 1
+
+    def test_latency(self, cassette, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("swifttools.swift_too.base.replay.time.sleep", sleeps.append)
+        httpx.Client(transport=ReplayTransport(cassette, latency=0.25)).get(URL, params={"name": "Crab"})
+        assert sleeps == [0.25]
+
+    def test_latency_range(self, cassette, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("swifttools.swift_too.base.replay.time.sleep", sleeps.append)
+        httpx.Client(transport=ReplayTransport(cassette, latency=(0.1, 0.2), seed=1)).get(URL, params={"name": "Crab"})
+        assert 0.1 <= sleeps[0] <= 0.2
+
+    def test_error_status_injected(self, cassette):
+        transport = ReplayTransport(cassette, error_rate=1.0, error=502)
+        assert httpx.Client(transport=transport).get(URL, params={"name": "Crab"}).status_code == 502
+        assert transport.stats == {"requests": 1, "errors": 1, "misses": 0}
+
+    def test_error_exception_injected(self, cassette):
+        transport = ReplayTransport(cassette, error_rate=1.0, error=httpx.ConnectError("refused"))
+        with pytest.raises(httpx.ConnectError):
+            httpx.Client(transport=transport).get(URL, params={"name": "Crab"})
+
+    def test_errors_repeatable_with_seed(self, cassette):
+        def run():
+            client = httpx.Client(transport=ReplayTransport(cassette, error_rate=0.5, seed=42))
+            return [client.get(URL, params={"name": "Crab"}).status_code for _ in range(20)]
+
+        assert run() == run()
+
+    def test_async(self, cassette):
+        async def fetch():
+            async with httpx.AsyncClient(transport=ReplayTransport(cassette)) as client:
+                return await client.get(URL, params={"name": "Crab"})
+
+        assert asyncio.run(fetch()).status_code == 200
+
+
+class TestReplayApp:
+    def test_serves_recorded_response(self, cassette):
+        async def fetch():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=ReplayApp(cassette))) as client:
+                return await client.get("http://testserver/api/v2/resolve", params={"name": "Crab"})
+
+        assert asyncio.run(fetch()).json()["dec"] == 22.01
+
+    def test_unrecorded_request(self, cassette):
+        async def fetch():
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=ReplayApp(cassette))) as client:
+                return await client.post("http://testserver/api/v2/too", data={"a": "1"})
+
+        assert asyncio.run(fetch()).status_code == 404
+
+
+class TestSessionTransport:
+    def test_api_class_uses_transport(self, cassette):
+        common_module.session.configure(transport=ReplayTransport(cassette))
+        resolve = SwiftResolve(name="Crab")
+        assert resolve.ra == 83.63
+
+    def test_async_only_transport_not_used_by_sync_client(self, cassette):
+        common_module.session.configure(transport=httpx.ASGITransport(app=ReplayApp(cassette)))
+        assert not isinstance(common_module.session.client._transport, httpx.ASGITransport)
+
+    def test_use_cassette_record_and_replay(self, api_transport, tmp_path, monkeypatch):
+        path = tmp_path / "cassette.json"
+        monkeypatch.setattr("swifttools.swift_too.base.replay.httpx.HTTPTransport", lambda: api_transport)
+        with use_cassette(path, record=True):
+            SwiftResolve(name="Crab")
+        assert path.exists()
+        with use_cassette(path) as transport:
+            resolve = SwiftResolve(name="Crab")
+        assert resolve.ra == 83.63
+        assert transport.stats["requests"] == 1
+        assert common_module.session.transport is None
+
+    def test_transport_option(self):
+        with pytest.raises(TypeError):
+            common_module.session.configure(transports=None)
+
+
+class TestRecordingTransport:
+    def test_returns_response(self, api_transport):
+        cassette = Cassette()
+        client = httpx.Client(transport=RecordingTransport(cassette, transport=api_transport))
+        assert client.get(URL).json()["name"] == "Crab"
+
+    def test_async(self, api_transport):
+        cassette = Cassette()
+
+        async def fetch():
+            transport = RecordingTransport(cassette, async_transport=api_transport)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await client.post(URL, data={"name": "Crab", "shared_secret": "secret"})
+
+        assert asyncio.run(fetch()).status_code == 200
+        assert cassette._interactions[0]["request"]["body"] == [("name", "Crab")]
@@ -0,0 +1,22 @@
+# Local fixtures for tests/swift_too/base/retry
+import httpx
+import pytest
+
+from swifttools.swift_too.base.retry import CircuitBreaker, RetryPolicy
+
+URL = "https://www.swift.psu.edu/api/v1.2/resolve"
+
+
+def make_response(status_code, headers=None):
+    json = {"name": "M31", "ra": 10.68, "dec": 41.27, "resolver": "Simbad", "status": {"status": "Accepted"}}
+    return httpx.Response(status_code, json=json, headers=headers, request=httpx.Request("GET", URL))
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(jitter=False)
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(failure_threshold=2, reset_timeout=60)
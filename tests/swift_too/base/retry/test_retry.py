@@ -0,0 +1,180 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+import swifttools.swift_too.base.common as common_module
+from swifttools.swift_too.swift.resolve import SwiftResolve
+
+from .conftest import make_response
+
+
+class TestRetryPolicy:
+    def test_backoff_exponential(self, policy):
+        assert [policy.backoff(i) for i in range(3)] == [0.5, 1.0, 2.0]
+
+    def test_backoff_capped(self, policy):
+        policy.max_backoff = 1.5
+        assert policy.backoff(5) == 1.5
+
+    def test_backoff_jitter(self, policy):
+        policy.jitter = True
+        assert all(0 <= policy.backoff(2) <= 2.0 for _ in range(20))
+
+    def test_retry_status(self, policy):
+        assert policy.delay(0, response=make_response(502)) == 0.5
+
+    def test_no_retry_success(self, policy):
+        assert policy.delay(0, response=make_response(200)) is None
+
+    def test_no_retry_client_error(self, policy):
+        assert policy.delay(0, response=make_response(404)) is None
+
+    def test_max_retries(self, policy):
+        assert policy.delay(3, response=make_response(503)) is None
+
+    def test_retry_transport_error(self, policy):
+        assert policy.delay(1, error=httpx.ConnectTimeout("timeout")) == 1.0
+
+    def test_no_retry_other_error(self, policy):
+        assert policy.delay(0, error=ValueError("bad")) is None
+
+    def test_retry_after_seconds(self, policy):
+        assert policy.delay(0, response=make_response(429, {"Retry-After": "7"})) == 7.0
+
+    def test_retry_after_capped(self, policy):
+        assert policy.delay(0, response=make_response(503, {"Retry-After": "3600"})) == policy.max_backoff
+
+    def test_retry_after_date(self, policy):
+        when = datetime.now(tz=timezone.utc) + timedelta(seconds=20)
+        delay = policy.delay(0, response=make_response(503, {"Retry-After": format_datetime(when, usegmt=True)}))
+        assert 15 < delay <= 20
+
+    def test_retry_after_ignored_for_502(self, policy):
+        assert policy.delay(0, response=make_response(502, {"Retry-After": "7"})) == 0.5
+
+    def test_configure(self, policy):
+        policy.configure(max_retries=1, statuses=[500])
+        assert policy.max_retries == 1
+        assert policy.statuses == (500,)
+
+    def test_configure_unknown(self, policy):
+        with pytest.raises(TypeError):
+            policy.configure(retries=1)
+
+
+class TestCircuitBreaker:
+    def test_closed(self, breaker):
+        assert breaker.allow("host")
+        assert breaker.state("host") == "closed"
+
+    def test_opens_after_threshold(self, breaker):
+        breaker.record_failure("host")
+        assert breaker.allow("host")
+        breaker.record_failure("host")
+        assert not breaker.allow("host")
+        assert breaker.state("host") == "open"
+
+    def test_per_host(self, breaker):
+        breaker.record_failure("host")
+        breaker.record_failure("host")
+        assert breaker.allow("other")
+
+    def test_success_resets_count(self, breaker):
+        breaker.record_failure("host")
+        breaker.record_success("host")
+        breaker.record_failure("host")
+        assert breaker.allow("host")
+
+    def test_half_open_single_trial(self, breaker):
+        breaker.record_failure("host")
+        breaker.record_failure("host")
+        with patch("swifttools.swift_too.base.retry.time.monotonic", return_value=1e12):
+            assert breaker.allow("host")
+            assert not breaker.allow("host")
+            assert breaker.state("host") == "half-open"
+
+    def test_trial_success_closes(self, breaker):
+        breaker.record_failure("host")
+        breaker.record_failure("host")
+        with patch("swifttools.swift_too.base.retry.time.monotonic", return_value=1e12):
+            breaker.allow("host")
+        breaker.record_success("host")
+        assert breaker.state("host") == "closed"
+
+    def test_trial_failure_reopens(self, breaker):
+        breaker.record_failure("host")
+        breaker.record_failure("host")
+        with patch("swifttools.swift_too.base.retry.time.monotonic", return_value=1e12):
+            breaker.allow("host")
+            breaker.record_failure("host")
+            assert not breaker.allow("host")
+
+    def test_disabled(self, breaker):
+        breaker.failure_threshold = 0
+        for _ in range(5):
+            breaker.record_failure("host")
+        assert breaker.allow("host")
+
+    def test_reset(self, breaker):
+        breaker.record_failure("host")
+        breaker.record_failure("host")
+        breaker.reset()
+        assert breaker.allow("host")
+
+
+class TestRequestRetries:
+    def test_retry_then_success(self, mock_client, mock_cookie_jar):
+        mock_client.return_value.get.side_effect = [make_response(503), make_response(200)]
+        resolve = SwiftResolve(name="M31")
+        assert resolve.status.status == "Accepted"
+        assert resolve.retries == 1
+        assert mock_client.return_value.get.call_count == 2
+
+    def test_retry_transport_error(self, mock_client, mock_cookie_jar):
+        mock_client.return_value.get.side_effect = [httpx.ConnectError("refused"), make_response(200)]
+        resolve = SwiftResolve(name="M31")
+        assert resolve.ra == pytest.approx(10.68)
+        assert resolve.retries == 1
+
+    def test_retries_exhausted(self, mock_client, mock_cookie_jar):
+        mock_client.return_value.get.side_effect = httpx.ConnectError("refused")
+        resolve = SwiftResolve(name="M31")
+        assert resolve.retries == 3
+        assert mock_client.return_value.get.call_count == 4
+        assert resolve.status.errors == ["Request failed: refused"]
+
+    def test_backoff_time_recorded(self, mock_client, mock_cookie_jar):
+        mock_client.return_value.get.side_effect = [make_response(429, {"Retry-After": "0.01"}), make_response(200)]
+        resolve = SwiftResolve(name="M31")
+        assert resolve.backoff_time == pytest.approx(0.01)
+
+    def test_no_retries_before_submit(self):
+        resolve = SwiftResolve(name="M31", autosubmit=False)
+        assert resolve.retries == 0
+        assert resolve.backoff_time == 0.0
+
+    def test_post_not_retried(self, mock_client, mock_cookie_jar):
+        mock_client.return_value.post.return_value = make_response(503)
+        resolve = SwiftResolve(name="M31", autosubmit=False)
+        resolve._perform_request("POST", data={"name": "M31"})
+        assert mock_client.return_value.post.call_count == 1
+        assert resolve.retries == 0
+
+    def test_validate_only_post_retried(self, mock_client, mock_cookie_jar):
+        mock_client.return_value.post.side_effect = [make_response(503), make_response(200)]
+        resolve = SwiftResolve(name="M31", autosubmit=False)
+        object.__setattr__(resolve, "validate_only", True)
+        resolve._perform_request("POST", data={"name": "M31"})
+        assert mock_client.return_value.post.call_count == 2
+
+    def test_circuit_open_fails_fast(self, mock_client, mock_cookie_jar):
+        resolve = SwiftResolve(name="M31", autosubmit=False)
+        host = httpx.URL(resolve.submit_url).host
+        for _ in range(common_module.circuit_breaker.failure_threshold):
+            common_module.circuit_breaker.record_failure(host)
+        resolve.submit()
+        assert mock_client.return_value.get.call_count == 0
+        assert "unavailable" in resolve.status.errors[0]
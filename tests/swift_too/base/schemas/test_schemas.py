@@ -12,6 +12,7 @@ from swifttools.swift_too.base.schemas import (
     OptionalCoordinateSchema,
     to_datetime,
     to_utc_datetime,
+    trusted_response,
 )
 
 
@@ -135,3 +136,27 @@ class TestCoordinateSchema:
         sc = test_skycoord_2
         s = CoordinateSchema(skycoord=sc)
         assert s.ra == sc.fk5.ra.deg
+
+    def test_creates_skycoord(self):
+        s = CoordinateSchema(ra=10.0, dec=20.0)
+        assert "skycoord" in s.__dict__
+
+    def test_trusted_response_defers_skycoord(self):
+        with trusted_response():
+            s = CoordinateSchema(ra=10.0, dec=20.0)
+        assert "skycoord" not in s.__dict__
+
+    def test_trusted_response_skycoord_on_access(self):
+        with trusted_response():
+            s = CoordinateSchema(ra=10.0, dec=20.0)
+        assert s.skycoord.ra.deg == pytest.approx(10.0)
+        assert "skycoord" in s.__dict__
+
+    def test_trusted_response_validates_fields(self):
+        with trusted_response(), pytest.raises(ValueError):
+            CoordinateSchema(ra="not a number", dec=20.0)
+
+    def test_unknown_attribute(self):
+        s = CoordinateSchema(ra=10.0, dec=20.0)
+        with pytest.raises(AttributeError):
+            s.not_an_attribute
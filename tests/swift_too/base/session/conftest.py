@@ -0,0 +1,12 @@
+# Local fixtures for tests/swift_too/base/session
+import pytest
+
+from swifttools.swift_too.base.session import TOOAPISession
+
+
+@pytest.fixture
+def pool():
+    """Standalone TOOAPISession instance"""
+    session = TOOAPISession()
+    yield session
+    session.close()
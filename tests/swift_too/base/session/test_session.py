@@ -0,0 +1,77 @@
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+import swifttools.swift_too.base.common as common_module
+from swifttools.swift_too.base.session import TOOAPISession
+
+
+class TestTOOAPISession:
+    def test_client_is_shared(self, pool):
+        assert pool.client is pool.client
+
+    def test_client_recreated_after_close(self, pool):
+        first = pool.client
+        pool.close()
+        assert pool.client is not first
+
+    def test_client_uses_limits(self, pool):
+        pool.configure(max_connections=5, max_keepalive_connections=2)
+        with patch("httpx.Client") as mock_client:
+            _ = pool.client
+        assert mock_client.call_args.kwargs["limits"] == httpx.Limits(
+            max_connections=5, max_keepalive_connections=2, keepalive_expiry=pool.keepalive_expiry
+        )
+
+    def test_configure_unknown_option(self, pool):
+        with pytest.raises(TypeError, match="Unknown session option"):
+            pool.configure(retries=3)
+
+    def test_configure_closes_client(self, pool):
+        client = pool.client
+        pool.configure(keepalive_expiry=5.0)
+        assert client.is_closed
+
+    def test_fork_discards_client(self, pool):
+        client = pool.client
+        with patch("swifttools.swift_too.base.session.os.getpid", return_value=pool._pid + 1):
+            assert pool.client is not client
+        assert not client.is_closed
+        client.close()
+
+    def test_stats_count_reuse(self, pool):
+        for event in ["connection.connect_tcp.complete"] + ["http11.send_request_headers.started"] * 3:
+            pool._trace(event, {})
+        assert pool.stats == {"requests": 3, "connections_opened": 1, "connections_reused": 2}
+
+    def test_reset_stats(self, pool):
+        pool._trace("http11.send_request_headers.started", {})
+        pool.reset_stats()
+        assert pool.stats["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_client_shared_per_loop(self, pool):
+        client = pool.async_client
+        assert pool.async_client is client
+        await pool.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_async_trace_counts(self, pool):
+        await pool._trace_async("http11.send_request_headers.started", {})
+        assert pool.stats["requests"] == 1
+
+
+class TestSessionInTOOAPIBaseclass:
+    def test_module_session(self):
+        assert isinstance(common_module.session, TOOAPISession)
+
+    def test_perform_request_uses_pooled_client(self, mock_base_class):
+        client = Mock()
+        client.get.return_value = Mock(status_code=200)
+        with patch.object(type(common_module.session), "client", new=client):
+            mock_base_class.username = "anonymous"
+            response = mock_base_class._perform_request("GET", params={"a": 1})
+        assert response is client.get.return_value
+        assert client.get.call_args.kwargs["extensions"]["trace"] == common_module.session._trace
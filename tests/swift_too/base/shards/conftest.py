@@ -0,0 +1,21 @@
+# Local fixtures for tests/swift_too/base/shards
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from ...conftest import afst_entry
+
+# Ten days of 10 hour observations, so that some span the boundary between
+# shards
+ENTRIES = [afst_entry(i, spacing=timedelta(hours=10), length=timedelta(hours=10)) for i in range(24)]
+
+
+@pytest.fixture
+def api(afst_api):
+    """Mock API returning the entries overlapping the requested time range.
+    Requests starting at `failing` times are rejected."""
+    state = afst_api(
+        ENTRIES, failure=httpx.Response(200, json={"status": {"status": "Rejected", "errors": ["Server error"]}})
+    )
+    return state["requests"], state["failing"]
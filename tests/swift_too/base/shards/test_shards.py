@@ -0,0 +1,130 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import swifttools.swift_too.base.shards as shards_module
+from swifttools.swift_too.base.shards import shard_ranges
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+
+from ...conftest import AFST_START as START
+from .conftest import ENTRIES
+
+
+@pytest.fixture
+def afst(api):
+    return SwiftAFST(begin=START, end=START + timedelta(days=10), autosubmit=False)
+
+
+@pytest.fixture
+def auto_shard():
+    shards_module.auto_shard_length = 3
+    yield
+    shards_module.auto_shard_length = None
+
+
+class TestShardRanges:
+    def test_consecutive(self):
+        ranges = shard_ranges(START, START + timedelta(days=10), 3)
+        assert len(ranges) == 4
+        assert ranges[0] == (START, START + timedelta(days=3))
+        assert ranges[-1] == (START + timedelta(days=9), START + timedelta(days=10))
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+    def test_shorter_than_shard(self):
+        assert shard_ranges(START, START + timedelta(hours=1), 7) == [(START, START + timedelta(hours=1))]
+
+    def test_empty(self):
+        assert shard_ranges(START, START, 7) == []
+
+    def test_invalid_length(self):
+        with pytest.raises(ValueError):
+            shard_ranges(START, START + timedelta(days=1), 0)
+
+
+class TestSubmitSharded:
+    def test_merges_without_duplicates(self, afst, api):
+        requests, _ = api
+        assert afst.submit_sharded(shard_length=3)
+        assert len(requests) == 4
+        assert [entry.target_id for entry in afst.entries] == [entry["target_id"] for entry in ENTRIES]
+        assert afst.status.status == "Accepted"
+        assert afst.afstmax == datetime(2025, 1, 1)
+
+    def test_matches_single_request(self, afst, api):
+        afst.submit_sharded(shard_length=3)
+        single = SwiftAFST(begin=START, end=START + timedelta(days=10))
+        assert [e.obs_id for e in afst.entries] == [e.obs_id for e in single.entries]
+
+    def test_query_fields_copied(self, api):
+        afst = SwiftAFST(begin=START, end=START + timedelta(days=10), target_id=10001, autosubmit=False)
+        requests, _ = api
+        afst.submit_sharded(shard_length=5)
+        assert all(request.url.params["target_id"] == "10001" for request in requests)
+
+    def test_failed_shard(self, afst, api):
+        _, failing = api
+        failing.add(START + timedelta(days=3))
+        assert not afst.submit_sharded(shard_length=3)
+        assert afst.status.status == "Rejected"
+        assert afst.status.errors == ["Shard 2024-01-04 to 2024-01-07: Server error"]
+
+    def test_without_time_range(self, api):
+        afst = SwiftAFST(target_id=10001, autosubmit=False)
+        requests, _ = api
+        requests.clear()
+        assert afst.submit_sharded()
+        assert len(requests) == 1
+        assert "begin" not in requests[0].url.params
+
+    def test_invalid_concurrency(self, afst):
+        with pytest.raises(ValueError):
+            afst.submit_sharded(max_concurrency=0)
+
+
+class TestIterShards:
+    def test_in_order(self, afst):
+        shards = list(afst.iter_shards(shard_length=3, max_concurrency=2))
+        assert [shard.begin for shard in shards] == [START + timedelta(days=3 * i) for i in range(4)]
+        target_ids = [entry.target_id for shard in shards for entry in shard.entries]
+        assert target_ids == [entry["target_id"] for entry in ENTRIES]
+
+    def test_early_break(self, afst):
+        for shard in afst.iter_shards(shard_length=1):
+            break
+        assert shard.begin == START
+        assert shard.status.status == "Accepted"
+
+    def test_failed_shard_yielded(self, afst, api):
+        _, failing = api
+        failing.add(START)
+        shards = list(afst.iter_shards(shard_length=5))
+        assert shards[0].status.errors == ["Server error"]
+        assert shards[1].status.status == "Accepted"
+
+
+class TestGetSharded:
+    def test_async(self, afst, api):
+        requests, _ = api
+        assert asyncio.run(afst.get_sharded(shard_length=3))
+        assert len(requests) == 4
+        assert len(afst.entries) == len(ENTRIES)
+
+
+class TestAutoShard:
+    def test_long_query_sharded(self, afst, api, auto_shard):
+        requests, _ = api
+        assert afst.submit()
+        assert len(requests) == 4
+        assert len(afst.entries) == len(ENTRIES)
+
+    def test_short_query_not_sharded(self, api, auto_shard):
+        requests, _ = api
+        afst = SwiftAFST(begin=START, end=START + timedelta(days=2))
+        assert afst.status.status == "Accepted"
+        assert len(requests) == 1
+
+    def test_disabled_by_default(self, afst, api):
+        requests, _ = api
+        afst.submit()
+        assert len(requests) == 1
@@ -0,0 +1,89 @@
+# Fixtures shared by tests/swift_too
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+import swifttools.swift_too.base.common as common_module
+
+AFST_START = datetime(2024, 1, 1)
+
+
+def afst_entry(i, spacing=timedelta(minutes=30), length=timedelta(minutes=25), targets=None):
+    """Entry `i` of a mock AFST, with an observation starting every
+    `spacing`. Each observation is of a new target, or if `targets` is given,
+    they cycle through that many targets with a new segment each cycle."""
+    target = i if targets is None else i % targets
+    segment = 1 if targets is None else i // targets + 1
+    begin = AFST_START + i * spacing
+    return {
+        "begin": begin.isoformat(),
+        "settle": (begin + timedelta(minutes=2)).isoformat(),
+        "end": (begin + length).isoformat(),
+        "obstype": "AT",
+        "target_name": f"Target {target}",
+        "roll": 12.5,
+        "target_id": 10000 + target,
+        "segment": segment,
+        "obs_id": f"{10000 + target:08d}{segment:03d}",
+        "ra": 10.0 + target,
+        "dec": -5.0,
+        "fom": 50,
+    }
+
+
+def afst_payload(entries, begin, end, afstmax=datetime(2025, 1, 1)):
+    """AFST response for `begin` to `end` containing `entries`."""
+    return {
+        "begin": begin.isoformat(),
+        "end": end.isoformat(),
+        "afstmax": afstmax.isoformat(),
+        "entries": entries,
+        "status": {"status": "Accepted"},
+    }
+
+
+def api_time(value):
+    """Time parameter of an API request, as a naive UTC datetime."""
+    return datetime.fromisoformat(value.replace("Z", "")).replace(tzinfo=None)
+
+
+@pytest.fixture
+def mock_api():
+    """Send API requests to `handler` for the rest of the test, with
+    `mock_api(handler)`. The handler takes an `httpx.Request` and returns an
+    `httpx.Response`."""
+
+    def install(handler):
+        common_module.session.configure(transport=httpx.MockTransport(handler))
+
+    yield install
+    common_module.session.configure(transport=None)
+
+
+@pytest.fixture
+def afst_api(mock_api):
+    """Mock AFST API, installed with `afst_api(entries)`, returning the
+    entries overlapping the requested time range. Returns a dict of the
+    `requests` made and of settings that can be changed during the test: the
+    `afstmax` reported, `fail` to fail every request, and `failing`, the
+    begin times of requests that fail. Failed requests return `failure`."""
+
+    def install(entries, afstmax=datetime(2025, 1, 1), failure=None):
+        state = {"requests": [], "afstmax": afstmax, "fail": False, "failing": set()}
+
+        def handler(request):
+            state["requests"].append(request)
+            begin = api_time(request.url.params.get("begin", entries[0]["begin"]))
+            end = api_time(request.url.params.get("end", entries[-1]["end"]))
+            if state["fail"] or begin in state["failing"]:
+                return failure or httpx.Response(500, text="Internal Server Error")
+            overlapping = [
+                entry for entry in entries if api_time(entry["begin"]) < end and api_time(entry["end"]) > begin
+            ]
+            return httpx.Response(200, json=afst_payload(overlapping, begin, end, state["afstmax"]))
+
+        mock_api(handler)
+        return state
+
+    return install
@@ -1 +0,0 @@
-# Local fixtures for tests/swift_too/query_job
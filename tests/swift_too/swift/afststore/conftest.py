@@ -0,0 +1,30 @@
+# Local fixtures for tests/swift_too/swift/afststore
+from datetime import timedelta
+
+import pytest
+
+from swifttools.swift_too.swift.afststore import AFSTStore
+
+from ...conftest import AFST_START, afst_entry
+
+# Twenty days of 10 hour observations of four targets, so that some span the
+# boundary between requests
+ENTRIES = [afst_entry(i, spacing=timedelta(hours=10), length=timedelta(hours=10), targets=4) for i in range(48)]
+
+
+@pytest.fixture
+def api(afst_api):
+    """Mock API returning the entries overlapping the requested time range,
+    with the AFST final up to `state["afstmax"]`, or failing if
+    `state["fail"]` is set."""
+    return afst_api(ENTRIES, afstmax=AFST_START + timedelta(days=10))
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Enabled AFST store in a temporary directory, used by `SwiftAFST`."""
+    import swifttools.swift_too.swift.afststore as afststore_module
+
+    store = AFSTStore(path=tmp_path / "afst.sqlite", refresh_interval=1e9, enabled=True)
+    monkeypatch.setattr(afststore_module, "afst_store", store)
+    return store
@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+import pytest
+
+from swifttools.swift_too.swift.afststore import AFSTStore
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+
+from ...conftest import AFST_START as START
+from .conftest import ENTRIES
+
+
+def target_ids(afst):
+    return [entry.target_id for entry in afst.entries]
+
+
+class TestSync:
+    def test_initial_sync(self, store, api):
+        assert store.sync(begin=START, until=START + timedelta(days=12))
+        # The AFST is only final up to afstmax
+        assert store.coverage == (START, START + timedelta(days=10))
+        assert len(store) == 24
+
+    def test_delta_sync(self, store, api):
+        store.sync(begin=START, until=START + timedelta(days=12))
+        api["afstmax"] = START + timedelta(days=15)
+        api["requests"].clear()
+        assert store.sync(until=START + timedelta(days=16))
+        # Only the time since the high-water mark is fetched
+        assert [request.url.params["begin"] for request in api["requests"]] == ["2024-01-11 00:00:00"]
+        assert store.coverage == (START, START + timedelta(days=15))
+        assert len(store) == 36
+
+    def test_backfill(self, store, api):
+        store.sync(begin=START + timedelta(days=5), until=START + timedelta(days=10))
+        assert store.sync(begin=START, until=START + timedelta(days=10))
+        assert store.coverage == (START, START + timedelta(days=10))
+        assert len(store) == 24
+
+    def test_boundary_entries_not_duplicated(self, store, api):
+        store.sync(begin=START, until=START + timedelta(days=5))
+        store.sync(until=START + timedelta(days=10))
+        assert len(store) == 24
+
+    def test_failed_sync(self, store, api):
+        api["fail"] = True
+        assert not store.sync(begin=START, until=START + timedelta(days=2))
+        assert store.coverage is None
+
+    def test_persistent(self, store, api):
+        store.sync(begin=START, until=START + timedelta(days=10))
+        reopened = AFSTStore(path=store.path)
+        assert reopened.coverage == store.coverage
+        assert len(reopened) == len(store)
+
+
+class TestQuery:
+    @pytest.fixture(autouse=True)
+    def synced(self, store, api):
+        store.sync(begin=START, until=START + timedelta(days=10))
+        api["requests"].clear()
+
+    def test_time_range(self, store):
+        rows = store.query(START + timedelta(hours=25), START + timedelta(hours=45))
+        # Entries overlapping the range, including the one spanning its start
+        assert [row["begin"] for row in rows] == [entry["begin"] for entry in ENTRIES[2:5]]
+
+    def test_target_id(self, store):
+        rows = store.query(START, START + timedelta(days=10), target_id=10001)
+        assert {row["target_id"] for row in rows} == {10001}
+        assert len(rows) == 6
+
+    def test_target_id_list(self, store):
+        rows = store.query(START, START + timedelta(days=10), target_id=[10001, 10002])
+        assert len(rows) == 12
+
+    def test_afst_answered_locally(self, store, api):
+        afst = SwiftAFST(begin=START + timedelta(days=1), end=START + timedelta(days=3))
+        assert afst.status.status == "Accepted"
+        assert api["requests"] == []
+        expected = SwiftAFST(begin=START + timedelta(days=1), end=START + timedelta(days=3), autosubmit=False)
+        expected.submit_get(refresh=True)
+        assert [e.begin for e in afst.entries] == [e.begin for e in expected.entries]
+        assert [e.obs_id for e in afst.entries] == [e.obs_id for e in expected.entries]
+        assert afst.afstmax == START + timedelta(days=10)
+
+    def test_afst_obs_id(self, store, api):
+        afst = SwiftAFST(begin=START, end=START + timedelta(days=10), obs_id="00010002001")
+        assert api["requests"] == []
+        assert len(afst.entries) == 1
+        assert afst.entries[0].obs_id == afst.obs_id
+
+    def test_afst_columnar(self, store, api):
+        afst = SwiftAFST(begin=START, end=START + timedelta(days=2), autosubmit=False)
+        assert afst.submit_columnar()
+        assert api["requests"] == []
+        assert len(afst.columns["begin"]) == 5
+
+    def test_outside_coverage_uses_api(self, store, api):
+        SwiftAFST(begin=START + timedelta(days=9), end=START + timedelta(days=11))
+        assert len(api["requests"]) == 1
+
+    def test_cone_search_uses_api(self, store, api):
+        SwiftAFST(begin=START, end=START + timedelta(days=1), ra=10.0, dec=-5.0)
+        assert len(api["requests"]) == 1
+
+    def test_refresh_uses_api(self, store, api):
+        afst = SwiftAFST(begin=START, end=START + timedelta(days=1), autosubmit=False)
+        afst.submit_get(refresh=True)
+        assert len(api["requests"]) == 1
+
+    def test_disabled(self, store, api):
+        store.disable()
+        SwiftAFST(begin=START, end=START + timedelta(days=1))
+        assert len(api["requests"]) == 1
+
+
+class TestAutoSync:
+    def test_due_sync_on_query(self, store, api):
+        store.sync(begin=START, until=START + timedelta(days=10))
+        api["afstmax"] = START + timedelta(days=15)
+        store.refresh_interval = 0
+        # The automatic sync fetches up to now, extending the mirror
+        assert store.covers(START + timedelta(days=11), START + timedelta(days=12))
+        assert store.coverage[1] == START + timedelta(days=15)
+
+    def test_never_synced(self, store, api):
+        store.refresh_interval = 0
+        assert not store.covers(START, START + timedelta(days=1))
+        assert api["requests"] == []
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from swifttools.swift_too.swift.clock import clock_correct_many
+from swifttools.swift_too.swift.datetime import swiftdatetime
+from swifttools.swift_too.swift.saa import SwiftSAAEntry
+
+UTCF = -20.5
+
+
+@pytest.fixture
+def requests_made():
+    return []
+
+
+@pytest.fixture
+def clock_transport(mock_api, requests_made):
+    def handler(request):
+        swifttime = parse_qs(request.url.query.decode())["swifttime"]
+        requests_made.append(swifttime)
+        met = [(datetime.fromisoformat(value) - datetime(2001, 1, 1)).total_seconds() for value in swifttime]
+        entries = [{"met": value, "utcf": UTCF, "isutc": False} for value in met]
+        return httpx.Response(200, json={"entries": entries, "status": {"status": "Accepted"}})
+
+    mock_api(handler)
+
+
+@pytest.fixture
+def entries():
+    # Consecutive windows share their boundary times
+    start = datetime(2020, 1, 1)
+    return [SwiftSAAEntry(begin=start + timedelta(hours=i), end=start + timedelta(hours=i + 1)) for i in range(50)]
+
+
+class TestClockCorrectMany:
+    def test_single_request(self, clock_transport, requests_made, entries):
+        assert clock_correct_many(entries)
+        assert len(requests_made) == 1
+
+    def test_times_deduplicated(self, clock_transport, requests_made, entries):
+        clock_correct_many(entries)
+        assert len(requests_made[0]) == 51
+
+    def test_chunked(self, clock_transport, requests_made, entries):
+        clock_correct_many(entries, chunk_size=20)
+        assert sorted(len(request) for request in requests_made) == [11, 20, 20]
+
+    def test_values_corrected(self, clock_transport, entries):
+        clock_correct_many(entries)
+        entry = entries[3]
+        assert isinstance(entry.begin, swiftdatetime)
+        assert entry.begin.isutc
+        assert entry.begin == datetime(2020, 1, 1, 3) + timedelta(seconds=UTCF)
+        assert entry.end == entries[4].begin
+        assert entry.end is not entries[4].begin
+
+    def test_same_as_clock_correct(self, clock_transport, entries):
+        single = SwiftSAAEntry(begin=entries[0].begin, end=entries[0].end)
+        single.clock_correct()
+        clock_correct_many(entries)
+        assert (single.begin, single.end) == (entries[0].begin, entries[0].end)
+
+    def test_timebase_conversion(self, clock_transport, entries):
+        clock_correct_many(entries)
+        entries[0].to_swifttime()
+        assert entries[0].begin == datetime(2020, 1, 1)
+        assert not entries[0].begin.isutc
+
+    def test_already_corrected(self, clock_transport, requests_made, entries):
+        clock_correct_many(entries[:10])
+        requests_made.clear()
+        clock_correct_many(entries)
+        assert len(requests_made[0]) == 41
+
+    def test_nothing_to_correct(self, clock_transport, requests_made):
+        assert clock_correct_many([])
+        assert requests_made == []
+
+    def test_failure_leaves_results_uncorrected(self, mock_api, entries):
+        mock_api(lambda request: httpx.Response(422, json={"detail": "bad"}))
+        assert not clock_correct_many(entries)
+        assert entries[0]._clock is None
+        assert not isinstance(entries[0].begin, swiftdatetime)
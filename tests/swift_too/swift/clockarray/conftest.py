@@ -0,0 +1,65 @@
+# Local fixtures for tests/swift_too/swift/clockarray
+import threading
+import time
+from urllib.parse import parse_qs
+
+import httpx
+import numpy as np
+import pytest
+
+UTCF = -20.5
+MET_EPOCH = np.datetime64("2001-01-01T00:00:00", "us")
+
+
+def clock_api(request):
+    """Stand-in for the /swift/clock endpoint, with a constant UTCF."""
+    query = parse_qs(request.url.query.decode())
+    if "met" in query:
+        met = [float(value) for value in query["met"]]
+    elif "utctime" in query:
+        utc = np.array(query["utctime"], dtype="datetime64[us]")
+        met = ((utc - MET_EPOCH) / np.timedelta64(1, "s") - UTCF).tolist()
+    else:
+        swift = np.array(query["swifttime"], dtype="datetime64[us]")
+        met = ((swift - MET_EPOCH) / np.timedelta64(1, "s")).tolist()
+    entries = [{"met": value, "utcf": UTCF, "isutc": False} for value in met]
+    return httpx.Response(200, json={"entries": entries, "status": {"status": "Accepted"}})
+
+
+@pytest.fixture
+def requests_made():
+    return []
+
+
+@pytest.fixture
+def clock_transport(mock_api, requests_made):
+    def handler(request):
+        requests_made.append(request)
+        return clock_api(request)
+
+    mock_api(handler)
+
+
+@pytest.fixture
+def concurrency():
+    """Greatest number of requests in flight at once."""
+    return {"active": 0, "max": 0, "lock": threading.Lock()}
+
+
+@pytest.fixture
+def slow_transport(mock_api, concurrency):
+    def handler(request):
+        with concurrency["lock"]:
+            concurrency["active"] += 1
+            concurrency["max"] = max(concurrency["max"], concurrency["active"])
+        time.sleep(0.01)
+        with concurrency["lock"]:
+            concurrency["active"] -= 1
+        return clock_api(request)
+
+    mock_api(handler)
+
+
+@pytest.fixture
+def failing_transport(mock_api):
+    mock_api(lambda request: httpx.Response(422, json={"detail": "bad met"}))
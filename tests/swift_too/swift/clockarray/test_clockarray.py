@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from swifttools.swift_too.swift.clock import SwiftClock
+from swifttools.swift_too.swift.clockarray import SwiftClockArray, _SwiftClockChunk, met_to_datetime64
+from swifttools.swift_too.swift.datetime import swiftdatetime
+
+from .conftest import UTCF
+
+
+class TestMetToDatetime64:
+    def test_matches_swiftdatetime(self):
+        met = np.array([0.0, 123456789.123456, 725760000.5])
+        expected = [swiftdatetime.frommet(value, utcf=UTCF, isutc=True) for value in met]
+        result = met_to_datetime64(met, UTCF)
+        assert [value.item() for value in result] == [value.utctime for value in expected]
+
+    def test_no_utcf(self):
+        assert met_to_datetime64(np.array([60.0]))[0] == np.datetime64("2001-01-01T00:01:00")
+
+
+class TestSwiftClockArray:
+    def test_met_columns(self, clock_transport):
+        clock = SwiftClockArray(met=np.array([1.0e8, 2.0e8]))
+        assert clock.status.status == "Accepted"
+        assert clock.met.tolist() == [1.0e8, 2.0e8]
+        assert clock.utcf.tolist() == [UTCF, UTCF]
+        assert clock.utctime.dtype == np.dtype("datetime64[us]")
+        assert (clock.utctime - clock.swifttime == np.timedelta64(int(UTCF * 1e6), "us")).all()
+
+    def test_scalar_met(self, clock_transport):
+        assert len(SwiftClockArray(met=1.0e8).met) == 1
+
+    def test_utctime_datetime64(self, clock_transport):
+        utc = np.array(["2024-01-01T00:00:00", "2024-06-01T12:00:00"], dtype="datetime64[us]")
+        clock = SwiftClockArray(utctime=utc)
+        assert (clock.utctime == utc).all()
+
+    def test_swifttime_datetimes(self, clock_transport):
+        swift = [datetime(2024, 1, 1), datetime(2024, 1, 2)]
+        clock = SwiftClockArray(swifttime=swift)
+        assert clock.swifttime.astype(datetime).tolist() == swift
+
+    def test_astropy_time(self, clock_transport):
+        from astropy.time import Time
+
+        clock = SwiftClockArray(utctime=Time(["2024-01-01T00:00:00"], scale="utc"))
+        assert clock.utctime[0] == np.datetime64("2024-01-01T00:00:00")
+
+    def test_chunked(self, clock_transport, requests_made):
+        met = np.arange(1000, dtype=float) + 1.0e8
+        clock = SwiftClockArray(met=met, chunk_size=300)
+        assert len(requests_made) == 4
+        assert (clock.met == met).all()
+
+    def test_async(self, clock_transport, requests_made):
+        clock = SwiftClockArray(met=np.arange(10, dtype=float), chunk_size=4, autosubmit=False)
+        assert asyncio.run(clock.get())
+        assert len(requests_made) == 3
+        assert clock.met.tolist() == list(range(10))
+
+    def test_max_concurrency(self, slow_transport, concurrency):
+        clock = SwiftClockArray(met=np.arange(40, dtype=float), chunk_size=2, max_concurrency=3)
+        assert clock.status.status == "Accepted"
+        assert (clock.met == np.arange(40)).all()
+        assert 1 < concurrency["max"] <= 3
+
+    def test_async_max_concurrency(self, clock_transport, concurrency, monkeypatch):
+        get = _SwiftClockChunk.get
+
+        async def tracked_get(self, refresh=False):
+            concurrency["active"] += 1
+            concurrency["max"] = max(concurrency["max"], concurrency["active"])
+            await asyncio.sleep(0.001)
+            try:
+                return await get(self, refresh)
+            finally:
+                concurrency["active"] -= 1
+
+        monkeypatch.setattr(_SwiftClockChunk, "get", tracked_get)
+        clock = SwiftClockArray(met=np.arange(40, dtype=float), chunk_size=2, max_concurrency=3, autosubmit=False)
+        assert asyncio.run(clock.get())
+        assert (clock.met == np.arange(40)).all()
+        assert concurrency["max"] == 3
+
+    def test_failure(self, failing_transport):
+        clock = SwiftClockArray(met=np.arange(10, dtype=float), chunk_size=4)
+        assert clock.status.status == "Rejected"
+        assert clock.met is None
+        assert clock.status.errors[0].startswith("Chunk 0:")
+
+    def test_exactly_one_input(self):
+        with pytest.raises(ValueError):
+            SwiftClockArray(met=[1.0], utctime=[datetime(2024, 1, 1)], autosubmit=False)
+
+    def test_chunk_size_positive(self):
+        with pytest.raises(ValueError):
+            SwiftClockArray(met=[1.0], chunk_size=0, autosubmit=False)
+
+    def test_max_concurrency_positive(self):
+        with pytest.raises(ValueError):
+            SwiftClockArray(met=[1.0], max_concurrency=0, autosubmit=False)
+
+    def test_getitem(self, clock_transport):
+        clock = SwiftClockArray(met=[60.0])
+        assert clock[0] == (60.0, UTCF, datetime(2001, 1, 1, 0, 1), datetime(2001, 1, 1, 0, 0, 39, 500000))
+
+    def test_to_swiftclock(self, clock_transport):
+        clock = SwiftClockArray(met=[60.0, 120.0]).to_swiftclock()
+        assert isinstance(clock, SwiftClock)
+        assert clock.met == [60.0, 120.0]
+        assert clock.utctime == [datetime(2001, 1, 1, 0, 0, 39, 500000), datetime(2001, 1, 1, 0, 1, 39, 500000)]
+
+    def test_table(self, clock_transport):
+        assert "UTCF (s)" in str(SwiftClockArray(met=[60.0]))
+
+    def test_repr(self):
+        assert (
+            repr(SwiftClockArray(met=[1.0, 2.0], autosubmit=False)) == "SwiftClockArray(met=<2 values>, chunk_size=400)"
+        )
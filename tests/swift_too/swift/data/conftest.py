@@ -71,8 +71,8 @@ def temp_file_with_content(tmp_path):
 def mock_boto3():
     """Mock boto3 clients."""
     with (
-        patch("swifttools.swift_too.swift.data.boto3.client"),
-        patch("swifttools.swift_too.swift.data.boto3.session.Session.client"),
+        patch("boto3.client"),
+        patch("boto3.session.Session.client"),
     ):
         yield
 
@@ -156,3 +156,45 @@ class TestSwiftDatetimeTzinfoRejection:
 
         with pytest.raises(TypeError):
             swiftdatetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+class TestSwiftDatetimeCompact:
+    def test_no_instance_dict(self, utc_dt_with_utcf):
+        assert not hasattr(utc_dt_with_utcf, "__dict__")
+
+    def test_times_not_stored(self, utc_dt_with_utcf):
+        utc_dt_with_utcf.swifttime
+        utc_dt_with_utcf.utctime
+        assert utc_dt_with_utcf._swifttime is None
+        assert utc_dt_with_utcf._utctime is None
+
+    def test_utcf_change_applies(self, utc_dt_with_utcf):
+        utc_dt_with_utcf.utcf = 20.5
+        assert utc_dt_with_utcf.swifttime == datetime(2023, 1, 1, 11, 59, 39, 500000)
+
+    def test_swifttime_from_utc(self, utc_dt_with_utcf):
+        assert utc_dt_with_utcf.swifttime == datetime(2023, 1, 1, 11, 59, 49, 500000)
+        assert type(utc_dt_with_utcf.swifttime) is datetime
+
+    def test_utctime_from_swifttime(self):
+        dt = swiftdatetime(2023, 1, 1, 12, 0, 0, utcf=10.5)
+        assert dt.utctime == datetime(2023, 1, 1, 12, 0, 10, 500000)
+
+    def test_utctime_without_utcf(self, basic_dt):
+        assert basic_dt.utctime is None
+
+    def test_pickle(self, utc_dt_with_utcf):
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(utc_dt_with_utcf))
+        assert isinstance(restored, swiftdatetime)
+        assert restored == utc_dt_with_utcf
+        assert restored.utcf == 10.5
+        assert restored.isutc
+
+    def test_deepcopy(self, utc_dt_with_utcf):
+        import copy
+
+        copied = copy.deepcopy(utc_dt_with_utcf)
+        assert copied.swifttime == utc_dt_with_utcf.swifttime
+        assert copied is not utc_dt_with_utcf
@@ -0,0 +1,36 @@
+# Local fixtures for tests/swift_too/swift/datetimeplan
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+
+from swifttools.swift_too.base.schemas import BaseSchema
+
+
+class Window(BaseSchema):
+    begin: datetime
+    end: datetime | None = None
+    label: str = ""
+
+
+class Result(BaseSchema):
+    begin: datetime | None = None
+    length: float = 1.0
+    windows: list[Window] = []
+    times: list[datetime] = []
+    extra: Any = None
+    window: Window | None = None
+
+
+@pytest.fixture
+def result():
+    start = datetime(2024, 1, 1)
+    windows = [Window(begin=start + timedelta(hours=i), end=start + timedelta(hours=i, minutes=30)) for i in range(5)]
+    windows[2].end = None
+    return Result(
+        begin=start,
+        windows=windows,
+        times=[start, start + timedelta(days=1)],
+        extra={"when": start + timedelta(days=2), "window": Window(begin=start + timedelta(days=3))},
+        window=Window(begin=start + timedelta(days=4)),
+    )
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta
+from typing import Annotated, Any, Literal
+
+import pytest
+
+from swifttools.swift_too.swift.datetimeplan import DatetimeRefs, _field_kind
+
+from .conftest import Result, Window
+
+
+def all_datetimes(obj: Any) -> list[datetime]:
+    """Every datetime in `obj`, found by searching every field."""
+    if isinstance(obj, datetime):
+        return [obj]
+    if isinstance(obj, (Result, Window)):
+        return [dt for value in obj.__dict__.values() for dt in all_datetimes(value)]
+    if isinstance(obj, list):
+        return [dt for item in obj for dt in all_datetimes(item)]
+    if isinstance(obj, dict):
+        return [dt for item in obj.values() for dt in all_datetimes(item)]
+    return []
+
+
+class TestFieldKind:
+    @pytest.mark.parametrize(
+        "annotation, kind",
+        [
+            (datetime, "datetime"),
+            (datetime | None, "datetime"),
+            (Annotated[datetime, "meta"], "datetime"),
+            (float, None),
+            (str | None, None),
+            (Literal["a", "b"], None),
+            (Window, "model"),
+            (list[Window], ("list", "model")),
+            (list[datetime], ("list", "datetime")),
+            (list[int], None),
+            (datetime | Window | None, "dynamic"),
+            (Any, "dynamic"),
+            (dict, "dynamic"),
+        ],
+    )
+    def test_kinds(self, annotation, kind):
+        assert _field_kind(annotation) == kind
+
+
+class TestDatetimeRefs:
+    def test_finds_all_datetimes(self, result):
+        refs = DatetimeRefs(result)
+        assert sorted(refs.values) == sorted(all_datetimes(result))
+        assert len(refs) == 15
+
+    def test_assign(self, result):
+        refs = DatetimeRefs(result)
+        refs.assign([dt + timedelta(seconds=1) for dt in refs.values])
+        assert result.begin == datetime(2024, 1, 1, 0, 0, 1)
+        assert result.windows[4].end == datetime(2024, 1, 1, 4, 30, 1)
+        assert result.windows[2].end is None
+        assert result.times[1] == datetime(2024, 1, 2, 0, 0, 1)
+        assert result.extra["when"] == datetime(2024, 1, 3, 0, 0, 1)
+        assert result.extra["window"].begin == datetime(2024, 1, 4, 0, 0, 1)
+        assert result.window.begin == datetime(2024, 1, 5, 0, 0, 1)
+
+    def test_assign_round_trip(self, result):
+        before = all_datetimes(result)
+        refs = DatetimeRefs(result)
+        refs.assign(list(refs.values))
+        assert all_datetimes(result) == before
+
+    def test_assign_fewer_values(self, result):
+        refs = DatetimeRefs(result)
+        refs.assign([datetime(2000, 1, 1)])
+        assert all_datetimes(result).count(datetime(2000, 1, 1)) == 1
+
+    def test_assign_bypasses_validation(self, result):
+        class Marker(datetime):
+            pass
+
+        refs = DatetimeRefs(result)
+        refs.assign([Marker(2000, 1, 1)] * len(refs))
+        assert type(result.windows[0].begin) is Marker
+
+    def test_private_attributes_skipped(self, result):
+        object.__setattr__(result, "_cached", [datetime(2000, 1, 1)])
+        assert datetime(2000, 1, 1) not in DatetimeRefs(result).values
+
+    def test_attributes_outside_schema(self, result):
+        object.__setattr__(result, "added", datetime(2000, 1, 1))
+        refs = DatetimeRefs(result)
+        assert datetime(2000, 1, 1) in refs.values
+        refs.assign([datetime(2001, 1, 1)] * len(refs))
+        assert result.__dict__["added"] == datetime(2001, 1, 1)
+
+    def test_unvalidated_values(self):
+        result = Result.model_construct(windows=[{"begin": datetime(2000, 1, 1)}], begin="2024-01-01")
+        assert DatetimeRefs(result).values == [datetime(2000, 1, 1)]
+
+    def test_not_a_schema(self):
+        assert DatetimeRefs({"a": [datetime(2000, 1, 1)]}).values == [datetime(2000, 1, 1)]
@@ -1,6 +1,7 @@
 # Local fixtures for tests/swift_too/swift/swift_obsquery
 from datetime import datetime
 
+import httpx
 import pytest
 
 from swifttools.swift_too.swift.obsquery import SwiftAFST, SwiftAFSTEntry, SwiftObservation
@@ -83,3 +84,24 @@ def sample_afst_entries():
 def swift_observation_with_entries(sample_afst_entries):
     """SwiftObservation instance with sample entries."""
     return SwiftObservation(entries=sample_afst_entries)
+
+
+@pytest.fixture
+def afst_response():
+    """Successful AFST API response with two entries."""
+    entries = [
+        {
+            "begin": "2023-01-01T12:00:00",
+            "settle": "2023-01-01T12:01:00",
+            "end": "2023-01-01T12:10:00",
+            "target_name": "Test Target",
+            "target_id": 12345,
+            "segment": seg,
+            "obs_id": f"0001234500{seg}",
+            "ra": 123.456,
+            "dec": 78.901,
+        }
+        for seg in (1, 2)
+    ]
+    payload = {"afstmax": "2023-12-31T00:00:00", "entries": entries, "status": {"status": "Accepted"}}
+    return httpx.Response(200, json=payload, request=httpx.Request("GET", "https://www.swift.psu.edu/api"))
@@ -868,6 +868,21 @@ class TestSwiftAFST:
         afst = SwiftAFST(target_id=[12345, 67890], autosubmit=False)
         assert afst.target_id == [12345, 67890]
 
+    def test_trusted_response_entries(self, swift_afst, afst_response):
+        assert swift_afst._handle_response(afst_response) is True
+        assert [entry.segment for entry in swift_afst.entries] == [1, 2]
+        assert swift_afst.entries[0].begin == datetime(2023, 1, 1, 12, 0, 0)
+
+    def test_trusted_response_defers_skycoord(self, swift_afst, afst_response):
+        swift_afst._handle_response(afst_response)
+        assert "skycoord" not in swift_afst.entries[0].__dict__
+        assert np.isclose(swift_afst.entries[0].skycoord.ra.deg, 123.456, atol=1e-4)
+
+    def test_untrusted_response_creates_skycoord(self, swift_afst, afst_response):
+        with patch("swifttools.swift_too.base.common.trust_responses", False):
+            swift_afst._handle_response(afst_response)
+        assert "skycoord" in swift_afst.entries[0].__dict__
+
 
 class TestAliases:
     def test_swift_afst_entry_aliases(self):
@@ -938,3 +953,95 @@ class TestSchemas:
         """Test SwiftAFSTSchema default values."""
         schema = SwiftAFSTSchema()
         assert schema.entries == []
+
+
+class TestObservationsIndex:
+    def test_per_instance(self, sample_afst_entries):
+        first = SwiftAFST(autosubmit=False)
+        first.extend(sample_afst_entries)
+        second = SwiftAFST(autosubmit=False)
+        assert len(first.observations) == 2
+        assert len(second.observations) == 0
+
+    def test_cached(self, swift_afst, sample_afst_entries):
+        swift_afst.extend(sample_afst_entries)
+        observations = swift_afst.observations
+        assert swift_afst.observations is observations
+        assert observations["00012345001"]._aggregates() is observations["00012345001"]._aggregates()
+
+    def test_rebuilt_after_entry_replaced(self, swift_afst, sample_afst_entries):
+        swift_afst.extend(sample_afst_entries)
+        assert len(swift_afst.observations) == 2
+        swift_afst[1] = sample_afst_entries[0].model_copy()
+        assert list(swift_afst.observations) == ["00012345001"]
+        assert len(swift_afst.observations["00012345001"]) == 2
+
+    def test_rebuilt_after_append(self, swift_afst, sample_afst_entries):
+        swift_afst.append(sample_afst_entries[0])
+        assert list(swift_afst.observations) == ["00012345001"]
+        swift_afst.append(sample_afst_entries[1])
+        assert list(swift_afst.observations) == ["00012345001", "00012345002"]
+
+    def test_rebuilt_after_response(self, swift_afst, sample_afst_entries, afst_response):
+        swift_afst.extend(sample_afst_entries[:1])
+        assert len(swift_afst.observations) == 1
+        swift_afst._handle_response(afst_response)
+        assert list(swift_afst.observations) == ["00012345001", "00012345002"]
+
+    def test_rebuilt_after_clock_correct(self, swift_afst, sample_afst_entries):
+        class ShiftedClock:
+            def __init__(self, swifttime):
+                self.entries = [value + timedelta(seconds=10) for value in swifttime]
+
+            def to_utctime(self):
+                pass
+
+        swift_afst.extend([entry.model_copy() for entry in sample_afst_entries])
+        assert swift_afst.observations["00012345001"].begin == datetime(2023, 1, 1, 12, 0)
+        with patch("swifttools.swift_too.swift.clock.Clock", ShiftedClock):
+            swift_afst.clock_correct()
+        assert swift_afst.observations["00012345001"].begin == datetime(2023, 1, 1, 12, 0, 10)
+
+    def test_rebuilt_after_new_entries(self, swift_afst, sample_afst_entries):
+        swift_afst.extend(sample_afst_entries)
+        assert len(swift_afst.observations) == 2
+        swift_afst.entries = sample_afst_entries[:1]
+        assert list(swift_afst.observations) == ["00012345001"]
+
+    def test_groups_snapshots(self, swift_afst, sample_afst_entries):
+        snapshot = sample_afst_entries[0].model_copy(
+            update={"begin": datetime(2023, 1, 1, 13, 0), "settle": datetime(2023, 1, 1, 13, 1)}
+        )
+        snapshot.end = datetime(2023, 1, 1, 13, 11)
+        swift_afst.extend([sample_afst_entries[0], sample_afst_entries[1], snapshot])
+        observation = swift_afst.observations["00012345001"]
+        assert len(observation) == 2
+        assert observation.begin == datetime(2023, 1, 1, 12, 0)
+        assert observation.end == datetime(2023, 1, 1, 13, 11)
+        assert observation.exposure == timedelta(minutes=14)
+        assert observation.slewtime == timedelta(minutes=2)
+
+    def test_aggregates_updated_after_append(self, swift_observation, sample_afst_entries):
+        swift_observation.append(sample_afst_entries[0])
+        assert swift_observation.end == datetime(2023, 1, 1, 12, 5)
+        swift_observation.append(sample_afst_entries[1])
+        assert swift_observation.end == datetime(2023, 1, 1, 12, 15)
+        assert swift_observation.exposure == timedelta(minutes=8)
+
+    def test_aggregates_updated_after_entry_replaced(self, swift_observation, sample_afst_entries):
+        swift_observation.extend([sample_afst_entries[0], sample_afst_entries[0]])
+        assert swift_observation.end == datetime(2023, 1, 1, 12, 5)
+        swift_observation[1] = sample_afst_entries[1]
+        assert swift_observation.end == datetime(2023, 1, 1, 12, 15)
+
+    def test_aggregates_updated_after_new_entries(self, swift_observation, sample_afst_entries):
+        swift_observation.append(sample_afst_entries[0])
+        assert swift_observation.end == datetime(2023, 1, 1, 12, 5)
+        swift_observation.entries = sample_afst_entries[1:]
+        assert swift_observation.end == datetime(2023, 1, 1, 12, 15)
+
+    def test_aggregates_without_times(self, swift_observation):
+        swift_observation.append(SwiftAFSTEntry(ra=1, dec=2))
+        assert swift_observation.begin is None
+        assert swift_observation.end is None
+        assert swift_observation.exposure is None
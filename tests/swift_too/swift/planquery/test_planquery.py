@@ -2,7 +2,7 @@ from datetime import timedelta
 
 import pytest
 
-from swifttools.swift_too.swift.planquery import SwiftPPSTEntry, SwiftPPSTGetSchema
+from swifttools.swift_too.swift.planquery import SwiftPPST, SwiftPPSTEntry, SwiftPPSTGetSchema
 
 
 class TestSwiftPPSTEntry:
@@ -128,6 +128,17 @@ class TestSwiftPPST:
         obs = ppst.observations
         assert "00012345678" in obs
 
+    def test_observations_rebuilt_after_new_entries(self, ppst, entry_with_obs_id, basic_entry):
+        ppst.entries = [entry_with_obs_id]
+        assert "00012345678" in ppst.observations
+        ppst.entries = [basic_entry]
+        assert "00012345678" not in ppst.observations
+
+    def test_observations_not_shared(self, ppst, entry_with_obs_id):
+        ppst.extend([entry_with_obs_id])
+        assert len(ppst.observations) == 1
+        assert len(SwiftPPST(autosubmit=False).observations) == 0
+
     def test_getitem(self, ppst, basic_entry):
         ppst.entries = [basic_entry]
         assert ppst[0] == basic_entry
@@ -0,0 +1,30 @@
+# Local fixtures for tests/swift_too/swift/pointingindex
+import numpy as np
+import pytest
+
+
+def unit_vectors(ra, dec):
+    ra, dec = np.radians(ra), np.radians(dec)
+    return np.stack([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)], axis=-1)
+
+
+def brute_force(ra, dec, query_ra, query_dec, radius):
+    """Indices of the pointings within `radius` of each position, by
+    comparing every position with every pointing."""
+    vectors = unit_vectors(ra, dec)
+    radius = np.broadcast_to(radius, np.shape(query_ra))
+    return [
+        np.flatnonzero(vectors @ unit_vectors(r, d) >= np.cos(np.radians(rad)))
+        for r, d, rad in zip(query_ra, query_dec, radius)
+    ]
+
+
+@pytest.fixture
+def sky():
+    """Random pointings, plus some near the poles and either side of RA=0."""
+    rng = np.random.default_rng(1)
+    ra = rng.uniform(0, 360, 20000)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 20000)))
+    ra[:6] = [0.0, 359.99, 0.01, 180.0, 10.0, 200.0]
+    dec[:6] = [0.0, 0.0, 0.0, 89.95, -89.99, 89.9]
+    return ra, dec
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+
+import httpx
+import numpy as np
+import pytest
+
+from swifttools.swift_too.swift.afststore import AFSTStore
+from swifttools.swift_too.swift.obsquery import SwiftAFST
+from swifttools.swift_too.swift.pointingindex import PointingIndex
+
+from .conftest import brute_force
+
+
+class TestQuery:
+    def test_matches_brute_force(self, sky):
+        ra, dec = sky
+        rng = np.random.default_rng(2)
+        query_ra = rng.uniform(0, 360, 500)
+        query_dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 500)))
+        radius = rng.uniform(0.05, 3, 500)
+        results = PointingIndex({"ra": ra, "dec": dec}).query(query_ra, query_dec, radius)
+        for result, expected in zip(results, brute_force(ra, dec, query_ra, query_dec, radius)):
+            np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "query_ra, query_dec",
+        [(0.0, 0.0), (359.9, 0.0), (0.0, 90.0), (90.0, -90.0), (200.0, 89.8)],
+    )
+    def test_ra_wrap_and_poles(self, sky, query_ra, query_dec):
+        ra, dec = sky
+        index = PointingIndex({"ra": ra, "dec": dec}, band_height=0.5)
+        (result,) = index.query(query_ra, query_dec, 0.5)
+        (expected,) = brute_force(ra, dec, [query_ra], [query_dec], 0.5)
+        np.testing.assert_array_equal(result, expected)
+        assert len(result) > 0
+
+    def test_default_radius(self):
+        index = PointingIndex({"ra": np.array([10.0, 10.0]), "dec": np.array([0.1, 0.3])})
+        (result,) = index.query(10.0, 0.0)
+        assert result.tolist() == [0]
+
+    def test_no_matches(self):
+        index = PointingIndex({"ra": np.array([10.0]), "dec": np.array([0.0])})
+        results = index.query([100.0, 200.0], [0.0, 0.0])
+        assert [len(result) for result in results] == [0, 0]
+
+    def test_missing_coordinates_ignored(self):
+        index = PointingIndex({"ra": np.array([10.0, np.nan]), "dec": np.array([0.0, 0.0])})
+        assert len(index) == 1
+        (result,) = index.query(10.0, 0.0)
+        assert result.tolist() == [0]
+
+    def test_chunked(self, sky):
+        ra, dec = sky
+        index = PointingIndex({"ra": ra, "dec": dec})
+        query_ra, query_dec = ra[:100] + 0.01, dec[:100]
+        whole = index.query_pairs(query_ra, query_dec, 1.0)
+        chunked = index.query_pairs(query_ra, query_dec, 1.0, chunk_size=7)
+        for a, b in zip(whole, chunked):
+            np.testing.assert_array_equal(a, b)
+
+    def test_separation(self):
+        index = PointingIndex({"ra": np.array([10.0]), "dec": np.array([0.0])})
+        _, _, separation = index.query_pairs(10.1, 0.0, 1.0)
+        assert separation[0] == pytest.approx(0.1)
+
+    def test_invalid_band_height(self):
+        with pytest.raises(ValueError):
+            PointingIndex({"ra": np.array([]), "dec": np.array([])}, band_height=0)
+
+
+class TestCrossmatch:
+    def test_dataframe(self):
+        columns = {
+            "ra": np.array([10.0, 20.0]),
+            "dec": np.array([0.0, 0.0]),
+            "obs_id": np.array(["00010000001", "00010001001"], dtype=object),
+        }
+        df = PointingIndex(columns).crossmatch([20.05, 10.0, 50.0], [0.0, 0.0, 0.0])
+        assert df["position"].tolist() == [0, 1]
+        assert df["obs_id"].tolist() == ["00010001001", "00010000001"]
+        assert df["separation"].tolist() == pytest.approx([0.05, 0.0])
+
+
+def afst_payload():
+    entries = []
+    for i in range(4):
+        begin = datetime(2024, 1, 1) + timedelta(hours=i)
+        entries.append(
+            {
+                "begin": begin.isoformat(),
+                "settle": begin.isoformat(),
+                "end": (begin + timedelta(minutes=30)).isoformat(),
+                "target_id": 10000 + i,
+                "segment": 1,
+                "obs_id": f"{10000 + i:08d}001",
+                "ra": 10.0 * i,
+                "dec": 5.0,
+            }
+        )
+    return {"afstmax": "2024-01-02T00:00:00", "entries": entries, "status": {"status": "Accepted"}}
+
+
+@pytest.fixture
+def api(mock_api):
+    def handler(request):
+        return httpx.Response(200, json=afst_payload())
+
+    mock_api(handler)
+
+
+class TestSources:
+    def test_from_result(self, api):
+        afst = SwiftAFST(begin=datetime(2024, 1, 1), length=1)
+        index = PointingIndex.from_result(afst)
+        (result,) = index.query(20.0, 5.05)
+        assert afst.entries[result[0]].target_id == 10002
+
+    def test_from_store(self, api, tmp_path):
+        store = AFSTStore(path=tmp_path / "afst.sqlite")
+        assert store.sync(begin=datetime(2024, 1, 1), until=datetime(2024, 1, 2))
+        index = PointingIndex.from_store(store)
+        assert len(index) == 4
+        (result,) = index.query(30.0, 5.0)
+        assert index.columns["target_id"][result].tolist() == [10003]
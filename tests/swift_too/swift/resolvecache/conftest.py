@@ -0,0 +1,43 @@
+# Local fixtures for tests/swift_too/swift/resolvecache
+import httpx
+import pytest
+
+from swifttools.swift_too.swift.resolvecache import ResolveCache
+
+# Names known to the mock resolver
+KNOWN = {"crab": (83.63, 22.01), "m31": (10.68, 41.27)}
+
+
+@pytest.fixture
+def api(mock_api):
+    """Mock API resolving the names in `KNOWN`, rejecting other names, and
+    failing with a server error if `state["fail"]` is set. Visibility queries
+    return no windows."""
+    state = {"resolves": [], "fail": False}
+
+    def handler(request):
+        if not request.url.path.endswith("/resolve"):
+            return httpx.Response(200, json={"windows": [], "status": {"status": "Accepted"}})
+        name = request.url.params["name"]
+        state["resolves"].append(name)
+        if state["fail"]:
+            return httpx.Response(503, text="Service Unavailable")
+        position = KNOWN.get(name.strip().lower())
+        if position is None:
+            return httpx.Response(200, json={"status": {"status": "Rejected", "errors": [f"Could not resolve {name}"]}})
+        ra, dec = position
+        return httpx.Response(200, json={"ra": ra, "dec": dec, "resolver": "Simbad", "status": {"status": "Accepted"}})
+
+    mock_api(handler)
+    return state
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Enabled resolve cache in a temporary directory, used by
+    `SwiftResolve`."""
+    import swifttools.swift_too.swift.resolve as resolve_module
+
+    cache = ResolveCache(path=tmp_path / "resolve.sqlite", enabled=True)
+    monkeypatch.setattr(resolve_module, "resolve_cache", cache)
+    return cache
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+
+from swifttools.swift_too.swift.resolve import SwiftResolve
+from swifttools.swift_too.swift.resolvecache import ResolveCache, normalize_name
+from swifttools.swift_too.swift.visquery import SwiftVisQuery
+
+
+class TestNormalizeName:
+    @pytest.mark.parametrize("name", ["M31", " m31 ", "m31"])
+    def test_case_and_whitespace(self, name):
+        assert normalize_name(name) == "m31"
+
+    def test_inner_whitespace(self):
+        assert normalize_name("SN  2023ixf") == normalize_name("sn 2023IXF")
+        assert normalize_name("SN 2023ixf") != normalize_name("SN2023ixf")
+
+
+class TestResolveCache:
+    def test_set_and_get(self, tmp_path):
+        cache = ResolveCache(path=tmp_path / "resolve.sqlite", enabled=True)
+        assert cache.get("Crab") is None
+        cache.set("Crab", 83.63, 22.01, "Simbad")
+        assert cache.get("CRAB") == {"ra": 83.63, "dec": 22.01, "resolver": "Simbad"}
+        assert cache.stats == {"hits": 1, "negative_hits": 0, "misses": 1, "stores": 1}
+        cache.reset_stats()
+        assert cache.stats["hits"] == 0
+
+    def test_expiry(self, tmp_path, monkeypatch):
+        cache = ResolveCache(path=tmp_path / "resolve.sqlite", ttl=10, negative_ttl=5, enabled=True)
+        cache.set("Crab", 83.63, 22.01)
+        cache.set_error("Nowhere", "Could not resolve Nowhere")
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 7)
+        assert cache.get("Crab") is not None
+        assert cache.get("Nowhere") is None
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert cache.get("Crab") is None
+        assert len(cache) == 0
+
+    def test_negative_caching_disabled(self, tmp_path):
+        cache = ResolveCache(path=tmp_path / "resolve.sqlite", negative_ttl=0, enabled=True)
+        cache.set_error("Nowhere", "Could not resolve Nowhere")
+        assert len(cache) == 0
+
+    def test_invalidate(self, tmp_path):
+        cache = ResolveCache(path=tmp_path / "resolve.sqlite", enabled=True)
+        cache.set("Crab", 83.63, 22.01)
+        cache.set("M31", 10.68, 41.27)
+        cache.invalidate("crab")
+        assert cache.get("Crab") is None and cache.get("M31") is not None
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestSwiftResolve:
+    def test_resolved_once(self, api, cache):
+        first = SwiftResolve(name="Crab")
+        second = SwiftResolve(name=" crab")
+        assert api["resolves"] == ["Crab"]
+        assert (second.ra, second.dec, second.resolver) == (83.63, 22.01, "Simbad")
+        assert second.status.status == "Accepted"
+        assert second.skycoord is not None
+        assert first.ra == second.ra
+        assert cache.stats["hits"] == 1
+
+    def test_persisted(self, api, cache):
+        SwiftResolve(name="Crab")
+        reopened = ResolveCache(path=cache.path, enabled=True)
+        assert reopened.get("crab")["ra"] == 83.63
+
+    def test_negative_caching(self, api, cache):
+        first = SwiftResolve(name="Nowhere")
+        second = SwiftResolve(name="nowhere")
+        assert api["resolves"] == ["Nowhere"]
+        assert second.status.status == "Rejected"
+        assert second.status.errors == first.status.errors == ["Could not resolve Nowhere"]
+        assert second.ra is None
+        assert cache.stats["negative_hits"] == 1
+
+    def test_server_errors_not_cached(self, api, cache):
+        api["fail"] = True
+        SwiftResolve(name="Crab")
+        assert len(cache) == 0
+        api["fail"] = False
+        api["resolves"].clear()
+        assert SwiftResolve(name="Crab").ra == 83.63
+        assert api["resolves"] == ["Crab"]
+
+    def test_refresh(self, api, cache):
+        SwiftResolve(name="Crab")
+        resolve = SwiftResolve(name="Crab", autosubmit=False)
+        resolve.submit_get(refresh=True)
+        assert len(api["resolves"]) == 2
+
+    def test_async(self, api, cache):
+        SwiftResolve(name="Crab")
+        resolve = SwiftResolve(name="Crab", autosubmit=False)
+        assert asyncio.run(resolve.get())
+        assert resolve.ra == 83.63
+        assert len(api["resolves"]) == 1
+
+    def test_disabled(self, api, cache):
+        cache.disable()
+        SwiftResolve(name="Crab")
+        SwiftResolve(name="Crab")
+        assert len(api["resolves"]) == 2
+        assert len(cache) == 0
+
+
+class TestAutoResolve:
+    def test_many_objects_resolve_once(self, api, cache):
+        queries = [SwiftVisQuery(name="M31", autosubmit=False) for _ in range(50)]
+        assert api["resolves"] == ["M31"]
+        assert all((query.ra, query.dec) == (10.68, 41.27) for query in queries)
+
+    def test_name_setter_uses_cache(self, api, cache):
+        SwiftResolve(name="Crab")
+        query = SwiftVisQuery(ra=1.0, dec=2.0, autosubmit=False)
+        query.name = "crab"
+        assert (query.ra, query.dec) == pytest.approx((83.63, 22.01))
+        assert api["resolves"] == ["Crab"]
@@ -0,0 +1,65 @@
+# Local fixtures for tests/swift_too/swift/saastore
+from datetime import datetime, timedelta
+
+import httpx
+import numpy as np
+import pytest
+
+from swifttools.swift_too.swift.saastore import SAAStore
+
+START = datetime(2024, 1, 1)
+
+# Mock SAA passages, starting every 96 minutes and lasting 15 minutes (20
+# minutes for the BAT definition)
+PERIOD = timedelta(minutes=96)
+LENGTH = {False: timedelta(minutes=15), True: timedelta(minutes=20)}
+
+
+def _time(value):
+    return datetime.fromisoformat(value.replace(" ", "T"))
+
+
+def expected_in_saa(times, bat=False):
+    """Is each time in a mock SAA passage?"""
+    offset = (np.asarray(times, dtype="datetime64[us]") - np.datetime64(START, "us")) % np.timedelta64(PERIOD)
+    return offset < np.timedelta64(LENGTH[bat])
+
+
+@pytest.fixture
+def api(mock_api):
+    """Mock API returning the passages within the requested time range,
+    clipped to it, and recording each request. Requests for ranges starting
+    on a day in `state["fail_days"]` fail."""
+    state = {"requests": [], "fail_days": set()}
+
+    def handler(request):
+        state["requests"].append(request)
+        begin = _time(request.url.params["begin"])
+        end = _time(request.url.params["end"])
+        if begin.date() in state["fail_days"]:
+            return httpx.Response(500, text="Internal Server Error")
+        bat = request.url.params.get("bat") == "true"
+        entries = []
+        passage = START + PERIOD * ((begin - START) // PERIOD)
+        while passage < end:
+            passage_begin, passage_end = max(passage, begin), min(passage + LENGTH[bat], end)
+            if passage_begin < passage_end:
+                entries.append({"begin": passage_begin.isoformat(), "end": passage_end.isoformat()})
+            passage += PERIOD
+        return httpx.Response(
+            200,
+            json={
+                "begin": begin.isoformat(),
+                "end": end.isoformat(),
+                "entries": entries,
+                "status": {"status": "Accepted"},
+            },
+        )
+
+    mock_api(handler)
+    return state
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SAAStore(path=tmp_path / "saa.sqlite")
@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+import numpy as np
+
+from swifttools.swift_too.base.intervals import IntervalSet
+from swifttools.swift_too.swift.saastore import SAAStore
+
+from .conftest import START, expected_in_saa
+
+
+def random_times(n, days, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.datetime64(START, "us") + rng.integers(0, int(days * 86400e6), n).astype("timedelta64[us]")
+
+
+class TestInSAA:
+    def test_matches_passages(self, store, api):
+        times = random_times(100000, 3)
+        assert np.array_equal(store.in_saa(times), expected_in_saa(times))
+        # One request per missing day
+        assert len(api["requests"]) == 3
+
+    def test_passages_across_day_boundaries_are_joined(self, store, api):
+        store.fetch(START, START + timedelta(days=2))
+        passages = store.passages()
+        # Every passage is 15 minutes long, even those split between requests
+        assert set(passages.durations.tolist()) == {timedelta(minutes=15)}
+
+    def test_only_fetches_missing_days(self, store, api):
+        store.in_saa(random_times(1000, 2))
+        api["requests"].clear()
+        times = random_times(1000, 4, seed=1)
+        assert np.array_equal(store.in_saa(times), expected_in_saa(times))
+        assert [request.url.params["begin"] for request in api["requests"]] == [
+            "2024-01-03 00:00:00",
+            "2024-01-04 00:00:00",
+        ]
+        assert store.coverage() == IntervalSet([START], [START + timedelta(days=4)])
+
+    def test_persisted(self, store, api, tmp_path):
+        store.fetch(START, START + timedelta(hours=12))
+        api["requests"].clear()
+        reopened = SAAStore(path=store.path)
+        times = random_times(1000, 1)
+        assert np.array_equal(reopened.in_saa(times), expected_in_saa(times))
+        assert api["requests"] == []
+        assert reopened.passages() == store.passages()
+
+    def test_without_fetch(self, store, api):
+        times = random_times(1000, 1)
+        assert not store.in_saa(times, fetch=False).any()
+        assert api["requests"] == []
+
+    def test_bat_stored_separately(self, store, api):
+        times = random_times(10000, 1)
+        spacecraft = store.in_saa(times)
+        bat = store.in_saa(times, bat=True)
+        assert np.array_equal(bat, expected_in_saa(times, bat=True))
+        assert bat.sum() > spacecraft.sum()
+        assert len(api["requests"]) == 2
+
+    def test_shape_and_nat(self, store, api):
+        times = random_times(12, 1).reshape(3, 4)
+        times[0, 0] = np.datetime64("NaT")
+        result = store.in_saa(times)
+        assert result.shape == (3, 4)
+        assert not result[0, 0]
+        assert np.array_equal(result.ravel()[1:], expected_in_saa(times.ravel()[1:]))
+
+
+class TestFetch:
+    def test_failed_days_are_retried(self, store, api):
+        api["fail_days"] = {(START + timedelta(days=1)).date()}
+        assert not store.fetch(START, START + timedelta(days=2, hours=12))
+        assert store.missing(START, START + timedelta(days=2, hours=12)) == IntervalSet(
+            [START + timedelta(days=1)], [START + timedelta(days=2)]
+        )
+        api["fail_days"] = set()
+        api["requests"].clear()
+        assert store.fetch(START, START + timedelta(days=2, hours=12))
+        assert len(api["requests"]) == 1
+
+    def test_fetch_days(self, tmp_path, api):
+        store = SAAStore(path=tmp_path / "saa.sqlite", fetch_days=3)
+        store.fetch(START, START + timedelta(days=5, hours=1))
+        assert len(api["requests"]) == 2
+
+    def test_passages_clipped(self, store, api):
+        store.fetch(START, START + timedelta(days=1))
+        passages = store.passages(START + timedelta(minutes=10), START + timedelta(hours=2))
+        assert list(passages) == [
+            (START + timedelta(minutes=10), START + timedelta(minutes=15)),
+            (START + timedelta(minutes=96), START + timedelta(minutes=111)),
+        ]
+
+    def test_clear(self, store, api):
+        store.fetch(START, START + timedelta(days=1))
+        store.clear()
+        assert len(store.passages()) == 0
+        assert len(SAAStore(path=store.path).coverage()) == 0
@@ -127,7 +127,7 @@ def too_request_submit_success(too_request_base):
         patch.object(too, "validate_post", return_value=True),
         patch.object(type(too), "_post_schema") as mock_post_schema,
     ):
-        mock_response = mock_client.return_value.__enter__.return_value.post.return_value
+        mock_response = mock_client.return_value.post.return_value
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": "Accepted", "too_id": 123}
         mock_post_schema.model_validate.return_value.model_dump.return_value = {"param": "value"}
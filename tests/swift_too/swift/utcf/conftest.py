@@ -0,0 +1,42 @@
+# Local fixtures for tests/swift_too/swift/utcf
+import httpx
+import numpy as np
+import pytest
+
+from swifttools.swift_too.base.constants import LEAP_SECONDS
+from swifttools.swift_too.swift.utcf import UTCFTable, _met
+
+LEAP_MET = np.array([_met(leap) for leap in LEAP_SECONDS])
+
+
+def true_utcf(met):
+    """UTCF with a slow linear drift, decreasing by one second at each leap
+    second."""
+    met = np.asarray(met, dtype=float)
+    drift = -0.5 + 1e-9 * met
+    leaps = np.searchsorted(LEAP_MET, met + drift - np.searchsorted(LEAP_MET, met, side="right"), side="right")
+    return drift - leaps
+
+
+@pytest.fixture
+def requests_made():
+    return []
+
+
+@pytest.fixture
+def clock_transport(mock_api, requests_made):
+    def handler(request):
+        met = [float(value) for value in request.url.params.get_list("met")]
+        requests_made.append(met)
+        entries = [{"met": value, "utcf": float(true_utcf(value)), "isutc": False} for value in met]
+        return httpx.Response(200, json={"entries": entries, "status": {"status": "Accepted"}})
+
+    mock_api(handler)
+
+
+@pytest.fixture
+def table(tmp_path, clock_transport, monkeypatch):
+    """Enabled UTCF table with monthly entries, used by Clock."""
+    table = UTCFTable(path=tmp_path / "utcf.npz", spacing=30 * 86400.0, enabled=True)
+    monkeypatch.setattr("swifttools.swift_too.swift.utcf.utcf_table", table)
+    return table
@@ -0,0 +1,121 @@
+from datetime import datetime
+
+import httpx
+import numpy as np
+
+from swifttools.swift_too.swift.clock import SwiftClock
+from swifttools.swift_too.swift.utcf import UTCFTable, _met
+
+from .conftest import LEAP_MET, true_utcf
+
+MET = 4.0e8
+
+
+class TestUTCFTable:
+    def test_refresh_fetches_from_launch(self, table, requests_made):
+        assert table.refresh(until=datetime(2010, 1, 1))
+        assert table.met[0] == _met(datetime(2004, 11, 20))
+        assert table.met[-1] < _met(datetime(2010, 1, 1))
+        assert np.allclose(table.utcf, true_utcf(table.met))
+
+    def test_refresh_is_incremental(self, table, requests_made):
+        table.refresh(until=datetime(2010, 1, 1))
+        count = len(table)
+        requests_made.clear()
+        table.refresh(until=datetime(2011, 1, 1))
+        assert min(met for request in requests_made for met in request) > _met(datetime(2009, 12, 1))
+        assert len(table) > count
+
+    def test_saved_and_loaded(self, table, tmp_path):
+        table.refresh(until=datetime(2010, 1, 1))
+        loaded = UTCFTable(path=tmp_path / "utcf.npz")
+        assert loaded.load()
+        assert (loaded.met == table.met).all()
+
+    def test_load_missing(self, tmp_path):
+        assert not UTCFTable(path=tmp_path / "missing.npz").load()
+
+    def test_failed_refresh(self, mock_api, tmp_path):
+        table = UTCFTable(path=tmp_path / "utcf.npz")
+        mock_api(lambda request: httpx.Response(500))
+        assert not table.refresh(until=datetime(2010, 1, 1))
+        assert len(table) == 0
+
+    def test_interpolation(self, table):
+        table.refresh(until=datetime(2010, 1, 1))
+        met = np.linspace(table.met[0], table.met[-1], 1000)
+        away_from_leaps = np.abs(met[:, None] - LEAP_MET[None, :]).min(axis=1) > 31 * 86400
+        assert np.allclose(table.utcf_at(met)[away_from_leaps], true_utcf(met)[away_from_leaps], atol=1e-3)
+
+    def test_leap_second_step(self, table):
+        table.refresh(until=datetime(2010, 1, 1))
+        leap = _met(datetime(2009, 1, 1))
+        before = table.utcf_at(leap - 60)
+        after = table.utcf_at(leap + 60)
+        assert np.isclose(before - after, 1.0, atol=0.01)
+
+    def test_outside_table(self, table):
+        table.refresh(until=datetime(2010, 1, 1))
+        assert np.isnan(table.utcf_at(_met(datetime(2020, 1, 1))))
+        assert not table.covers([_met(datetime(2003, 1, 1))])[0]
+
+    def test_scalar(self, table):
+        table.refresh(until=datetime(2010, 1, 1))
+        assert np.shape(table.utcf_at(2.0e8)) == ()
+
+    def test_utc_round_trip(self, table):
+        table.refresh(until=datetime(2010, 1, 1))
+        met = np.array([1.5e8, 2.5e8])
+        assert np.allclose(table.utc_to_met(table.met_to_utc(met)), met, atol=1e-6)
+
+    def test_empty(self, tmp_path):
+        table = UTCFTable(path=tmp_path / "utcf.npz")
+        assert np.isnan(table.utcf_at([1.0])).all()
+        assert np.isnan(table.utc_to_met([datetime(2010, 1, 1)])).all()
+
+
+class TestClockWithUTCFTable:
+    def test_clock_uses_table(self, table, requests_made):
+        table.refresh()
+        requests_made.clear()
+        clock = SwiftClock(met=MET)
+        assert requests_made == []
+        assert clock.status.status == "Accepted"
+        assert np.isclose(clock.utcf, true_utcf(MET), atol=1e-3)
+
+    def test_clock_fetches_table_once(self, table, requests_made):
+        SwiftClock(met=MET)
+        count = len(requests_made)
+        SwiftClock(met=MET + 1000)
+        assert len(requests_made) == count
+
+    def test_clock_utctime(self, table):
+        table.refresh()
+        clock = SwiftClock(utctime=datetime(2015, 7, 1, 0, 0, 5))
+        assert clock.utctime == datetime(2015, 7, 1, 0, 0, 5)
+        assert clock.entries[0].isutc
+
+    def test_clock_swifttime(self, table):
+        table.refresh()
+        clock = SwiftClock(swifttime=[datetime(2014, 1, 1), datetime(2014, 1, 2)])
+        assert clock.met == [_met(datetime(2014, 1, 1)), _met(datetime(2014, 1, 2))]
+
+    def test_clock_outside_table_uses_api(self, table, requests_made):
+        table.refresh()
+        requests_made.clear()
+        SwiftClock(met=[MET, 1.0e8])
+        assert requests_made == [[MET, 1.0e8]]
+
+    def test_refresh_bypasses_table(self, table, requests_made):
+        table.refresh()
+        requests_made.clear()
+        clock = SwiftClock(met=MET, autosubmit=False)
+        clock.submit_get(refresh=True)
+        assert requests_made == [[MET]]
+
+    def test_disabled(self, table, requests_made):
+        table.refresh()
+        table.disable()
+        requests_made.clear()
+        SwiftClock(met=MET)
+        assert requests_made == [[MET]]
@@ -0,0 +1,41 @@
+# Local fixtures for tests/swift_too/swift/visbatch
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from swifttools.swift_too.swift.visbatch import VisTileCache
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def api(mock_api):
+    """Mock API recording each request, which returns windows from 00:00 to
+    06:00 and from 12:00 to the end of each requested day, or fails for
+    targets in the southern hemisphere if `state["fail_south"]` is set."""
+    state = {"requests": [], "fail_south": False}
+
+    def handler(request):
+        state["requests"].append(request)
+        if state["fail_south"] and float(request.url.params["dec"]) < 0:
+            return httpx.Response(500, text="Internal Server Error")
+        day = datetime.fromisoformat(request.url.params["begin"])
+        windows = [
+            {"begin": day.isoformat(), "end": (day + timedelta(hours=6)).isoformat()},
+            {"begin": (day + timedelta(hours=12)).isoformat(), "end": (day + timedelta(days=1)).isoformat()},
+        ]
+        return httpx.Response(200, json={"windows": windows, "status": {"status": "Accepted"}})
+
+    mock_api(handler)
+    return state
+
+
+@pytest.fixture
+def tile_cache(monkeypatch):
+    """Empty tile cache, used by `SwiftVisQuery.batch`."""
+    import swifttools.swift_too.swift.visbatch as visbatch_module
+
+    cache = VisTileCache()
+    monkeypatch.setattr(visbatch_module, "vis_tile_cache", cache)
+    return cache
@@ -0,0 +1,116 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from astropy.coordinates import SkyCoord
+
+from swifttools.swift_too.swift.visbatch import VisTileCache, _join, healpix_center, healpix_pixel
+from swifttools.swift_too.swift.visquery import SwiftVisQuery
+
+from .conftest import START
+
+
+class TestHealpix:
+    def test_center_round_trip(self):
+        for nside in (1, 2, 16, 64):
+            pixel = np.arange(12 * nside**2)
+            assert np.array_equal(healpix_pixel(*healpix_center(pixel, nside), nside), pixel)
+
+    def test_equal_area(self):
+        rng = np.random.default_rng(0)
+        ra = rng.uniform(0, 360, 768000)
+        dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 768000)))
+        counts = np.bincount(healpix_pixel(ra, dec, 8), minlength=768)
+        assert len(counts) == 768
+        # Uniformly distributed positions fill each pixel equally, to within
+        # Poisson noise
+        assert np.abs(counts - 1000).max() < 5 * np.sqrt(1000)
+
+    def test_known_pixels(self):
+        assert healpix_pixel([0.0, 45.0, 0.0], [90.0, 41.8103149, -90.0], 1).tolist() == [0, 0, 8]
+        ra, dec = healpix_center([0, 4, 11], 1)
+        assert np.allclose(ra, [45.0, 0.0, 315.0])
+        assert np.allclose(dec, [41.8103149, 0.0, -41.8103149])
+
+
+class TestTileCache:
+    def test_evicts_least_recently_used(self):
+        cache = VisTileCache(max_tiles=2)
+        cache.set("a", [])
+        cache.set("b", [])
+        cache.get("a")
+        cache.set("c", [])
+        assert cache.get("b") is None
+        assert cache.get("a") == [] and cache.get("c") == []
+        assert len(cache) == 2
+
+
+class TestJoin:
+    def test_joins_across_midnight(self):
+        day = START + timedelta(days=1)
+        windows = [(START, day), (day, day + timedelta(hours=3)), (day + timedelta(hours=5), day + timedelta(hours=6))]
+        assert _join(windows, START, day + timedelta(days=1)) == [
+            (START, day + timedelta(hours=3)),
+            (day + timedelta(hours=5), day + timedelta(hours=6)),
+        ]
+
+    def test_clips(self):
+        windows = [(START, START + timedelta(hours=6)), (START + timedelta(hours=12), START + timedelta(days=1))]
+        assert _join(windows, START + timedelta(hours=3), START + timedelta(hours=8)) == [
+            (START + timedelta(hours=3), START + timedelta(hours=6))
+        ]
+
+
+class TestBatch:
+    def test_shares_tiles(self, api, tile_cache):
+        coords = [(10.0, 20.0), (10.1, 20.1), (200.0, -30.0)]
+        table = SwiftVisQuery.batch(coords, START, length=2)
+        # Two tiles for each of two days
+        assert len(api["requests"]) == 4
+        assert isinstance(table, pd.DataFrame)
+        assert table.columns.tolist() == ["index", "begin", "end", "length"]
+        first = table[table["index"] == 0]
+        assert list(zip(first["begin"], first["end"])) == [
+            (START, START + timedelta(hours=6)),
+            (START + timedelta(hours=12), START + timedelta(days=1, hours=6)),
+            (START + timedelta(days=1, hours=12), START + timedelta(days=2)),
+        ]
+        assert sorted(set(table["index"])) == [0, 1, 2]
+        assert table.attrs["errors"] == {}
+
+    def test_reuses_cached_tiles(self, api, tile_cache):
+        SwiftVisQuery.batch([(10.0, 20.0)], START, length=2)
+        api["requests"].clear()
+        table = SwiftVisQuery.batch([(10.05, 20.05), (200.0, -30.0)], START + timedelta(days=1), length=2)
+        # Only the tiles not already fetched are requested
+        assert len(api["requests"]) == 3
+        assert len(tile_cache) == 5
+        assert table[table["index"] == 0]["begin"].iloc[0] == START + timedelta(days=1)
+
+    def test_partial_days(self, api, tile_cache):
+        table = SwiftVisQuery.batch([(10.0, 20.0)], START + timedelta(hours=3), length=timedelta(hours=23))
+        assert len(api["requests"]) == 2
+        assert list(zip(table["begin"], table["end"])) == [
+            (START + timedelta(hours=3), START + timedelta(hours=6)),
+            (START + timedelta(hours=12), START + timedelta(days=1, hours=2)),
+        ]
+
+    def test_queries_tile_center(self, api, tile_cache):
+        SwiftVisQuery.batch([(10.0, 20.0)], START, length=1, nside=16)
+        params = api["requests"][0].url.params
+        center = healpix_center(healpix_pixel(10.0, 20.0, 16), 16)
+        assert np.isclose(float(params["ra"]), center[0])
+        assert np.isclose(float(params["dec"]), center[1])
+
+    def test_skycoord(self, api, tile_cache):
+        coords = SkyCoord([10.0, 200.0], [20.0, -30.0], unit="deg")
+        table = SwiftVisQuery.batch(coords, START, length=1)
+        assert sorted(set(table["index"])) == [0, 1]
+
+    def test_failed_tiles(self, api, tile_cache):
+        api["fail_south"] = True
+        table = SwiftVisQuery.batch([(10.0, 20.0), (200.0, -30.0)], START, length=1)
+        assert set(table["index"]) == {0}
+        assert list(table.attrs["errors"]) == [1]
+        # Failed tiles are not cached
+        assert len(tile_cache) == 1
@@ -0,0 +1,55 @@
+# Local fixtures for tests/swift_too/swift/visengine
+from datetime import datetime, timedelta
+
+import httpx
+import numpy as np
+import pytest
+
+from swifttools.swift_too.swift.visengine import Orbit, VisibilityEngine
+
+START = datetime(2024, 1, 1)
+
+# Circular orbit at an altitude of 600 km and an inclination of 20.6 degrees
+RADIUS = 6978.0
+PERIOD = 2 * np.pi * np.sqrt(RADIUS**3 / 398600.4418)
+INCLINATION = np.radians(20.6)
+
+
+def circular_orbit(begin, end, step=30.0):
+    seconds = np.arange(0.0, (end - begin).total_seconds() + step, step)
+    phase = 2 * np.pi * seconds / PERIOD
+    position = RADIUS * np.stack(
+        [np.cos(phase), np.sin(phase) * np.cos(INCLINATION), np.sin(phase) * np.sin(INCLINATION)], axis=-1
+    )
+    times = np.datetime64(begin, "us") + (seconds * 1e6).astype("timedelta64[us]")
+    return Orbit(times, position)
+
+
+@pytest.fixture
+def orbit():
+    return circular_orbit(START, START + timedelta(days=2))
+
+
+@pytest.fixture
+def engine(monkeypatch, orbit):
+    """Enabled visibility engine with a circular orbit, used by
+    `SwiftVisQuery`."""
+    import swifttools.swift_too.swift.visengine as visengine_module
+
+    engine = VisibilityEngine(orbit=orbit, enabled=True)
+    monkeypatch.setattr(visengine_module, "vis_engine", engine)
+    return engine
+
+
+@pytest.fixture
+def api(mock_api):
+    """Mock API recording each request, which returns a single window."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        window = {"begin": "2024-01-01T00:00:00", "end": "2024-01-02T00:00:00"}
+        return httpx.Response(200, json={"windows": [window], "status": {"status": "Accepted"}})
+
+    mock_api(handler)
+    return requests
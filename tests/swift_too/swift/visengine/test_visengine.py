@@ -0,0 +1,243 @@
+import asyncio
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord, get_body
+from astropy.time import Time
+
+from swifttools.swift_too.swift.visengine import (
+    EARTH_LIMB_CONSTRAINT,
+    EARTH_RADIUS,
+    MOON_CONSTRAINT,
+    SUN_CONSTRAINT,
+    Orbit,
+    VisibilityEngine,
+    body_vectors,
+    query_window,
+    time_grid,
+)
+from swifttools.swift_too.swift.visquery import SwiftVisQuery, SwiftVisWindow
+
+from .conftest import INCLINATION, PERIOD, RADIUS, START
+
+
+def separation(body, ra, dec, times):
+    """Separation (degrees) of each target from a body at each time, from
+    astropy."""
+    position = get_body(body, Time(times, scale="utc"))
+    position = SkyCoord(position.ra, position.dec)
+    target = SkyCoord(ra * u.deg, dec * u.deg)
+    return target[:, None].separation(position[None, :]).deg
+
+
+class TestTimeGrid:
+    def test_includes_end(self):
+        times = time_grid(START, START + timedelta(seconds=1500), 600)
+        assert (times - times[0]).astype("timedelta64[s]").astype(int).tolist() == [0, 600, 1200, 1500]
+
+    def test_invalid_step(self):
+        with pytest.raises(ValueError):
+            time_grid(START, START + timedelta(days=1), 0)
+
+
+class TestEphemeris:
+    @pytest.mark.parametrize("body", ["sun", "moon"])
+    def test_matches_astropy(self, body):
+        times = time_grid(START, START + timedelta(days=3), 1234)
+        position = get_body(body, Time(times, scale="utc")).cartesian.xyz.value.T
+        position /= np.linalg.norm(position, axis=1, keepdims=True)
+        angle = np.degrees(np.arccos(np.clip(np.sum(position * body_vectors(body, times), axis=1), -1, 1)))
+        assert angle.max() < 1e-3
+
+
+class TestVisible:
+    def test_sun_and_moon_match_astropy(self):
+        rng = np.random.default_rng(2)
+        ra = rng.uniform(0, 360, 300)
+        dec = np.degrees(np.arcsin(rng.uniform(-1, 1, 300)))
+        times = time_grid(START, START + timedelta(days=20), 6 * 3600)
+        visible = VisibilityEngine().visible(ra, dec, times)
+
+        sun = separation("sun", ra, dec, times)
+        moon = separation("moon", ra, dec, times)
+        expected = (sun > SUN_CONSTRAINT) & (moon > MOON_CONSTRAINT)
+        # Ignore targets within interpolation error of a constraint
+        clear = (np.abs(sun - SUN_CONSTRAINT) > 0.01) & (np.abs(moon - MOON_CONSTRAINT) > 0.01)
+        assert np.array_equal(visible[clear], expected[clear])
+        assert not expected.all() and expected.any()
+
+    def test_earth_constraint(self, orbit):
+        engine = VisibilityEngine(orbit=orbit, sun=0, moon=0)
+        times = orbit.times[::7]
+        position, _ = orbit.at(times)
+        ra = np.degrees(np.arctan2(position[:, 1], position[:, 0]))
+        dec = np.degrees(np.arcsin(position[:, 2] / np.linalg.norm(position, axis=1)))
+        visible = engine.visible(np.concatenate([ra, ra + 180]), np.concatenate([dec, -dec]), times, hires=True)
+        # Targets at the zenith are visible, and at the nadir are not
+        assert np.diagonal(visible[: len(times)]).all()
+        assert not np.diagonal(visible[len(times) :]).any()
+
+    def test_earth_constraint_angle(self, orbit):
+        engine = VisibilityEngine(orbit=orbit, sun=0, moon=0)
+        time = orbit.times[100]
+        position, _ = orbit.at(time)
+        zenith = position / np.linalg.norm(position)
+        # Angle of the constraint from the zenith
+        limit = 180 - np.degrees(np.arcsin(EARTH_RADIUS / np.linalg.norm(position))) - EARTH_LIMB_CONSTRAINT
+        inside, outside = [], []
+        for angle, results in ((limit - 0.1, outside), (limit + 0.1, inside)):
+            # Rotate the zenith by `angle` about an axis perpendicular to it
+            axis = np.cross(zenith, [0, 0, 1])
+            axis /= np.linalg.norm(axis)
+            a = np.radians(angle)
+            v = zenith * np.cos(a) + np.cross(axis, zenith) * np.sin(a)
+            results.append(
+                engine.visible(np.degrees(np.arctan2(v[1], v[0])), np.degrees(np.arcsin(v[2])), [time], hires=True)
+            )
+        assert outside[0].all()
+        assert not inside[0].any()
+
+    def test_pole_constraint(self, orbit):
+        # The orbit pole is constrained by the Earth for the whole orbit
+        pole_dec = 90 - np.degrees(INCLINATION)
+        engine = VisibilityEngine(orbit=orbit, sun=0, moon=0)
+        times = orbit.times[::20]
+        assert not engine.visible(270.0, pole_dec, times).any()
+        assert engine.visible(90.0, 0.0, times).all()
+        # At high resolution, the pole is constrained at every time too
+        assert not engine.visible(270.0, pole_dec, times, hires=True).any()
+
+    def test_hires_requires_orbit(self):
+        with pytest.raises(ValueError):
+            VisibilityEngine().visible(0.0, 0.0, [np.datetime64(START)], hires=True)
+
+    def test_chunks(self, monkeypatch):
+        import swifttools.swift_too.swift.visengine as visengine_module
+
+        rng = np.random.default_rng(3)
+        ra, dec = rng.uniform(0, 360, 50), rng.uniform(-90, 90, 50)
+        times = time_grid(START, START + timedelta(days=5), 3600)
+        expected = VisibilityEngine().visible(ra, dec, times)
+        monkeypatch.setattr(visengine_module, "DEFAULT_TARGET_CHUNK", 7)
+        assert np.array_equal(VisibilityEngine().visible(ra, dec, times), expected)
+
+
+class TestWindows:
+    def test_intervals_match_mask(self):
+        engine = VisibilityEngine()
+        rng = np.random.default_rng(4)
+        ra, dec = rng.uniform(0, 360, 40), rng.uniform(-90, 90, 40)
+        end = START + timedelta(days=40)
+        target, first, last = engine.intervals(ra, dec, START, end)
+        times = time_grid(START, end, engine.step)
+        visible = engine.visible(ra, dec, times)
+
+        rebuilt = np.zeros_like(visible)
+        for i, b, e in zip(target, first, last):
+            rebuilt[i, (times >= b) & (times <= e)] = True
+        assert np.array_equal(rebuilt, visible)
+        assert np.all(np.diff(target) >= 0)
+
+    def test_windows(self):
+        engine = VisibilityEngine()
+        end = START + timedelta(days=60)
+        windows = engine.windows([83.63, 0.0], [22.01, -89.0], START, end)
+        assert len(windows) == 2
+        assert all(isinstance(window, SwiftVisWindow) for window in windows[0])
+        # The south celestial pole is never near the Sun or Moon
+        assert [(window.begin, window.end) for window in windows[1]] == [(START, end)]
+        # The Crab is close to the Sun in June, and the Moon monthly
+        assert len(windows[0]) == 3
+        assert windows[0][0].begin == START
+
+    def test_constrained_all_the_time(self):
+        engine = VisibilityEngine(sun=180)
+        assert engine.windows(0.0, 0.0, START, START + timedelta(days=1)) == [[]]
+
+
+class TestOrbit:
+    def test_from_file(self, tmp_path, orbit):
+        path = tmp_path / "orbit.txt"
+        lines = ["# time x y z"]
+        for time, (x, y, z) in zip(orbit.times[:100], orbit.position[:100]):
+            lines.append(f"{time}Z, {x}, {y}, {z}")
+        path.write_text("\n".join(lines) + "\n")
+        loaded = Orbit.from_file(path)
+        assert np.array_equal(loaded.times, orbit.times[:100])
+        assert np.allclose(loaded.position, orbit.position[:100])
+        # Velocity is calculated from the positions
+        speed = np.linalg.norm(loaded.velocity, axis=1)
+        assert np.allclose(speed, 2 * np.pi * RADIUS / PERIOD, rtol=1e-3)
+
+    def test_from_file_with_velocity(self, tmp_path, orbit):
+        path = tmp_path / "orbit.txt"
+        path.write_text(f"{orbit.times[0]} 1 2 3 4 5 6\n{orbit.times[1]} 2 3 4 5 6 7\n")
+        assert Orbit.from_file(path).velocity.tolist() == [[4, 5, 6], [5, 6, 7]]
+
+    def test_covers(self, orbit):
+        assert orbit.covers(START, START + timedelta(days=1))
+        assert not orbit.covers(START - timedelta(hours=1), START + timedelta(days=1))
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Orbit([np.datetime64(START)], [[1.0, 2.0, 3.0]])
+
+    def test_from_tle(self):
+        pytest.importorskip("sgp4")
+        tle = (
+            "SWIFT\n"
+            "1 28485U 04047A   24001.50000000  .00002000  00000-0  10000-3 0  9990\n"
+            "2 28485  20.5570 100.0000 0008000 100.0000 260.0000 15.24000000 10000\n"
+        )
+        orbit = Orbit.from_tle(tle, START, START + timedelta(hours=2))
+        assert 6800 < np.linalg.norm(orbit.position, axis=1).min() < 7000
+
+
+class TestVisQuery:
+    def test_answered_locally(self, engine, api):
+        query = SwiftVisQuery(ra=83.63, dec=22.01, begin=START, length=1)
+        assert query.status.status == "Accepted"
+        assert api == []
+        assert len(query) == 1
+        assert query[0].begin == START
+
+    def test_hires(self, engine, api):
+        query = SwiftVisQuery(ra=83.63, dec=22.01, begin=START, length=1, hires=True)
+        assert api == []
+        # Windows are interrupted by the Earth every orbit
+        assert len(query) > 10
+        assert all(window.length < timedelta(seconds=PERIOD) for window in query)
+
+    def test_hires_outside_orbit(self, engine, api):
+        SwiftVisQuery(ra=83.63, dec=22.01, begin=START + timedelta(days=5), length=1, hires=True)
+        assert len(api) == 1
+
+    def test_disabled(self, engine, api):
+        engine.disable()
+        SwiftVisQuery(ra=83.63, dec=22.01, begin=START, length=1)
+        assert len(api) == 1
+
+    def test_refresh(self, engine, api):
+        query = SwiftVisQuery(ra=83.63, dec=22.01, begin=START, length=1, autosubmit=False)
+        query.submit_get(refresh=True)
+        assert len(api) == 1
+
+    def test_async(self, engine, api):
+        query = SwiftVisQuery(ra=83.63, dec=22.01, begin=START, length=1, autosubmit=False)
+        assert asyncio.run(query.get())
+        assert api == []
+        assert len(query) == 1
+
+
+class TestQueryWindow:
+    def test_length(self):
+        assert query_window(START, None, 3) == (START, START + timedelta(days=3))
+
+    def test_end(self):
+        assert query_window(START, START + timedelta(days=1), None) == (START, START + timedelta(days=1))
+
+    def test_default(self):
+        begin, end = query_window(START, None, None)
+        assert end - begin == timedelta(days=7)
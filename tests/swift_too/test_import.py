@@ -0,0 +1,60 @@
+import subprocess
+import sys
+
+import pytest
+
+import swifttools.swift_too as swift_too
+
+
+def imported_modules(statement):
+    """Modules imported by running `statement` in a fresh interpreter."""
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImport:
+    def test_import_does_not_import_submodules(self):
+        modules = imported_modules("import swifttools.swift_too")
+        assert "swifttools.swift_too.swift.clock" not in modules
+        assert "astropy" not in modules
+        assert "boto3" not in modules
+
+    def test_clock_does_not_import_astropy_or_boto3(self):
+        modules = imported_modules("from swifttools.swift_too import Clock")
+        assert "astropy" not in modules
+        assert "boto3" not in modules
+
+    def test_data_does_not_import_boto3_until_download(self):
+        modules = imported_modules("from swifttools.swift_too import Data")
+        assert "boto3" not in modules
+        assert "tqdm" not in modules
+
+    def test_lazy_attribute_is_class(self):
+        from swifttools.swift_too.swift.clock import SwiftClock
+
+        assert swift_too.Clock is SwiftClock
+        assert swift_too.SwiftClock is SwiftClock
+
+    def test_legacy_alias(self):
+        from swifttools.swift_too.swift.uvot import SwiftUVOTMode
+
+        assert swift_too.UVOT_Mode is SwiftUVOTMode
+
+    def test_all_names_resolve(self):
+        for name in swift_too.__all__:
+            assert getattr(swift_too, name) is not None
+
+    def test_dir_includes_lazy_names(self):
+        assert "VisQuery" in dir(swift_too)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            swift_too.NotAClass
+
+    def test_astropy_schemas_from_schemas_module(self):
+        from swifttools.swift_too.base import astropy_schemas, schemas
+
+        assert schemas.CoordinateSchema is astropy_schemas.CoordinateSchema
+        with pytest.raises(AttributeError):
+            schemas.NotASchema